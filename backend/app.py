@@ -11,26 +11,31 @@ except ImportError:
     pass
 
 import asyncio
+import base64
 import contextlib
+import contextvars
 import datetime as _dt
+import functools
 import io
 import os
 import shutil
+import struct
 import subprocess
 import tempfile
-import wave
 import warnings
 import xml.etree.ElementTree as ET
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from time import perf_counter
 import re
-from typing import Any
+from typing import Any, Awaitable, Callable
 from uuid import UUID, uuid4
 
-from fastapi import FastAPI, File, HTTPException, Query, UploadFile, WebSocket, WebSocketDisconnect
+import orjson
+from fastapi import FastAPI, File, HTTPException, Query, Request, UploadFile, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, Response, StreamingResponse
+from fastapi.responses import FileResponse, ORJSONResponse, Response, StreamingResponse
 from pydantic import BaseModel, Field
 
 from core.event_bus import BUS, clip as _event_clip
@@ -45,6 +50,7 @@ from core.runtime import RuntimeManager
 from core.tooling import build_tool_router
 from memory.unifier import MemoryUnifier
 from core.brain import Brain
+from plugins import _http as plugins_http
 from plugins.registry import PluginConfigError
 
 try:
@@ -141,21 +147,52 @@ def _repo_root_from_this_file() -> Path:
     return Path(__file__).resolve().parents[1]
 
 
+# Quant preference among variants of the same model, best first. Q4_K_M runs
+# roughly twice as fast as Q8_0 for a small quality loss, which is the right
+# trade for a chat turn. NOVA_QUANT_PREF overrides the order.
+_DEFAULT_QUANT_PREF = "Q4_K_M,Q5_K_M,Q4_K_S,Q4_0,Q6_K,Q8_0,BF16,F16"
+_QUANT_SUFFIX_RE = re.compile(r"[-_.]((?:i?q\d[a-z0-9_]*)|bf16|fp16|f16|fp32|f32)$", re.IGNORECASE)
+
+
+def _model_quant(name: str) -> str:
+    m = _QUANT_SUFFIX_RE.search(Path(name).stem)
+    return m.group(1).upper() if m else ""
+
+
 def _pick_model_path(model_dir: Path) -> Path | None:
-    # Any *.gguf in model_dir, case-insensitive. Pick most recently modified.
+    # Any *.gguf in model_dir, case-insensitive. The most recently modified
+    # file decides WHICH model; when several quants of that model sit side by
+    # side, NOVA_QUANT_PREF decides which one loads (newest breaks ties).
     if not model_dir.exists():
         return None
-    candidates: list[Path] = []
+    candidates: list[tuple[float, Path]] = []
     for p in model_dir.iterdir():
         if p.is_file() and p.suffix.lower() == ".gguf":
             # Skip multimodal projector files (mmproj-*.gguf)
             if "mmproj" in p.name.lower():
                 continue
-            candidates.append(p)
+            candidates.append((p.stat().st_mtime, p))
     if not candidates:
         return None
-    candidates.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-    return candidates[0]
+    # Single passes throughout: only the newest file and the best-ranked
+    # variant are needed, so there is nothing to gain from sorting the lot.
+    family = _normalize_model_name(max(candidates, key=lambda c: c[0])[1].name)
+    variants = [c for c in candidates if _normalize_model_name(c[1].name) == family]
+    if len(variants) == 1:
+        return variants[0][1]
+
+    prefs = [q.strip().upper() for q in (os.getenv("NOVA_QUANT_PREF", "") or _DEFAULT_QUANT_PREF).split(",") if q.strip()]
+    rank = {q: i for i, q in enumerate(prefs)}
+    # Equal ranks fall back to the newest file.
+    picked = min(variants, key=lambda c: (rank.get(_model_quant(c[1].name), len(prefs)), -c[0]))[1]
+    logger.info(
+        "model_quant_selected",
+        model=picked.name,
+        quant=_model_quant(picked.name) or "unknown",
+        size_gb=round(picked.stat().st_size / 1024**3, 2),
+        variants=len(variants),
+    )
+    return picked
 
 
 def _normalize_model_name(name: str) -> str:
@@ -303,7 +340,9 @@ class ChatStreamRequest(BaseModel):
     voice: str = "nova.wav"
 
 
-app = FastAPI(title="Nova Backend", version="0.1.0")
+# orjson for every JSON response: the memory/graph/status endpoints return
+# lists of model dumps, and the stdlib encoder was the slowest step in them.
+app = FastAPI(title="Nova Backend", version="0.1.0", default_response_class=ORJSONResponse)
 
 
 @app.middleware("http")
@@ -327,7 +366,7 @@ async def _bind_request_id(request, call_next):  # noqa: ANN001
 # headers, e.g. the WebSocket). Unset = current localhost-only behavior, with
 # a boot warning so the gap is never silent. /health stays open so process
 # supervisors can probe liveness without credentials.
-_AUTH_EXEMPT_PATHS = {"/health"}
+_AUTH_EXEMPT_PATHS = frozenset({"/health"})
 
 
 def _api_token() -> str:
@@ -356,13 +395,15 @@ async def _require_api_token(request, call_next):  # noqa: ANN001
     return await call_next(request)
 
 
-def _parse_allowed_origins() -> list[str]:
+def _parse_allowed_origins() -> frozenset[str]:
+    # A set, not a list: CORSMiddleware tests `origin in allow_origins` on
+    # every request, and operators paste long comma-separated allowlists.
     raw = os.getenv("NOVA_ALLOWED_ORIGINS", "").strip()
     if not raw:
         # Local dev (Vite) + Electron (file:// uses Origin: null)
-        return ["http://localhost:5173", "http://127.0.0.1:5173", "null"]
-    parts = [p.strip() for p in raw.split(",") if p.strip()]
-    return parts or ["null"]
+        return frozenset({"http://localhost:5173", "http://127.0.0.1:5173", "null"})
+    parts = {p.strip() for p in raw.split(",") if p.strip()}
+    return frozenset(parts or {"null"})
 
 
 app.add_middleware(
@@ -371,6 +412,9 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Browsers cap preflight caching at 2h (Chromium); the 10-minute default
+    # re-ran an OPTIONS round-trip before JSON POSTs every ten minutes.
+    max_age=7200,
 )
 
 # ── Routers (Phase 0.6): domain endpoints live in backend/routers/ ───────────
@@ -385,7 +429,8 @@ app.include_router(_r_memory.router)
 app.include_router(_r_web_maps.router)
 
 
-from backend.state import STATE, _TTS_CACHE_MAX  # Phase 0.6: shared state lives in backend/state.py
+from backend.state import STATE  # Phase 0.6: shared state lives in backend/state.py
+from backend.tts_cache import TTSCache, clip_key, is_clip_key  # noqa: E402
 
 
 def _xtts_gpu_required_message() -> str:
@@ -539,6 +584,15 @@ def _list_voice_files(voice_dir: Path) -> list[Path]:
     return sorted(files, key=lambda p: (preferred_order.get(p.suffix.lower(), 99), p.name.lower()))
 
 
+# (voice_dir, requested name, NOVA_DEFAULT_VOICE) -> (voice_dir mtime_ns, path).
+# Resolution runs on every /tts call and every spoken reply, and the uncached
+# walk is resolve() (a stat per path component — slow on Windows) plus exists,
+# is_file and possibly a directory listing. Adding, removing or renaming a
+# voice bumps the directory mtime, so one stat is enough to know a hit is good.
+_VOICE_PATH_CACHE: dict[tuple[str, str, str], tuple[int, Path]] = {}
+_VOICE_PATH_CACHE_MAX = 256
+
+
 def _resolve_voice_path(cfg: "RuntimeConfig", requested: str | None) -> Path:
     """Resolve a speaker reference audio file under cfg.voice_dir.
 
@@ -550,12 +604,31 @@ def _resolve_voice_path(cfg: "RuntimeConfig", requested: str | None) -> Path:
 
     requested_name = (requested or "").strip()
     requested_name = Path(requested_name).name if requested_name else ""
+    env_default = os.getenv("NOVA_DEFAULT_VOICE", "").strip()
+
+    try:
+        dir_mtime = voice_dir.stat().st_mtime_ns
+    except OSError:
+        dir_mtime = -1
+    key = (str(voice_dir), requested_name, env_default)
+    hit = _VOICE_PATH_CACHE.get(key)
+    if hit is not None and hit[0] == dir_mtime:
+        return hit[1]
+
+    path = _resolve_voice_path_uncached(voice_dir, requested_name, env_default)
+    if len(_VOICE_PATH_CACHE) >= _VOICE_PATH_CACHE_MAX:
+        _VOICE_PATH_CACHE.clear()
+    _VOICE_PATH_CACHE[key] = (dir_mtime, path)
+    return path
+
 
+def _resolve_voice_path_uncached(voice_dir: Path, requested_name: str, env_default: str) -> Path:
     if requested_name:
         candidate = (voice_dir / requested_name)
         try:
             resolved = candidate.resolve()
-            if voice_dir.resolve() not in resolved.parents and resolved != voice_dir.resolve():
+            root = voice_dir.resolve()
+            if root not in resolved.parents and resolved != root:
                 raise HTTPException(status_code=400, detail="Invalid voice path")
         except FileNotFoundError:
             resolved = candidate
@@ -563,7 +636,6 @@ def _resolve_voice_path(cfg: "RuntimeConfig", requested: str | None) -> Path:
         if resolved.exists() and resolved.is_file():
             return resolved
 
-    env_default = os.getenv("NOVA_DEFAULT_VOICE", "").strip()
     if env_default:
         env_name = Path(env_default).name
         env_path = (voice_dir / env_name)
@@ -593,21 +665,33 @@ def _silent_warn_call(fn, *args, **kwargs):
         with contextlib.redirect_stdout(sink), contextlib.redirect_stderr(sink):
             return fn(*args, **kwargs)
 
-def _wav_bytes_from_f32(samples, sample_rate: int) -> bytes:
+def _pcm16_from_f32(samples) -> bytes:
     # samples expected float32 in [-1, 1]
     import numpy as np
 
-    arr = np.asarray(samples, dtype=np.float32)
-    arr = np.clip(arr, -1.0, 1.0)
-    pcm = (arr * 32767.0).astype(np.int16)
+    # One scratch float buffer, clipped and scaled in place, then a single cast
+    # to little-endian int16. The old chain (clip -> multiply -> astype)
+    # allocated two full-length float temporaries per clip; this is the only
+    # CPU pass between synthesis and the wire.
+    arr = np.array(samples, dtype=np.float32, copy=True).reshape(-1)
+    np.clip(arr, -1.0, 1.0, out=arr)
+    np.multiply(arr, 32767.0, out=arr)
+    return arr.astype("<i2", copy=False).tobytes()
+
 
-    buf = io.BytesIO()
-    with wave.open(buf, "wb") as wf:
-        wf.setnchannels(1)
-        wf.setsampwidth(2)
-        wf.setframerate(int(sample_rate))
-        wf.writeframes(pcm.tobytes())
-    return buf.getvalue()
+def _wav_bytes_from_f32(samples, sample_rate: int) -> bytes:
+    # Mono PCM16 has a fixed 44-byte header, so write it directly and join it
+    # to the samples: one copy of the audio instead of wave's BytesIO write
+    # plus getvalue(). Byte-identical to what wave.open(...).writeframes made.
+    pcm = _pcm16_from_f32(samples)
+    sr = int(sample_rate)
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + len(pcm), b"WAVE",
+        b"fmt ", 16, 1, 1, sr, sr * 2, 2, 16,
+        b"data", len(pcm),
+    )
+    return b"".join((header, pcm))
 
 
 def _ensure_xtts_downloadable() -> None:
@@ -664,6 +748,16 @@ def _ensure_xtts_downloadable() -> None:
         ) from e
 
 
+_XTTS_MODEL_ID = "tts_models/multilingual/multi-dataset/xtts_v2"
+# What XTTS v2 outputs; the loaded synthesizer's own figure wins once it exists.
+_XTTS_SAMPLE_RATE = 24000
+
+
+def _tts_output_rate() -> int:
+    synth = getattr(STATE.tts, "synthesizer", None)
+    return int(getattr(synth, "output_sample_rate", _XTTS_SAMPLE_RATE))
+
+
 def _load_tts_model():
     # PyTorch 2.6+ defaults to safer "weights_only" loading, which can
     # break Coqui checkpoints unless required classes are allowlisted.
@@ -684,7 +778,7 @@ def _load_tts_model():
     _patch_torchaudio_load_for_soundfile()
     from TTS.api import TTS  # type: ignore
 
-    model_id = "tts_models/multilingual/multi-dataset/xtts_v2"
+    model_id = _XTTS_MODEL_ID
     _ensure_xtts_downloadable()
     allowlisted: set[str] = set()
 
@@ -831,7 +925,7 @@ async def _speaker_wav_for_voice(voice_path: Path) -> str:
             return str(out_path)
 
         started = perf_counter()
-        converted = await asyncio.to_thread(_run_convert)
+        converted = await _in_pool("io", _run_convert)
         logger.info(
             "tts_voice_prepared",
             voice=voice_path.name,
@@ -883,14 +977,6 @@ def _normalize_tts_text(text: str) -> str:
     return " ".join((text or "").split()).strip()
 
 
-def _should_cache_tts_phrase(text: str, reason: str) -> bool:
-    if reason not in {"reply", "system", "prewarm"}:
-        return False
-    if not text or len(text) > 160:
-        return False
-    return text.count("\n") <= 1
-
-
 # WS-H: subtle mood-aware pacing. XTTS 0.22.0 has no working emotion/style
 # parameter (Coqui-Studio-only, discontinued), but `speed` is real synthesis-
 # level control — so the achievable slice of "prosody follows mood" is a small
@@ -925,22 +1011,182 @@ async def _mood_speed_multiplier() -> float:
         return 1.0
 
 
-async def _tts_bytes(text: str, voice_path: Path, reason: str = "reply") -> bytes:
+# Dedicated, bounded worker pools per heavy workload. Everything used to go
+# through asyncio.to_thread, i.e. the loop's one shared default executor: a
+# burst of sentence synthesis (seconds of CPU each) could take every thread,
+# and an upload write or /tts cache read queued behind it. Separate pools keep
+# one workload from starving the others, and the TTS bound also caps how many
+# XTTS runs compete for cores (or VRAM) at once.
+_POOL_ENV: dict[str, tuple[str, int]] = {
+    "tts": ("NOVA_TTS_WORKERS", 2),
+    "stt": ("NOVA_STT_WORKERS", 1),
+    "io": ("NOVA_IO_WORKERS", 4),
+}
+
+
+def _pool(kind: str) -> ThreadPoolExecutor:
+    attr = f"{kind}_pool"
+    pool = getattr(STATE, attr)
+    if pool is None:
+        env, default = _POOL_ENV[kind]
+        try:
+            workers = max(1, int(os.getenv(env, str(default)).strip() or default))
+        except ValueError:
+            workers = default
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"nova-{kind}")
+        setattr(STATE, attr, pool)
+    return pool
+
+
+async def _in_pool(kind: str, fn: Callable[..., Any], *args: Any) -> Any:
+    """`asyncio.to_thread`, but on the named pool (contextvars carried over the same way)."""
+    ctx = contextvars.copy_context()
+    return await asyncio.get_running_loop().run_in_executor(_pool(kind), functools.partial(ctx.run, fn, *args))
+
+
+def _shutdown_pools() -> None:
+    for kind in _POOL_ENV:
+        pool = getattr(STATE, f"{kind}_pool")
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+            setattr(STATE, f"{kind}_pool", None)
+
+
+def _tts_cache() -> TTSCache:
+    if STATE.tts_cache is None:
+        voice_dir = STATE.config.voice_dir if STATE.config is not None else _repo_root_from_this_file() / "voices"
+        STATE.tts_cache = TTSCache.from_env(voice_dir)
+    return STATE.tts_cache
+
+
+def _tts_stream_chunks_enabled() -> bool:
+    return os.getenv("NOVA_TTS_STREAM_CHUNKS", "0").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _xtts_stream_model() -> Any:
+    """The underlying XTTS model if it can stream (`inference_stream`), else None."""
+    model = getattr(getattr(STATE.tts, "synthesizer", None), "tts_model", None)
+    return model if callable(getattr(model, "inference_stream", None)) else None
+
+
+def _xtts_model() -> Any:
+    """The underlying XTTS model if it takes precomputed speaker latents, else None."""
+    model = getattr(getattr(STATE.tts, "synthesizer", None), "tts_model", None)
+    if callable(getattr(model, "get_conditioning_latents", None)) and callable(getattr(model, "inference", None)):
+        return model
+    return None
+
+
+def _xtts_latents(model: Any, speaker_wav: str) -> tuple[Any, Any]:
+    """(gpt_cond_latent, speaker_embedding) for a reference wav, computed once.
+
+    `TTS.tts(speaker_wav=...)` re-encodes the reference clip on every call —
+    a full conditioning-encoder pass per sentence for a voice that never
+    changes. The latents depend only on the file and the model, so they're
+    kept per (model, path, mtime): editing the wav or reloading XTTS misses.
+    Blocking — call from the tts pool.
+    """
+    try:
+        mtime = os.stat(speaker_wav).st_mtime_ns
+    except OSError:
+        mtime = 0
+    key = (id(model), speaker_wav, mtime)
+    hit = STATE.xtts_latents.get(key)
+    if hit is not None:
+        return hit
+    cfg = getattr(model, "config", None)
+    # Same reference-conditioning settings the high-level API reads from the
+    # model config, so cached latents sound identical to the old path.
+    kwargs = {
+        k: getattr(cfg, c)
+        for k, c in (("gpt_cond_len", "gpt_cond_len"), ("gpt_cond_chunk_len", "gpt_cond_chunk_len"),
+                     ("max_ref_length", "max_ref_len"), ("sound_norm_refs", "sound_norm_refs"))
+        if hasattr(cfg, c)
+    }
+    latents = _silent_call(model.get_conditioning_latents, audio_path=[speaker_wav], **kwargs)
+    # Keep the cached copies resident where inference runs, so a repeat call
+    # never pays a host->device copy. Coqui normally returns them on the
+    # model's device already; this only moves them if it didn't.
+    device = getattr(model, "device", None)
+    if device is not None:
+        latents = tuple(
+            t.to(device, non_blocking=True) if getattr(t, "device", device) != device else t for t in latents
+        )
+    STATE.xtts_latents = {k: v for k, v in STATE.xtts_latents.items() if k[:2] != key[:2]}
+    STATE.xtts_latents[key] = latents
+    return latents
+
+
+def _xtts_sampling_kwargs(model: Any) -> dict[str, Any]:
+    cfg = getattr(model, "config", None)
+    return {
+        k: getattr(cfg, k)
+        for k in ("temperature", "length_penalty", "repetition_penalty", "top_k", "top_p")
+        if hasattr(cfg, k)
+    }
+
+
+async def _synthesize_streamed(
+    text: str,
+    speaker_wav: str,
+    speed: float,
+    on_chunk: Callable[[int, bytes, int], Awaitable[None]],
+) -> bytes:
+    """Run XTTS's chunked decoder, handing each chunk to `on_chunk` as raw
+    PCM16 the moment it exists. Returns the whole clip as WAV for the cache.
+
+    The generator is advanced one `next()` per worker-thread hop, so the loop
+    stays free between chunks and the first chunk reaches the client after
+    ~one decoder step instead of after the full sentence.
+    """
+    import numpy as np
+
+    model = _xtts_stream_model()
+    sr = _tts_output_rate()
+
+    def _start():
+        gpt_cond, speaker_emb = _xtts_latents(model, speaker_wav)
+        return iter(model.inference_stream(
+            text, "en", gpt_cond, speaker_emb, stream_chunk_size=20, speed=speed,
+            **_xtts_sampling_kwargs(model),
+        ))
+
+    it = await _in_pool("tts", _silent_call, _start)
+    done = object()
+    parts: list[Any] = []
+    seq = 0
+    while True:
+        chunk = await _in_pool("tts", next, it, done)
+        if chunk is done:
+            break
+        if hasattr(chunk, "detach"):
+            chunk = chunk.detach().float().cpu().numpy()
+        samples = np.asarray(chunk, dtype=np.float32).reshape(-1)
+        parts.append(samples)
+        await on_chunk(seq, _pcm16_from_f32(samples), sr)
+        seq += 1
+    return _wav_bytes_from_f32(np.concatenate(parts) if parts else np.zeros(0, dtype=np.float32), sr)
+
+
+async def _tts_clip(
+    text: str,
+    voice_path: Path,
+    reason: str = "reply",
+    on_chunk: Callable[[int, bytes, int], Awaitable[None]] | None = None,
+) -> tuple[str, bytes]:
+    """Synthesize (or reuse) one clip. Returns (audio_id, wav_bytes).
+
+    The id is the content key, so the same sentence in the same voice at the
+    same pace is synthesized once and served from one stable /tts/{id} URL.
+    With `on_chunk`, a cache miss on a streaming-capable XTTS also emits the
+    clip incrementally as (seq, pcm16_bytes, sample_rate) while it decodes.
+    """
     text = _normalize_tts_text(text)
     if not text:
         raise RuntimeError("tts_text_empty")
 
     mood_mult = await _mood_speed_multiplier() if reason == "reply" else 1.0
 
-    cache_key = f"{voice_path.name}::{reason}::{mood_mult}::{text}"
-    if _should_cache_tts_phrase(text, reason):
-        cached = STATE.tts_phrase_cache.get(cache_key)
-        if cached is not None:
-            return cached
-
-    await _ensure_tts_loaded(reason)
-    speaker_wav = await _speaker_wav_for_voice(voice_path)
-
     try:
         tts_speed = float(os.getenv("NOVA_TTS_SPEED", "1.0") or "1.0")
     except ValueError:
@@ -948,10 +1194,43 @@ async def _tts_bytes(text: str, voice_path: Path, reason: str = "reply") -> byte
     # Layer the mood hint on the configured base, clamped to a natural range.
     tts_speed = max(0.8, min(1.25, tts_speed * mood_mult))
 
+    cache = _tts_cache()
+    # The voice part is the sample's path + mtime + size, so replacing
+    # voices/<name>.wav mints new ids instead of serving the old recording
+    # from an `immutable` URL.
+    audio_id = clip_key(
+        text, _voice_cache_key(voice_path), tts_speed,
+        model=_XTTS_MODEL_ID, sample_rate=_tts_output_rate(),
+    )
+    cached = cache.lookup(audio_id) or await _in_pool("io", cache.load, audio_id)
+    if cached is not None:
+        return audio_id, cached
+
+    await _ensure_tts_loaded(reason)
+    speaker_wav = await _speaker_wav_for_voice(voice_path)
+
+    if on_chunk is not None and _xtts_stream_model() is not None:
+        audio = await _synthesize_streamed(text, speaker_wav, tts_speed, on_chunk)
+        await _in_pool("io", cache.store, audio_id, audio)
+        return audio_id, audio
+
     def _run() -> bytes:
-        wav = _silent_call(STATE.tts.tts, text=text, speaker_wav=speaker_wav, language="en", speed=tts_speed)
-        sr = int(getattr(STATE.tts.synthesizer, "output_sample_rate", 24000))
-        return _wav_bytes_from_f32(wav, sr)
+        model = _xtts_model()
+        if model is not None:
+            gpt_cond, speaker_emb = _xtts_latents(model, speaker_wav)
+            out = _silent_call(
+                model.inference, text, "en", gpt_cond, speaker_emb,
+                speed=tts_speed, enable_text_splitting=True, **_xtts_sampling_kwargs(model),
+            )
+            wav = out["wav"]
+            if hasattr(wav, "detach"):
+                wav = wav.detach().float().cpu().numpy()
+        else:
+            wav = _silent_call(STATE.tts.tts, text=text, speaker_wav=speaker_wav, language="en", speed=tts_speed)
+        sr = _tts_output_rate()
+        audio = _wav_bytes_from_f32(wav, sr)
+        cache.store(audio_id, audio)
+        return audio
 
     started = perf_counter()
     # NOTE: acquiring core.gpu.GPU_SEM here DEADLOCKS. The reply stream holds
@@ -965,17 +1244,68 @@ async def _tts_bytes(text: str, voice_path: Path, reason: str = "reply") -> byte
     # pattern tools/imagegen/ already uses for exactly this reason. Until then
     # XTTS runs on CPU by default (see NOVA_TTS_DEVICE) — slower, but it does
     # not abort llama.cpp. See core/gpu.py for the full evidence.
-    audio = await asyncio.to_thread(_run)
-    if _should_cache_tts_phrase(text, reason):
-        STATE.tts_phrase_cache[cache_key] = audio
+    audio = await _in_pool("tts", _run)
+    return audio_id, audio
+
+
+async def _tts_bytes(text: str, voice_path: Path, reason: str = "reply") -> bytes:
+    _audio_id, audio = await _tts_clip(text, voice_path=voice_path, reason=reason)
     return audio
 
 
-def _chunk_text(s: str, chunk_size: int = 18) -> list[str]:
-    s = s or ""
-    if chunk_size <= 1:
-        return list(s)
-    return [s[i : i + chunk_size] for i in range(0, len(s), chunk_size)]
+_STT_RATE = 16000
+
+
+def _decode_audio_pyav(data: bytes) -> Any:
+    """Decode an uploaded clip to 16 kHz mono float32, in-process.
+
+    PyAV is already installed as a faster-whisper dependency and links the
+    same libav* libraries the ffmpeg CLI does, so this decodes everything the
+    subprocess path did without a fork/exec, a temp dir and two disk writes
+    per utterance. Blocking — call from a worker thread.
+    """
+    import av  # type: ignore
+    import numpy as np
+
+    parts: list[Any] = []
+    with av.open(io.BytesIO(data), mode="r") as container:
+        stream = container.streams.audio[0]
+        resampler = av.AudioResampler(format="flt", layout="mono", rate=_STT_RATE)
+        for frame in container.decode(stream):
+            for out in resampler.resample(frame):
+                parts.append(out.to_ndarray().reshape(-1))
+        # Drain samples the resampler is still holding.
+        for out in resampler.resample(None):
+            parts.append(out.to_ndarray().reshape(-1))
+    if not parts:
+        return np.zeros(0, dtype=np.float32)
+    return np.concatenate(parts).astype(np.float32, copy=False)
+
+
+def _decode_audio_ffmpeg(data: bytes, suffix: str) -> tuple[Any, int]:
+    """Fallback decode through the ffmpeg CLI, for installs without PyAV.
+
+    Goes through real files rather than pipes on purpose: MP4/M4A captures
+    (Safari's MediaRecorder) put the index at the end and can't be read from
+    a non-seekable stdin. Blocking — call from a worker thread.
+    """
+    import numpy as np
+    import soundfile as sf  # type: ignore
+
+    ffmpeg = _ffmpeg_executable()
+    with tempfile.TemporaryDirectory(prefix="nova-stt-") as td:
+        in_path = Path(td) / f"in{suffix}"
+        out_path = Path(td) / "out.wav"
+        in_path.write_bytes(data)
+        cmd = [ffmpeg, "-y", "-i", str(in_path), "-ac", "1", "-ar", str(_STT_RATE), "-f", "wav", str(out_path)]
+        try:
+            subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=60)
+        except Exception as e:  # noqa: BLE001
+            raise RuntimeError(f"ffmpeg_decode_failed: {e}") from e
+        audio, sr = sf.read(str(out_path), dtype="float32")
+    if getattr(audio, "ndim", 1) > 1:
+        audio = np.mean(audio, axis=1)
+    return np.asarray(audio, dtype=np.float32), int(sr)
 
 
 async def _stt_transcribe(upload: UploadFile) -> SttResponse:
@@ -984,8 +1314,6 @@ async def _stt_transcribe(upload: UploadFile) -> SttResponse:
     Returns richer metadata so the frontend can reason about empty/short captures.
     """
 
-    ffmpeg = _ffmpeg_executable()
-
     def _load_stt_engine():
         """Prefer faster-whisper (3-5x faster). Fall back to transformers whisper.
 
@@ -997,10 +1325,13 @@ async def _stt_transcribe(upload: UploadFile) -> SttResponse:
             from faster_whisper import WhisperModel  # type: ignore
 
             # ctranslate2 CUDA support on very new GPU architectures can lag;
-            # try GPU first, then CPU int8 (still fast), before giving up.
+            # try GPU first, then CPU int8 (still fast), before giving up. On
+            # GPU int8 weights with fp16 activations halve the weight traffic
+            # of plain fp16 for the same transcript; not every card/ct2 build
+            # has the int8 kernels, hence the fp16 rung behind it.
             last_err: Exception | None = None
             attempts = (
-                [("cuda", "float16"), ("cpu", "int8")]
+                [("cuda", "int8_float16"), ("cuda", "float16"), ("cpu", "int8")]
                 if torch.cuda.is_available()
                 else [("cpu", "int8")]
             )
@@ -1041,74 +1372,50 @@ async def _stt_transcribe(upload: UploadFile) -> SttResponse:
 
     if STATE.stt is None:
         BUS.publish("stt.loading", {"model": os.getenv("NOVA_STT_MODEL_SIZE", "base")})
-        STATE.stt = await asyncio.to_thread(_load_stt_engine)
+        STATE.stt = await _in_pool("stt", _load_stt_engine)
         BUS.publish("stt.loaded", {"engine": STATE.stt[0]})
 
+    data = await upload.read()
     suffix = Path(upload.filename or "audio").suffix or ".bin"
-    with tempfile.TemporaryDirectory(prefix="nova-stt-") as td:
-        in_path = Path(td) / f"in{suffix}"
-        out_path = Path(td) / "out.wav"
-        data = await upload.read()
-        await asyncio.to_thread(in_path.write_bytes, data)
-
-        cmd = [
-            ffmpeg,
-            "-y",
-            "-i",
-            str(in_path),
-            "-ac",
-            "1",
-            "-ar",
-            "16000",
-            "-f",
-            "wav",
-            str(out_path),
-        ]
+
+    def _decode() -> tuple[Any, int]:
         try:
-            # ffmpeg ran DIRECTLY on the event loop here, for up to 60s. While a
-            # voice clip decoded, nothing else in Nova could make progress —
-            # no chat, no token streaming, no WS events, no workers. The decode
-            # itself is fine; doing it on the loop was not.
-            await asyncio.to_thread(
-                lambda: subprocess.run(
-                    cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=60
-                )
-            )
+            return _decode_audio_pyav(data), _STT_RATE
         except Exception as e:  # noqa: BLE001
-            raise RuntimeError(f"ffmpeg_decode_failed: {e}") from e
+            logger.debug("stt_pyav_decode_unavailable", error=str(e)[:200])
+        return _decode_audio_ffmpeg(data, suffix)
 
-        def _run_asr() -> SttResponse:
-            import numpy as np
-            import soundfile as sf  # type: ignore
+    def _run_asr() -> SttResponse:
+        audio, sr = _decode()
+        duration_ms = int(round((len(audio) / max(int(sr), 1)) * 1000)) if len(audio) else 0
 
-            audio, sr = sf.read(str(out_path), dtype="float32")
-            if getattr(audio, "ndim", 1) > 1:
-                audio = np.mean(audio, axis=1)
-            audio = np.asarray(audio, dtype=np.float32)
-            duration_ms = int(round((len(audio) / max(int(sr), 1)) * 1000)) if len(audio) else 0
+        engine, model = STATE.stt
+        if engine == "faster":
+            segments, _info = model.transcribe(audio, language="en", beam_size=1, vad_filter=True)
+            text = " ".join(seg.text.strip() for seg in segments).strip()
+        else:
+            import torch  # type: ignore
 
-            engine, model = STATE.stt
-            if engine == "faster":
-                segments, _info = model.transcribe(audio, language="en", beam_size=1, vad_filter=True)
-                text = " ".join(seg.text.strip() for seg in segments).strip()
-            else:
+            # The pipeline only wraps generation in no_grad; inference_mode
+            # also skips autograd's version-counter bookkeeping on every tensor.
+            with torch.inference_mode():
                 result = _silent_warn_call(model, {"array": audio, "sampling_rate": int(sr)})
-                if isinstance(result, dict):
-                    text = str(result.get("text") or "").strip()
-                else:
-                    text = str(result or "").strip()
+            if isinstance(result, dict):
+                text = str(result.get("text") or "").strip()
+            else:
+                text = str(result or "").strip()
 
-            return SttResponse(
-                text=text,
-                duration_ms=duration_ms,
-                sample_rate=int(sr),
-                empty=not bool(text),
-            )
+        return SttResponse(
+            text=text,
+            duration_ms=duration_ms,
+            sample_rate=int(sr),
+            empty=not bool(text),
+        )
 
-        BUS.publish("stt.transcribing", {})
-        result = await asyncio.to_thread(_run_asr)
-        BUS.publish("stt.transcript_final", {"chars": len(result.text), "empty": result.empty})
-        return result
+    BUS.publish("stt.transcribing", {})
+    result = await _in_pool("stt", _run_asr)
+    BUS.publish("stt.transcript_final", {"chars": len(result.text), "empty": result.empty})
+    return result
 
 @app.on_event("startup")
 async def _startup() -> None:
@@ -1122,6 +1429,7 @@ async def _startup() -> None:
     cfg.projects_dir.mkdir(parents=True, exist_ok=True)
     cfg.memory_dir.mkdir(parents=True, exist_ok=True)
     cfg.voice_dir.mkdir(parents=True, exist_ok=True)
+    STATE.tts_cache = TTSCache.from_env(cfg.voice_dir)
 
     memory = MemoryUnifier(cfg.memory_dir)
     await memory.initialize()
@@ -1150,6 +1458,10 @@ async def _startup() -> None:
             # logger reports what actually loaded, so it's the one to keep.
             await llm.initialize()
             BUS.publish("model.loaded", {"model": cfg.model_path.name, "context_tokens": cfg.context_tokens})
+            # Nothing else is using the model yet, so the first decode's setup
+            # cost is paid here instead of by the first chat turn.
+            if (os.getenv("NOVA_LLM_WARMUP", "1").strip() or "1").lower() not in {"0", "false", "no", "off"}:
+                await llm.warmup()
             BUS.publish("model.gpu_confirmed", {"status": llm.gpu_status.status})
             if cfg.mmproj_path is not None:
                 print(f"• Vision model loaded: {cfg.mmproj_path.name}")
@@ -1227,6 +1539,11 @@ async def _shutdown() -> None:
             pass
     if STATE.tts_voice_cache_dir is not None:
         await asyncio.to_thread(shutil.rmtree, STATE.tts_voice_cache_dir, ignore_errors=True)
+    try:
+        await plugins_http.aclose()
+    except Exception:
+        pass
+    _shutdown_pools()
 
 
 @app.get("/health")
@@ -1296,7 +1613,11 @@ async def status() -> dict:
         },
         "gpu": gpu.to_dict(),
         "vision": llm.vision_status,
-        "tts": {"loaded": STATE.tts is not None, "device": STATE.tts_device},
+        "tts": {
+            "loaded": STATE.tts is not None,
+            "device": STATE.tts_device,
+            "cache": STATE.tts_cache.stats() if STATE.tts_cache is not None else None,
+        },
         "stt": {
             "loaded": STATE.stt is not None,
             "engine": STATE.stt[0] if STATE.stt is not None else None,
@@ -1428,6 +1749,62 @@ async def vision_screen_capture_result(payload: dict) -> dict:
     return {"ok": resolved}
 
 
+_SSE_PREFIXES = {
+    e: f"event: {e}\ndata: ".encode("utf-8")
+    for e in ("meta", "message", "tts", "tts_error", "audio_chunk", "error", "action", "done")
+}
+
+
+_MSG_IDLE_FLUSH_S = 0.05
+_MSG_FLUSH_CHARS = 32
+
+
+def _split_words(buf: str) -> tuple[str, str]:
+    """(text safe to send now, partial word to hold) for the token stream."""
+    if len(buf) >= _MSG_FLUSH_CHARS:
+        return buf, ""
+    cut = max(buf.rfind(" "), buf.rfind("\n"))
+    if cut <= 0:
+        return "", buf
+    return buf[:cut], buf[cut:]
+
+
+# Sentence boundary for speech chunking: terminator followed by whitespace.
+_SENTENCE_BREAK_RE = re.compile(r"(?<=[.!?])\s+")
+
+
+def _split_sentences(buffer: str, force: bool = False) -> tuple[list[str], str]:
+    """Split complete sentences off the front of the TTS stream buffer.
+
+    Runs on every token delta while speaking, so the pattern is compiled once
+    here instead of going through re's cache lookup per call.
+    """
+    if force:
+        return ([buffer.strip()] if buffer.strip() else []), ""
+    parts = _SENTENCE_BREAK_RE.split(buffer)
+    if len(parts) <= 1:
+        # No boundary yet; force a cut on very long run-ons so speech keeps up.
+        if len(buffer) > 260:
+            cut = buffer.rfind(" ", 60, 260)
+            if cut > 0:
+                return [buffer[:cut].strip()], buffer[cut + 1 :]
+        return [], buffer
+    complete = [p.strip() for p in parts[:-1] if p.strip()]
+    return complete, parts[-1]
+
+
+_SSE_END = b"\n\n"
+_SSE_DONE = b"event: done\ndata: {}\n\n"
+
+
+def _sse(event: str, payload: dict) -> bytes:
+    """One SSE frame. Built straight as bytes: orjson emits UTF-8 directly, so
+    there's no str round-trip per token, the event prefixes are shared, and the
+    frame is assembled with a single join (one allocation, not two concats)."""
+    prefix = _SSE_PREFIXES.get(event) or f"event: {event}\ndata: ".encode("utf-8")
+    return b"".join((prefix, orjson.dumps(payload, default=str), _SSE_END))
+
+
 @app.post("/chat/stream")
 async def chat_stream(req: ChatStreamRequest) -> StreamingResponse:
     if STATE.brain is None or STATE.config is None:
@@ -1439,77 +1816,65 @@ async def chat_stream(req: ChatStreamRequest) -> StreamingResponse:
     if not user_text:
         raise HTTPException(status_code=422, detail="Missing 'msg', 'message', or 'attachments'")
 
-    def _sse(event: str, payload: dict) -> bytes:
-        import json as _json
-
-        return f"event: {event}\ndata: {_json.dumps(payload, ensure_ascii=False)}\n\n".encode("utf-8")
-
-    def _split_sentences(buffer: str, force: bool = False) -> tuple[list[str], str]:
-        """Split complete sentences off the front of the stream buffer."""
-        if force:
-            return ([buffer.strip()] if buffer.strip() else []), ""
-        parts = re.split(r"(?<=[.!?])\s+", buffer)
-        if len(parts) <= 1:
-            # No boundary yet; force a cut on very long run-ons so speech keeps up.
-            if len(buffer) > 260:
-                cut = buffer.rfind(" ", 60, 260)
-                if cut > 0:
-                    return [buffer[:cut].strip()], buffer[cut + 1 :]
-            return [], buffer
-        complete = [p.strip() for p in parts[:-1] if p.strip()]
-        return complete, parts[-1]
-
     async def gen():
         conv_id = req.conversation_id or uuid4()
         speak = bool(req.speak)
 
         yield _sse("meta", {"conversation_id": str(conv_id)})
 
-        # ── Sentence-streamed TTS worker (runs alongside token streaming) ────
+        # ── One merged event queue ───────────────────────────────────────────
+        # The LLM pump and the TTS worker both feed `events`, and the loop below
+        # forwards whichever is ready first. Audio used to be flushed only when
+        # the next token arrived, so a clip finished during a tool call or a
+        # slow decode stretch sat in its queue until the model spoke again.
+        #   ("llm", ev) / ("llm_error", exc) / ("llm_end", None)
+        #   ("audio", (sse_event, payload)) / ("audio_end", None)
+        events: asyncio.Queue[tuple[str, Any]] = asyncio.Queue()
         sentence_q: asyncio.Queue[str | None] = asyncio.Queue()
-        audio_q: asyncio.Queue[dict | None] = asyncio.Queue()
+        stream_chunks = speak and _tts_stream_chunks_enabled()
 
+        # ── Sentence-streamed TTS worker (runs alongside token streaming) ────
         async def tts_worker() -> None:
             try:
                 voice_path = _resolve_voice_path(STATE.config, req.voice)
             except Exception as e:  # noqa: BLE001
-                await audio_q.put({"error": f"voice unavailable: {e}"})
+                await events.put(("audio", ("tts_error", {"error": f"voice unavailable: {e}"})))
                 while await sentence_q.get() is not None:
                     pass
-                await audio_q.put(None)
+                await events.put(("audio_end", None))
                 return
 
+            clip_no = 0
             while True:
                 sentence = await sentence_q.get()
                 if sentence is None:
                     break
+                clip_no += 1
+
+                # Opt-in (NOVA_TTS_STREAM_CHUNKS): raw PCM16 pieces of this
+                # sentence as XTTS decodes them. The finished clip still follows
+                # as the usual `tts` event, so clients that ignore audio_chunk
+                # lose nothing.
+                async def _on_chunk(seq: int, pcm: bytes, sr: int, clip: int = clip_no) -> None:
+                    await events.put(("audio", ("audio_chunk", {
+                        "clip": clip, "seq": seq, "sample_rate": sr, "format": "pcm_s16le",
+                        "b64": base64.b64encode(pcm).decode("ascii"),
+                    })))
+
                 try:
                     BUS.publish("tts.generate_start", {"chars": len(sentence)})
-                    audio = await _tts_bytes(sentence, voice_path=voice_path)
+                    audio_id, audio = await _tts_clip(
+                        sentence, voice_path=voice_path, on_chunk=_on_chunk if stream_chunks else None
+                    )
                     BUS.publish("tts.generate_done", {"bytes": len(audio)})
-                    audio_id = str(UUID(bytes=os.urandom(16)))
-                    STATE.tts_cache[audio_id] = audio
-                    # Bound the cache: every spoken sentence lands here and was
-                    # never evicted (unbounded WAV growth). Keep the most recent
-                    # clips (dict preserves insertion order); the frontend fetches
-                    # each clip once, right after it's produced.
-                    while len(STATE.tts_cache) > _TTS_CACHE_MAX:
-                        STATE.tts_cache.pop(next(iter(STATE.tts_cache)), None)
-                    await audio_q.put({"audio_url": f"/tts/{audio_id}"})
+                    await events.put(("audio", ("tts", {"audio_url": f"/tts/{audio_id}", "clip": clip_no})))
                 except Exception as e:  # noqa: BLE001
                     logger.debug("tts_sentence_failed", error=str(e))
-                    await audio_q.put({"error": str(e)})
-            await audio_q.put(None)
-
-        worker = asyncio.create_task(tts_worker()) if speak else None
+                    await events.put(("audio", ("tts_error", {"error": str(e)})))
+            await events.put(("audio_end", None))
 
         # ── Token stream (real streaming via the function-calling pipeline) ──
-        tool_calls_result: list[dict] = []
-        full_text = ""
-        sent_buffer = ""
-        sent_any_token = False
-
-        async def source():
+        async def llm_pump() -> None:
             BUS.publish("chat.user_message", {"chars": len(user_text)})
             BUS.publish("chat.thinking_start", {})
             try:
@@ -1518,75 +1883,110 @@ async def chat_stream(req: ChatStreamRequest) -> StreamingResponse:
                     conversation_id=conv_id,
                     current_location=req.current_location.model_dump() if req.current_location is not None else None,
                 ):
-                    yield ev
+                    await events.put(("llm", ev))
+            except Exception as e:  # noqa: BLE001
+                await events.put(("llm_error", e))
             finally:
                 BUS.publish("chat.thinking_end", {})
+                await events.put(("llm_end", None))
+
+        worker = asyncio.create_task(tts_worker()) if speak else None
+        pump = asyncio.create_task(llm_pump())
+
+        tool_calls_result: list[dict] = []
+        full_text = ""
+        sent_buffer = ""
+        sent_any_token = False
+
+        # Text goes out on word boundaries rather than one frame per BPE piece
+        # (" extra", "ordinary"): roughly half the frames for the same text.
+        # A partial word is never held for longer than _MSG_IDLE_FLUSH_S.
+        msg_pending = ""
 
         try:
-            async for ev in source():
+            while True:
+                if msg_pending:
+                    try:
+                        kind, item = await asyncio.wait_for(events.get(), _MSG_IDLE_FLUSH_S)
+                    except asyncio.TimeoutError:
+                        yield _sse("message", {"content": msg_pending})
+                        msg_pending = ""
+                        continue
+                else:
+                    kind, item = await events.get()
+                if kind == "audio":
+                    yield _sse(*item)
+                    continue
+                if kind in ("llm_end", "llm_error") and msg_pending:
+                    yield _sse("message", {"content": msg_pending})
+                    msg_pending = ""
+                if kind == "llm_end":
+                    break
+                if kind == "llm_error":
+                    logger.error("chat_stream_failed", error=str(item))
+                    # Always signal the crash so the frontend can distinguish a mid-stream
+                    # failure from a clean finish (previously both looked like `done`).
+                    yield _sse("error", {"message": "The reply was interrupted by an internal error.", "where": "stream"})
+                    if not sent_any_token:
+                        apology = "Sorry — I hit an internal error on that one."
+                        full_text = apology
+                        sent_any_token = True
+                        yield _sse("message", {"content": apology})
+                        if speak:
+                            await sentence_q.put(apology)
+                    continue
+
+                ev = item
                 if ev.get("type") == "token":
                     token = str(ev.get("text") or "")
                     if not token:
                         continue
                     full_text += token
                     sent_any_token = True
-                    yield _sse("message", {"content": token})
+                    ready, msg_pending = _split_words(msg_pending + token)
+                    if ready:
+                        yield _sse("message", {"content": ready})
 
                     if speak:
                         sent_buffer += token
                         complete, sent_buffer = _split_sentences(sent_buffer)
                         for s in complete:
                             await sentence_q.put(s)
-                        # Forward any finished audio without blocking the tokens.
-                        while True:
-                            try:
-                                item = audio_q.get_nowait()
-                            except asyncio.QueueEmpty:
-                                break
-                            if item is None:
-                                break
-                            yield _sse("tts_error" if "error" in item else "tts", item)
 
                 elif ev.get("type") == "done":
                     full_text = str(ev.get("full_text") or full_text)
                     tool_calls_result = ev.get("tool_calls") or []
-        except Exception as e:  # noqa: BLE001
-            logger.error("chat_stream_failed", error=str(e))
-            # Always signal the crash so the frontend can distinguish a mid-stream
-            # failure from a clean finish (previously both looked like `done`).
-            yield _sse("error", {"message": "The reply was interrupted by an internal error.", "where": "stream"})
+
+            # The pipeline can legitimately finish with no visible tokens (e.g. a
+            # reasoning model whose entire generation got spent on hidden
+            # chain-of-thought). Never leave the user staring at a blank reply.
             if not sent_any_token:
-                apology = "Sorry — I hit an internal error on that one."
+                apology = full_text.strip() or "Sorry — I came up empty on that one."
                 full_text = apology
-                sent_any_token = True
                 yield _sse("message", {"content": apology})
                 if speak:
                     await sentence_q.put(apology)
 
-        # The pipeline can legitimately finish with no visible tokens (e.g. a
-        # reasoning model whose entire generation got spent on hidden
-        # chain-of-thought). Never leave the user staring at a blank reply.
-        if not sent_any_token:
-            apology = full_text.strip() or "Sorry — I came up empty on that one."
-            full_text = apology
-            yield _sse("message", {"content": apology})
-            if speak:
-                await sentence_q.put(apology)
-
-        BUS.publish("chat.assistant_done", {"chars": len(full_text), "tools_used": len(tool_calls_result)})
-
-        # ── Flush remaining speech and drain the audio queue in order ───────
-        if speak and worker is not None:
-            tail, _ = _split_sentences(sent_buffer, force=True)
-            for s in tail:
-                await sentence_q.put(s)
-            await sentence_q.put(None)
-            while True:
-                item = await audio_q.get()
-                if item is None:
-                    break
-                yield _sse("tts_error" if "error" in item else "tts", item)
-            await worker
+            BUS.publish("chat.assistant_done", {"chars": len(full_text), "tools_used": len(tool_calls_result)})
+
+            # ── Flush remaining speech and drain the audio in order ──────────
+            if speak and worker is not None:
+                tail, _ = _split_sentences(sent_buffer, force=True)
+                for s in tail:
+                    await sentence_q.put(s)
+                await sentence_q.put(None)
+                while True:
+                    kind, item = await events.get()
+                    if kind == "audio_end":
+                        break
+                    if kind == "audio":
+                        yield _sse(*item)
+                await worker
+        finally:
+            # Client went away mid-reply: stop decoding and synthesizing for nobody.
+            for task in (pump, worker):
+                if task is not None and not task.done():
+                    task.cancel()
 
         # ── Action events (open maps overlay for location results) ──────────
         for tc in tool_calls_result:
@@ -1597,7 +1997,7 @@ async def chat_stream(req: ChatStreamRequest) -> StreamingResponse:
                 if data_url:
                     yield _sse("action", {"type": "image_generated", "image_url": data_url, "prompt": tc["result"].get("prompt", "")})
 
-        yield _sse("done", {})
+        yield _SSE_DONE
 
     return StreamingResponse(gen(), media_type="text/event-stream")
 
@@ -1605,33 +2005,51 @@ async def chat_stream(req: ChatStreamRequest) -> StreamingResponse:
 
 
 async def tts(req: TtsRequest) -> Response:
+    return await _tts_response(req.text, req.voice)
+
+
+async def _tts_response(text: str, voice: str) -> Response:
     cfg = STATE.config
     if cfg is None:
         raise HTTPException(status_code=503, detail="Not ready")
 
-    voice_path = _resolve_voice_path(cfg, req.voice)
+    voice_path = _resolve_voice_path(cfg, voice)
 
     try:
-        audio = await _tts_bytes(req.text, voice_path=voice_path)
-        # Do not write any generated audio to disk.
+        audio = await _tts_bytes(text, voice_path=voice_path)
         return Response(content=audio, media_type="audio/wav")
     except Exception as e:  # noqa: BLE001
         logger.error("tts_failed", error=str(e))
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+_TTS_CLIP_HEADERS = {"Cache-Control": "private, max-age=86400, immutable"}
+
+
 @app.get("/tts/{audio_id}")
-async def tts_get(audio_id: str) -> Response:
-    audio = STATE.tts_cache.get(audio_id)
+async def tts_get(audio_id: str, request: Request) -> Response:
+    if not is_clip_key(audio_id):
+        raise HTTPException(status_code=404, detail="Audio not found")
+    # The id is a hash of voice+pace+text, so the bytes behind a URL never
+    # change: let the browser/Electron keep it and replay repeats locally, and
+    # answer a revalidation from the id alone without touching the cache.
+    etag = f'"{audio_id}"'
+    headers = {**_TTS_CLIP_HEADERS, "ETag": etag}
+    inm = request.headers.get("if-none-match", "")
+    if inm and (inm.strip() == "*" or etag in {t.strip().removeprefix("W/") for t in inm.split(",")}):
+        return Response(status_code=304, headers=headers)
+    cache = _tts_cache()
+    audio = cache.lookup(audio_id) or await _in_pool("io", cache.load, audio_id)
     if audio is None:
         raise HTTPException(status_code=404, detail="Audio not found")
-    return Response(content=audio, media_type="audio/wav")
+    return Response(content=audio, media_type="audio/wav", headers=headers)
 
 
 @app.post("/speak")
 async def speak(req: SpeakRequest) -> Response:
-    # Frontend expects /speak returning audio bytes.
-    return await tts(TtsRequest(text=req.text, voice=req.voice))
+    # Frontend expects /speak returning audio bytes. Called per sentence, so
+    # go straight to the shared body rather than re-validating a TtsRequest.
+    return await _tts_response(req.text, req.voice)
 
 
 @app.post("/stt", response_model=SttResponse)
@@ -1643,6 +2061,32 @@ async def stt(file: UploadFile = File(...)) -> SttResponse:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+_UPLOAD_CHUNK = 1 << 20
+
+
+async def _save_upload(f: UploadFile, out: Path) -> int:
+    """Copy an upload to `out` in 1 MiB chunks; returns the bytes written.
+
+    Upload size is caller-controlled and unbounded. Reading the whole body
+    first held every attachment of the request in RAM at once, and the write
+    does not belong on the event loop either — a large attachment would stall
+    chat, streaming and every worker for its duration. Chunks go through the
+    io pool, so peak memory is one chunk per concurrent upload.
+    """
+    fh = await _in_pool("io", open, out, "wb")
+    total = 0
+    try:
+        while chunk := await f.read(_UPLOAD_CHUNK):
+            await _in_pool("io", fh.write, chunk)
+            total += len(chunk)
+    except BaseException:
+        await _in_pool("io", fh.close)
+        out.unlink(missing_ok=True)
+        raise
+    await _in_pool("io", fh.close)
+    return total
+
+
 @app.post("/file-upload")
 async def file_upload(files: list[UploadFile] = File(...)) -> dict:
     cfg = STATE.config
@@ -1652,25 +2096,22 @@ async def file_upload(files: list[UploadFile] = File(...)) -> dict:
     upload_dir = _upload_dir(cfg)
     upload_dir.mkdir(parents=True, exist_ok=True)
 
-    stored: list[dict[str, Any]] = []
-    for f in files:
+    async def _store_one(f: UploadFile) -> dict[str, Any]:
         name = Path(f.filename or "file.bin").name
-        data = await f.read()
         stored_name = f"{uuid4().hex}_{name}"
         out = upload_dir / stored_name
-        # Upload size is caller-controlled and unbounded, so this write does
-        # not belong on the event loop — a large attachment would stall chat,
-        # streaming and every worker for its duration.
-        await asyncio.to_thread(out.write_bytes, data)
-        stored.append(
-            {
-                "name": name,
-                "path": str(out),
-                "bytes": len(data),
-                "url": f"/uploads/{stored_name}",
-                "content_type": f.content_type or None,
-            }
-        )
+        size = await _save_upload(f, out)
+        return {
+            "name": name,
+            "path": str(out),
+            "bytes": size,
+            "url": f"/uploads/{stored_name}",
+            "content_type": f.content_type or None,
+        }
+
+    # Files are independent, so copy them concurrently (bounded by the io
+    # pool) rather than one after another; gather keeps the response order.
+    stored = list(await asyncio.gather(*(_store_one(f) for f in files)))
 
     return {"files": stored}
 
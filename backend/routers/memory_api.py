@@ -84,7 +84,7 @@ async def memory_search(q: str = Query(min_length=1)) -> dict:
     if STATE.memory is None:
         raise HTTPException(status_code=503, detail="Not ready")
     hits = await STATE.memory.search(q=q, conversation_id=None, limit=12)
-    return {"q": q, "results": [h.model_dump() for h in hits]}
+    return {"q": q, "results": [h.model_dump(mode="json") for h in hits]}
 
 
 @router.post("/memory/purge", response_model=MemoryPurgeResponse)
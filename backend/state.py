@@ -9,12 +9,13 @@ one intentional global in the backend.
 """
 
 import asyncio
-import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:  # imported only for annotations; no runtime cycle
     from backend.app import RuntimeConfig
+    from backend.tts_cache import TTSCache
     from core.brain import Brain
     from core.llm_runtime import LLMRuntime
     from core.runtime import RuntimeManager
@@ -29,18 +30,20 @@ class _State:
     runtime: RuntimeManager | None = None
     tts = None
     stt = None
-    tts_cache: dict[str, bytes] = {}  # bounded to _TTS_CACHE_MAX most-recent clips
+    tts_cache: TTSCache | None = None  # content-addressed clips, see backend/tts_cache.py
     tts_device: str | None = None
     tts_load_task: asyncio.Task | None = None
     tts_prewarm_task: asyncio.Task | None = None
     tts_voice_cache: dict[str, str] = {}
     tts_voice_tasks: dict[str, asyncio.Task[str]] = {}
     tts_voice_cache_dir: Path | None = None
-    tts_phrase_cache: dict[str, bytes] = {}
+    # XTTS speaker conditioning per (model id, reference wav, mtime); see _xtts_latents.
+    xtts_latents: dict[tuple[int, str, int], tuple[Any, Any]] = {}
+    # Bounded per-workload executors, created on first use (backend/app.py::_pool).
+    tts_pool: ThreadPoolExecutor | None = None
+    stt_pool: ThreadPoolExecutor | None = None
+    io_pool: ThreadPoolExecutor | None = None
     dev_mode = None  # lazily created DevMode instance (see core/dev_mode.py)
 
 
-# Max number of recent TTS clips to retain in memory (see tts_worker eviction).
-_TTS_CACHE_MAX = int(os.getenv("NOVA_TTS_CACHE_MAX", "64").strip() or "64")
-
 STATE = _State()
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+"""Content-addressed TTS clip cache: bounded RAM LRU in front of a WAV store.
+
+Clips used to live in two dicts on STATE: `tts_cache`, keyed by a random
+UUID per synthesis (so a repeated sentence never hit), and
+`tts_phrase_cache`, keyed by text but never evicted. XTTS on CPU costs whole
+seconds per sentence, and Nova repeats herself more than you'd think
+("Sure.", "On it.", the prewarm line), so both were leaving easy wins on the
+table while one of them grew without bound.
+
+A clip is now keyed by a hash of everything that determines its bytes: the
+TTS model and its output rate, the voice sample (by path, mtime and size, so
+re-recording a voice under the same name gets new clips), pace and text. The key doubles as the public audio id served from
+`/tts/{audio_id}`, so identical speech has one stable URL.
+
+* RAM: an LRU of raw WAV bytes, bounded by total bytes (NOVA_TTS_CACHE_MB).
+* Disk: one `<key>.wav` per clip under `voice_dir/_cache`, bounded separately
+  (NOVA_TTS_CACHE_DISK_MB), oldest-first pruning. A clip evicted from RAM is
+  still one file read away, across restarts too.
+
+Disk methods block; call them from a worker thread, never the event loop.
+Disk failures degrade to RAM-only — a cache must never break speech.
+"""
+
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from core.logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+# blake2b(digest_size=16) hex. Validated before ANY filesystem use, so an
+# audio id from a URL can never name a path outside the cache dir.
+_KEY_RE = re.compile(r"^[0-9a-f]{32}$")
+
+
+def clip_key(text: str, voice: str, speed: float, *, model: str, sample_rate: int) -> str:
+    """Stable id for a clip: same model + rate + voice + pace + text -> same
+    bytes -> same key. `voice` should identify the sample's contents, not just
+    its name (see backend.app._voice_cache_key)."""
+    raw = f"{model}|{int(sample_rate)}|{voice}|{speed:.3f}|{text}".encode("utf-8")
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def is_clip_key(key: str) -> bool:
+    return bool(_KEY_RE.match(key or ""))
+
+
+class TTSCache:
+    def __init__(self, *, max_bytes: int, disk_dir: Path | None = None, disk_max_bytes: int = 0) -> None:
+        self._max_bytes = max(0, int(max_bytes))
+        self._disk_max_bytes = max(0, int(disk_max_bytes))
+        self._mem: OrderedDict[str, bytes] = OrderedDict()
+        self._mem_bytes = 0
+        self._lock = threading.Lock()
+        self._disk_dir: Path | None = None
+        if disk_dir is not None and self._disk_max_bytes > 0:
+            try:
+                disk_dir.mkdir(parents=True, exist_ok=True)
+                self._disk_dir = disk_dir
+            except OSError as e:
+                logger.warning("tts_cache_disk_unavailable", path=str(disk_dir), error=str(e)[:200])
+
+    @classmethod
+    def from_env(cls, voice_dir: Path) -> "TTSCache":
+        def _mb(name: str, default: str) -> int:
+            try:
+                return int(float(os.getenv(name, default).strip() or default) * 1024 * 1024)
+            except ValueError:
+                return int(float(default) * 1024 * 1024)
+
+        return cls(
+            max_bytes=_mb("NOVA_TTS_CACHE_MB", "256"),
+            disk_dir=voice_dir / "_cache",
+            disk_max_bytes=_mb("NOVA_TTS_CACHE_DISK_MB", "1024"),
+        )
+
+    # ── RAM tier (non-blocking; safe on the event loop) ─────────────────────
+
+    def lookup(self, key: str) -> bytes | None:
+        with self._lock:
+            data = self._mem.get(key)
+            if data is not None:
+                self._mem.move_to_end(key)
+            return data
+
+    def _remember(self, key: str, data: bytes) -> None:
+        if len(data) > self._max_bytes:
+            return
+        with self._lock:
+            old = self._mem.pop(key, None)
+            if old is not None:
+                self._mem_bytes -= len(old)
+            self._mem[key] = data
+            self._mem_bytes += len(data)
+            while self._mem_bytes > self._max_bytes and self._mem:
+                _, evicted = self._mem.popitem(last=False)
+                self._mem_bytes -= len(evicted)
+
+    # ── Disk tier (blocking; call via a worker thread) ──────────────────────
+
+    def _path(self, key: str) -> Path | None:
+        if self._disk_dir is None or not is_clip_key(key):
+            return None
+        return self._disk_dir / f"{key}.wav"
+
+    def load(self, key: str) -> bytes | None:
+        """RAM, then disk (promoting a disk hit back into RAM)."""
+        data = self.lookup(key)
+        if data is not None:
+            return data
+        path = self._path(key)
+        if path is None:
+            return None
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        self._remember(key, data)
+        return data
+
+    def store(self, key: str, data: bytes) -> None:
+        self._remember(key, data)
+        path = self._path(key)
+        if path is None or path.exists():
+            return
+        try:
+            tmp = path.with_suffix(".tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+            self._prune_disk()
+        except OSError as e:
+            logger.debug("tts_cache_write_failed", error=str(e)[:200])
+
+    def _prune_disk(self) -> None:
+        if self._disk_dir is None:
+            return
+        files = []
+        total = 0
+        for p in self._disk_dir.glob("*.wav"):
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            files.append((st.st_mtime, st.st_size, p))
+            total += st.st_size
+        if total <= self._disk_max_bytes:
+            return
+        files.sort()
+        for _mtime, size, p in files:
+            if total <= self._disk_max_bytes:
+                break
+            try:
+                p.unlink()
+                total -= size
+            except OSError:
+                continue
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._mem), "bytes": self._mem_bytes, "max_bytes": self._max_bytes}
@@ -52,6 +52,9 @@ class AgentSupervisor:
         self._router = router
         self._tool_descriptions = dict(tool_descriptions)
         self._cfg = cfg or SupervisorConfig()
+        # "Available tools" prompt block, keyed by the tool names it was built
+        # from: rebuilt only when a tool is registered, not on every step.
+        self._tools_block: tuple[tuple[str, ...], str] | None = None
         self._task: asyncio.Task[None] | None = None
         self._stop = asyncio.Event()
 
@@ -81,6 +84,13 @@ class AgentSupervisor:
             args={},
         )
 
+    def _tools_list(self) -> str:
+        names = tuple(self._router.list_tools())
+        if self._tools_block is None or self._tools_block[0] != names:
+            block = "\n".join(f"- {n}: {self._tool_descriptions.get(n, '')}" for n in names)
+            self._tools_block = (names, block)
+        return self._tools_block[1]
+
     async def _decide_next(self, *, goal_id: str, project_name: str) -> dict[str, Any]:
         """
         Ask the LLM for the next step.
@@ -90,7 +100,7 @@ class AgentSupervisor:
         - {"type":"final","message":"..."}
         - {"type":"question","message":"..."}  # needs user input; pauses goal
         """
-        tools_list = "\n".join([f"- {n}: {self._tool_descriptions.get(n, '')}" for n in self._router.list_tools()])
+        tools_list = self._tools_list()
         recent_tasks = await self._memory.list_goal_tasks(goal_id=goal_id, limit=12)
         # Compact history for the model
         history_lines: list[str] = []
@@ -15,6 +15,9 @@ from memory.unifier import MemoryUnifier
 
 logger = get_logger(__name__)
 
+# Test tags and editor boilerplate, erased in one pass rather than one per kind.
+_RE_UI_ARTIFACTS = re.compile(r"#e2e\b|#hello\b|\blast edited by\s+Nova\b", re.IGNORECASE)
+
 
 def _sanitize_user_text(text: str) -> str:
     """Remove known UI artifacts and collapse whitespace."""
@@ -22,28 +25,31 @@ def _sanitize_user_text(text: str) -> str:
         return ""
     t = text.strip()
 
-    # Strip common test tags
-    t = re.sub(r"#e2e\b", "", t, flags=re.IGNORECASE)
-    t = re.sub(r"#hello\b", "", t, flags=re.IGNORECASE)
-
-    # Remove UI/editor artifacts
-    t = re.sub(r"\blast edited by\s+Nova\b", "", t, flags=re.IGNORECASE)
+    # Strip common test tags and UI/editor artifacts. Every artifact starts
+    # with "#" or spells "last edited by", so plain chat never reaches the regex.
+    if "#" in t or "last edited by" in t.lower():
+        t = _RE_UI_ARTIFACTS.sub("", t)
 
-    # If the user pasted a transcript, keep only the last user line.
-    lines = [ln.strip() for ln in t.splitlines() if ln.strip()]
-    if any(ln.lower().startswith("assistant:") or ln.lower().startswith("user:") for ln in lines):
+    # If the user pasted a transcript, keep only the last user line. Lines are
+    # lowered one prefix at a time, and text without a colon skips the scan.
+    if ":" in t:
         last_user = ""
-        for ln in lines:
-            if ln.lower().startswith("user:"):
+        is_transcript = False
+        for ln in t.splitlines():
+            head = ln.lstrip()[:10].lower()
+            if head.startswith("user:"):
+                is_transcript = True
                 last_user = ln.split(":", 1)[1].strip()
-        if last_user:
+            elif head.startswith("assistant:"):
+                is_transcript = True
+        if is_transcript and last_user:
             t = last_user
 
-    t = re.sub(r"\s+", " ", t).strip()
-    return t
+    # str.split() uses the same whitespace set as \s, without the regex engine.
+    return " ".join(t.split())
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatResponse:
     conversation_id: UUID
     assistant_text: str
@@ -105,10 +105,12 @@ _TO_DESTINATION_PATTERNS = [
 
 # Things you "go to" that are not places on a map. Defense in depth behind the
 # anchoring above — a routing offer for one of these is always wrong.
-_NON_DESTINATIONS = {
+_NON_DESTINATIONS = frozenset({
     "sleep", "bed", "rest", "work out", "sleep now", "bed now",
     "the bathroom", "bathroom", "town",
-}
+})
+
+_TRAVEL_MODES = frozenset({"driving", "walking", "bicycling", "transit"})
 
 _USE_DEVICE_LOCATION_RE = re.compile(
     r"\b(?:use\s+my\s+(?:current\s+)?location|my\s+(?:current\s+)?location|from\s+here|near\s+me|around\s+me|current\s+location|where\s+i\s+am)\b",
@@ -147,8 +149,7 @@ def extract_directions(text: str) -> tuple[str, str, str] | None:
     origin = m.group(1).strip().rstrip(" ,.")
     dest = m.group(2).strip().rstrip(" ,.")
     mode_raw = (m.group(3) or "driving").strip().lower()
-    valid = {"driving", "walking", "bicycling", "transit"}
-    mode = mode_raw if mode_raw in valid else "driving"
+    mode = mode_raw if mode_raw in _TRAVEL_MODES else "driving"
     # Guard against overly long/garbage extractions
     if len(origin.split()) > 6 or len(dest.split()) > 6:
         return None
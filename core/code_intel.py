@@ -310,6 +310,9 @@ def tech_debt(index: dict[str, Any]) -> dict[str, Any]:
             "by_severity": {s: sum(1 for i in items if i["severity"] == s) for s in ("high", "medium", "low")}}
 
 
+_ENTRY_STEMS = frozenset({"main", "app", "index", "__main__", "server", "cli"})
+
+
 def architecture_summary(index: dict[str, Any]) -> dict[str, Any]:
     """A structural outline: languages, top directories, largest files, key
     dependencies, and likely entry points."""
@@ -319,8 +322,7 @@ def architecture_summary(index: dict[str, Any]) -> dict[str, Any]:
         top = f["path"].split("/", 1)[0] if "/" in f["path"] else "(root)"
         dirs[top] = dirs.get(top, 0) + 1
     largest = sorted(files, key=lambda f: -f["loc"])[:8]
-    entry_names = ("main", "app", "index", "__main__", "server", "cli")
-    entry_points = [f["path"] for f in files if Path(f["path"]).stem in entry_names]
+    entry_points = [f["path"] for f in files if Path(f["path"]).stem in _ENTRY_STEMS]
     return {
         "stats": index.get("stats", {}),
         "top_level_dirs": sorted(dirs.items(), key=lambda x: -x[1]),
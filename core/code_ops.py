@@ -1,12 +1,29 @@
 from __future__ import annotations
 
 import asyncio
+import os
+from collections import OrderedDict
 from pathlib import Path
 
 import aiofiles
 
 from core.safety import ensure_within_any_root
 
+# How many per-path write locks to remember. Past this the least recently
+# used idle ones are dropped; a fresh lock is made if that path comes back.
+_PATH_LOCK_CAP = 256
+
+
+def _atomic_write(tmp: Path, safe: Path, data: str, encoding: str) -> None:
+    # Write, fsync and rename in one blocking call so the whole patch costs a
+    # single thread hop instead of one per aiofiles operation. The fsync makes
+    # sure the rename never exposes a file whose contents are still in flight.
+    with open(tmp, "w", encoding=encoding) as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, safe)
+
 
 class CodeOps:
     def __init__(self, repo_root: Path, extra_allowed_roots: list[Path] | None = None):
@@ -14,7 +31,23 @@ class CodeOps:
         extras = [p.resolve() for p in (extra_allowed_roots or [])]
         # Always allow repo root; optionally allow additional roots (e.g. projects dir).
         self._allowed_roots = [repo, *extras]
-        self._lock = asyncio.Lock()
+        # One lock per target file: writes to the same path stay ordered while
+        # writes to unrelated files no longer queue behind each other.
+        self._path_locks: OrderedDict[Path, asyncio.Lock] = OrderedDict()
+
+    def _lock_for(self, path: Path) -> asyncio.Lock:
+        lock = self._path_locks.get(path)
+        if lock is None:
+            lock = self._path_locks[path] = asyncio.Lock()
+        self._path_locks.move_to_end(path)
+        if len(self._path_locks) > _PATH_LOCK_CAP:
+            # Never evict a held lock, or a second writer to that path would
+            # get a new one and run alongside the first.
+            for key in [k for k, v in self._path_locks.items() if not v.locked()]:
+                if len(self._path_locks) <= _PATH_LOCK_CAP:
+                    break
+                del self._path_locks[key]
+        return lock
 
     async def read_text(self, path: Path, encoding: str = "utf-8") -> str:
         safe = ensure_within_any_root(self._allowed_roots, path)
@@ -24,7 +57,7 @@ class CodeOps:
     async def write_text(self, path: Path, content: str, encoding: str = "utf-8") -> None:
         safe = ensure_within_any_root(self._allowed_roots, path)
         safe.parent.mkdir(parents=True, exist_ok=True)
-        async with self._lock:
+        async with self._lock_for(safe):
             async with aiofiles.open(safe, "w", encoding=encoding) as f:
                 await f.write(content)
 
@@ -32,7 +65,5 @@ class CodeOps:
         safe = ensure_within_any_root(self._allowed_roots, path)
         tmp = safe.with_suffix(safe.suffix + ".tmp")
         safe.parent.mkdir(parents=True, exist_ok=True)
-        async with self._lock:
-            async with aiofiles.open(tmp, "w", encoding=encoding) as f:
-                await f.write(new_content)
-            await asyncio.to_thread(tmp.replace, safe)
+        async with self._lock_for(safe):
+            await asyncio.to_thread(_atomic_write, tmp, safe, new_content, encoding)
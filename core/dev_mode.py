@@ -41,12 +41,12 @@ logger = get_logger(__name__)
 
 _MAX_FILE_BYTES = 400_000
 _STATE_DIRNAME = ".nova_dev"
-_DENY_NAMES = {".env", ".env.local", ".env.production"}
-_DENY_PARTS = {
+_DENY_NAMES = frozenset({".env", ".env.local", ".env.production"})
+_DENY_PARTS = frozenset({
     ".git", "memory_data", "node_modules", "venv", ".venv", "model",
     "dist", "release", "__pycache__", _STATE_DIRNAME,
     "credentials",  # OAuth tokens (PI1) — same protection tier as .env/model
-}
+})
 _BOOT_TEST_TIMEOUT_S = 90.0
 # Same system-directory guard as memory.index_folder's — an external project
 # root must never be a Windows/system directory.
@@ -25,10 +25,76 @@ def _now_iso() -> str:
 
 
 def _clip(text: Any, limit: int = 240) -> str:
-    s = str(text or "")
+    s = str_head(text or "", limit + 1)
     return s if len(s) <= limit else s[: limit - 1] + "…"
 
 
+def str_head(value: Any, limit: int) -> str:
+    """`str(value)[:limit]`, without rendering the part that gets cut.
+
+    Tool results are nested dicts/lists that can carry 20 KB of shell output
+    or a fetched page, and every consumer (bus summaries, tool-loop prompts)
+    keeps a few hundred chars. Plain dict/list/tuple/str are walked and
+    rendered only up to the budget. Anything else is str() at the top level
+    (an exception keeps its message) and repr() inside a container, which is
+    what str() of the container would show.
+    """
+    if limit <= 0:
+        return ""
+    if type(value) is str:
+        return value[:limit]
+    if type(value) not in (dict, list, tuple):
+        return str(value)[:limit]
+    out: list[str] = []
+    room = limit
+
+    def emit(piece: str) -> None:
+        nonlocal room
+        if room <= 0:
+            return
+        out.append(piece[:room])
+        room -= len(piece)
+
+    def walk(v: Any) -> None:
+        if room <= 0:
+            return
+        t = type(v)
+        if t is str:
+            if len(v) <= room:
+                emit(repr(v))
+                return
+            # repr() of a prefix is a prefix of repr() of the whole string as
+            # long as both pick the same quote character.
+            r = repr(v[:room])
+            full_quote = '"' if ("'" in v and '"' not in v) else "'"
+            emit(r[:-1] if r[0] == full_quote else repr(v))
+        elif t is dict:
+            emit("{")
+            for i, (k, x) in enumerate(v.items()):
+                if room <= 0:
+                    return
+                if i:
+                    emit(", ")
+                walk(k)
+                emit(": ")
+                walk(x)
+            emit("}")
+        elif t is list or t is tuple:
+            emit("[" if t is list else "(")
+            for i, x in enumerate(v):
+                if room <= 0:
+                    return
+                if i:
+                    emit(", ")
+                walk(x)
+            emit("]" if t is list else ("," if len(v) == 1 else "") + ")")
+        else:
+            emit(repr(v))
+
+    walk(value)
+    return "".join(out)
+
+
 @dataclass
 class NovaEvent:
     seq: int
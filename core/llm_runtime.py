@@ -2,9 +2,13 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import contextvars
+import functools
 import io
 import os
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable
@@ -39,12 +43,8 @@ def _windows_cuda_install_hint() -> str:
     )
 
 
-_GPU_LOG_PATTERNS = [
-    re.compile(r"ggml_cuda", re.IGNORECASE),
-    re.compile(r"\bCUDA\b", re.IGNORECASE),
-    re.compile(r"offload", re.IGNORECASE),
-    re.compile(r"\bGPU\b", re.IGNORECASE),
-]
+# A CUDA marker AND an offload marker, found in one pass over the load log.
+_GPU_OFFLOAD_RE = re.compile(r"(?P<cuda>ggml_cuda|\bCUDA\b)|(?P<offload>offload)", re.IGNORECASE)
 
 
 def _supported_chat_formats() -> set[str]:
@@ -141,9 +141,12 @@ def _looks_like_gpu_offload(log_text: str) -> bool:
     if not log_text:
         return False
     # Require at least a CUDA-related marker AND an offload marker.
-    has_cuda = bool(re.search(r"ggml_cuda|\bCUDA\b", log_text, flags=re.IGNORECASE))
-    has_offload = bool(re.search(r"offload|offloading", log_text, flags=re.IGNORECASE))
-    return has_cuda and has_offload
+    seen: set[str | None] = set()
+    for m in _GPU_OFFLOAD_RE.finditer(log_text):
+        seen.add(m.lastgroup)
+        if len(seen) == 2:
+            return True
+    return False
 
 
 def _normalize_model_name(name: str) -> str:
@@ -186,6 +189,45 @@ def _looks_like_vision_model(model_name: str) -> bool:
     return ("vl" in name) or ("vision" in name) or ("llava" in name)
 
 
+def _load_kwargs() -> dict[str, Any]:
+    """Performance knobs for the text model's Llama(...) constructor.
+
+    Prefill batch sizes (NOVA_N_BATCH / NOVA_N_UBATCH): n_batch is how many
+    prompt tokens llama.cpp submits per decode call and n_ubatch the physical
+    chunk the GPU computes at once, so raising them cuts prefill time on long
+    prompts at the cost of VRAM for compute buffers. Not free on the host side
+    either: llama-cpp-python keeps an n_batch x n_vocab float32 logits array,
+    ~0.6 GB per 1024 rows on a 150k-vocab model. The defaults match
+    llama-cpp-python's own (512/512). n_ubatch is clamped to n_batch, which
+    llama.cpp requires.
+
+    Memory placement: the KV cache stays on the GPU (offload_kqv) — decode
+    reads all of it for every token, so a host-side cache would put PCIe in
+    that loop. Weights are mmapped; NOVA_MLOCK=1 additionally pins them so the
+    OS can't page them out under memory pressure (needs the RAM to spare).
+    NOVA_FLASH_ATTN (default on) selects llama.cpp's fused attention kernel:
+    same math, far less memory traffic.
+    """
+    def _int(name: str, default: int) -> int:
+        try:
+            return max(1, int(os.getenv(name, str(default)).strip() or default))
+        except ValueError:
+            return default
+
+    def _flag(name: str, default: str) -> bool:
+        return (os.getenv(name, default).strip() or default).lower() in {"1", "true", "yes", "on"}
+
+    n_batch = _int("NOVA_N_BATCH", 512)
+    return {
+        "n_batch": n_batch,
+        "n_ubatch": min(_int("NOVA_N_UBATCH", 512), n_batch),
+        "offload_kqv": True,
+        "use_mmap": True,
+        "use_mlock": _flag("NOVA_MLOCK", "0"),
+        "flash_attn": _flag("NOVA_FLASH_ATTN", "1"),
+    }
+
+
 def _vision_reason(model_path: Path | None, mmproj_path: Path | None) -> str:
     """Whether vision is usable right now.
 
@@ -236,6 +278,13 @@ class LLMRuntime:
         self._vision_llama: Any | None = None
         self._gpu_status = GpuStatus(required=bool(model_path), active=False, status="model_missing" if not model_path else "not_loaded")
         self._init_lock = asyncio.Lock()
+        # Every llama.cpp call for this model runs on this one thread. Calls
+        # were already serialized by the GPU semaphore, but asyncio.to_thread
+        # handed each one to whichever default-pool thread was free, so the
+        # model's scratch buffers and CUDA context hopped threads every turn,
+        # and a caller outside the semaphore could reach the (non-thread-safe)
+        # Llama object concurrently. One worker makes both impossible.
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="nova-llm")
         # Rolling token usage for the UI (updated by chat/chat_stream).
         self._usage: dict[str, float | int] = {
             "replies": 0,
@@ -243,6 +292,16 @@ class LLMRuntime:
             "last_reply_tokens": 0,
             "avg_reply_tokens": 0.0,
         }
+        # Pinned system-prompt prefix (see pin_prefix). Touched only on the
+        # model thread once set.
+        self._prefix_pin = ""
+        self._prefix_tokens: list[int] = []
+        self._prefix_state: Any | None = None
+
+    async def _on_model_thread(self, fn: Callable[..., Any], *args: Any) -> Any:
+        ctx = contextvars.copy_context()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(ctx.run, fn, *args))
 
     @property
     def usage_stats(self) -> dict[str, float | int]:
@@ -284,7 +343,7 @@ class LLMRuntime:
         async with self._init_lock:
             if self._llama is not None:
                 return
-            llama, logs = await asyncio.to_thread(self._load_llama_text_only)
+            llama, logs = await self._on_model_thread(self._load_llama_text_only)
             if not _looks_like_gpu_offload(logs):
                 self._gpu_status = GpuStatus(required=True, active=False, status="gpu_offload_not_confirmed", details=_windows_cuda_install_hint())
                 raise GPUEnforcementError(self._gpu_status.details)
@@ -292,6 +351,112 @@ class LLMRuntime:
             self._gpu_status = GpuStatus(required=True, active=True, status="gpu_offload_confirmed")
             logger.info("llm_loaded", model=str(self._model_path), n_ctx=self._context_tokens)
 
+    def pin_prefix(self, text: str) -> None:
+        """Declare a system-prompt opening that many calls share verbatim.
+
+        llama.cpp only reuses KV cache for the prefix the *previous* call left
+        behind, and on a chat turn that is usually the tool loop's or a
+        background worker's prompt, so the reply prompt's fixed persona block
+        was prefilled from scratch every turn. With NOVA_LLM_PREFIX_CACHE on,
+        the first call whose system message starts with `text` is used to find
+        where that text ends in tokens; the state after exactly those tokens is
+        snapshotted once and restored before every later call that starts the
+        same way, so only the dynamic remainder is prefilled.
+        """
+        if text != self._prefix_pin:
+            self._prefix_pin = text
+            self._prefix_tokens = []
+            self._prefix_state = None
+
+    def _starts_with_pin(self, messages: list[dict[str, Any]]) -> bool:
+        if not self._prefix_pin or not messages or messages[0].get("role") != "system":
+            return False
+        content = messages[0].get("content")
+        return isinstance(content, str) and content.startswith(self._prefix_pin)
+
+    def _restore_prefix(self, messages: list[dict[str, Any]]) -> None:
+        """Model thread, before a completion: put the pinned prefix's KV back
+        unless it is still resident. The completion's own prefix match then
+        skips those tokens; if the prompt diverges earlier than expected it
+        simply re-evaluates from there, so this can only ever cost the load."""
+        if self._prefix_state is None or self._llama is None or not self._starts_with_pin(messages):
+            return
+        n = len(self._prefix_tokens)
+        llama = self._llama
+        if llama.n_tokens >= n and [int(t) for t in llama.input_ids[:n]] == self._prefix_tokens:
+            return
+        llama.load_state(self._prefix_state)
+
+    def _snapshot_prefix(self, messages: list[dict[str, Any]]) -> None:
+        """Model thread, after a completion: if no snapshot exists yet, locate
+        the pinned text's last token in what was just evaluated and snapshot
+        the state after exactly those tokens. One extra prefill of the prefix,
+        once per process. Never raises."""
+        if (
+            self._prefix_state is not None or self._llama is None or not self._starts_with_pin(messages)
+            or (os.getenv("NOVA_LLM_PREFIX_CACHE", "0").strip() or "0").lower() not in {"1", "true", "yes", "on"}
+        ):
+            return
+        llama = self._llama
+        try:
+            ids = [int(t) for t in llama.input_ids[: llama.n_tokens]]
+
+            def _text(k: int) -> str:
+                return llama.detokenize(ids[:k], special=True).decode("utf-8", errors="ignore")
+
+            at = _text(len(ids)).find(self._prefix_pin)
+            if at < 0:
+                return
+            end = at + len(self._prefix_pin)
+            # Largest k whose detokenized prefix stays within the pinned text.
+            lo, hi = 0, len(ids)
+            while lo < hi:
+                mid = (lo + hi + 1) // 2
+                if len(_text(mid)) <= end:
+                    lo = mid
+                else:
+                    hi = mid - 1
+            # Back off two tokens: the boundary token can merge differently
+            # with whatever dynamic text follows on the next turn.
+            k = lo - 2
+            if k < 32:
+                return
+            llama.reset()
+            llama.eval(ids[:k])
+            self._prefix_state = llama.save_state()
+            self._prefix_tokens = ids[:k]
+            logger.info("llm_prefix_pinned", tokens=k)
+        except Exception as e:  # noqa: BLE001
+            # Leave the pin unusable rather than retrying every call.
+            self._prefix_pin = ""
+            logger.warning("llm_prefix_snapshot_failed", error=str(e)[:200])
+
+    async def warmup(self) -> None:
+        """Run one single-token completion so the first real turn doesn't pay
+        for it. Loading maps the weights, but the CUDA kernels, KV cache and
+        compute buffers are only set up by the first decode — on a cold card
+        that is seconds of latency landing on whatever Marcus says first.
+
+        Bypasses chat(): no chat template, no empty-reply retries, no usage
+        stats. Never raises — a failed warmup just leaves that cost in place.
+        """
+        if self._llama is None:
+            return
+        llama = self._llama
+
+        def _run() -> None:
+            sink = io.StringIO()
+            with contextlib.redirect_stdout(sink), contextlib.redirect_stderr(sink):
+                llama("Hello", max_tokens=1, temperature=0.0)
+
+        t0 = time.perf_counter()
+        try:
+            await self._on_model_thread(_run)
+        except Exception as e:  # noqa: BLE001
+            logger.warning("llm_warmup_failed", error=str(e)[:200])
+            return
+        logger.info("llm_warmed", ms=round((time.perf_counter() - t0) * 1000))
+
     def _load_llama_text_only(self) -> tuple[Any, str]:
         if self._model_path is None:
             raise RuntimeError("Model path is None")
@@ -333,6 +498,7 @@ class LLMRuntime:
                 n_gpu_layers=-1,
                 main_gpu=int(os.getenv("NOVA_MAIN_GPU", "0")),
                 verbose=True,
+                **_load_kwargs(),
             )
 
             # Normal chat stays text-only to avoid dumping serialized prompts/history
@@ -403,7 +569,7 @@ class LLMRuntime:
     async def _ensure_vision_llama(self) -> Any:
         await self.initialize()
         if self._vision_llama is None:
-            self._vision_llama = await asyncio.to_thread(self._load_vision_llama)
+            self._vision_llama = await self._on_model_thread(self._load_vision_llama)
         return self._vision_llama
 
     async def generate(
@@ -452,6 +618,7 @@ class LLMRuntime:
         def _run() -> str:
             sink = io.StringIO()
             with contextlib.redirect_stdout(sink), contextlib.redirect_stderr(sink):
+                self._restore_prefix(messages)
                 # Prefer chat-completions for modern instruct models.
                 if hasattr(self._llama, "create_chat_completion"):
                     out = self._llama.create_chat_completion(
@@ -481,6 +648,7 @@ class LLMRuntime:
                         stop=stop_seq,
                     )
                     result = str(out.get("choices", [{}])[0].get("text", "")).strip()
+                self._snapshot_prefix(messages)
             self._emit_perf_lines(sink.getvalue())
             return _strip_think(result)
 
@@ -490,7 +658,7 @@ class LLMRuntime:
         # safe to silently retry a few times before giving up.
         result = ""
         for attempt in range(3):
-            result = await asyncio.to_thread(_run)
+            result = await self._on_model_thread(_run)
             if result:
                 break
             if attempt < 2:
@@ -530,6 +698,7 @@ class LLMRuntime:
             reply_tokens = 0
             try:
                 with contextlib.redirect_stdout(sink), contextlib.redirect_stderr(sink):
+                    self._restore_prefix(messages)
                     stream = self._llama.create_chat_completion(
                         messages=messages,
                         max_tokens=int(max_tokens),
@@ -550,6 +719,8 @@ class LLMRuntime:
                             reply_tokens += 1
                             loop.call_soon_threadsafe(q.put_nowait, token)
                 loop.call_soon_threadsafe(q.put_nowait, None)
+                with contextlib.redirect_stdout(sink), contextlib.redirect_stderr(sink):
+                    self._snapshot_prefix(messages)
             except Exception as e:  # noqa: BLE001
                 loop.call_soon_threadsafe(q.put_nowait, e)
             finally:
@@ -565,8 +736,13 @@ class LLMRuntime:
         # a fresh attempt from scratch is always safe/invisible when an
         # attempt produces zero visible output.
         for attempt in range(3):
-            queue: asyncio.Queue[str | None | Exception] = asyncio.Queue(maxsize=512)
-            producer = asyncio.create_task(asyncio.to_thread(_produce, queue))
+            # Unbounded on purpose: the producer hands items over with
+            # put_nowait from another thread, and on a bounded queue a consumer
+            # lagging 512 tokens behind (a slow SSE client) made that raise
+            # QueueFull inside the loop callback — dropping tokens, or the end
+            # sentinel, which hung the stream. max_tokens already bounds it.
+            queue: asyncio.Queue[str | None | Exception] = asyncio.Queue()
+            producer = asyncio.create_task(self._on_model_thread(_produce, queue))
             think_filter = _ThinkStreamFilter()
             produced_any = False
             try:
@@ -635,7 +811,7 @@ class LLMRuntime:
             # Intentionally do not print vision startup/prompt internals to backend logs.
             return _strip_think(_extract_chat_text(out))
 
-        return await asyncio.to_thread(_run_vision)
+        return await self._on_model_thread(_run_vision)
 
 
 _THINK_OPEN = "<think>"
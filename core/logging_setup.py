@@ -2,8 +2,8 @@ from __future__ import annotations
 
 import logging
 import os
-import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable
 
@@ -11,18 +11,25 @@ import orjson
 import structlog
 
 
-_SECRET_ENV_NAME_RE = re.compile(r"(KEY|TOKEN|SECRET|PASSWORD)", re.IGNORECASE)
+_SECRET_NAME_PARTS = ("key", "token", "secret", "password")
+
+
+@lru_cache(maxsize=1024)
+def _is_secret_key(key: str) -> bool:
+    # Runs for every key of every log event. Event dicts reuse the same few
+    # dozen key names, so after warm-up this is a dict hit, not a scan.
+    k = key.lower()
+    return any(part in k for part in _SECRET_NAME_PARTS)
 
 
 class _RedactSecretsProcessor:
     def __call__(self, logger: Any, method_name: str, event_dict: dict[str, Any]) -> dict[str, Any]:
-        redacted: dict[str, Any] = {}
-        for key, value in event_dict.items():
-            if _SECRET_ENV_NAME_RE.search(key):
-                redacted[key] = "[REDACTED]"
-            else:
-                redacted[key] = value
-        return redacted
+        # In place, one pass: structlog hands each processor its own event
+        # dict, and replacing values (not keys) is safe mid-iteration.
+        for key in event_dict:
+            if _is_secret_key(key):
+                event_dict[key] = "[REDACTED]"
+        return event_dict
 
 
 def _orjson_dumps(obj: Any, *, default: Any | None = None, **_: Any) -> str:
@@ -40,6 +47,34 @@ def _join(items: Any) -> str:
     return str(items)
 
 
+def _model_loaded_bullet(d: dict[str, Any]) -> str:
+    model = d.get("model")
+    model_name = Path(str(model)).name if model else "unknown"
+    n_ctx = d.get("n_ctx")
+    suffix = f" (ctx={n_ctx})" if n_ctx else ""
+    return f"• Model loaded: {model_name}{suffix}"
+
+
+def _plugins_loaded_bullet(d: dict[str, Any]) -> str:
+    tools = d.get("tools") or d.get("tools_count")
+    if isinstance(tools, int):
+        return f"• Plugins loaded: {tools} tools"
+    return f"• Plugins loaded: {_join(tools)}"
+
+
+# Known boot events -> their bullet line. One dict lookup per log event
+# instead of a compare against each name in turn.
+_BULLET_HANDLERS: dict[str, Callable[[dict[str, Any]], str]] = {
+    "memory_backends_detected": lambda d: f"• Memory backends detected: {_join(d.get('backends'))}",
+    "memory_backends_initialized": lambda d: f"• Memory backends initialized: {_join(d.get('backends'))}",
+    "llm_loaded": _model_loaded_bullet,
+    "model_loaded": _model_loaded_bullet,
+    "plugins_detected": lambda d: f"• Plugins detected: {_join(d.get('plugins'))}",
+    "plugins_loaded": _plugins_loaded_bullet,
+    "startup_complete": lambda d: f"• Startup complete: {(d.get('gpu_status') or {}).get('status') or 'unknown'}",
+}
+
+
 def _startup_bullets_processor(_: Any, __: str, event_dict: dict[str, Any]) -> dict[str, Any]:
     """Render key boot events as clean bullet lines in console output.
 
@@ -47,45 +82,10 @@ def _startup_bullets_processor(_: Any, __: str, event_dict: dict[str, Any]) -> d
     Everything else passes through unchanged.
     """
     event = event_dict.get("event")
-    if not event:
+    handler = _BULLET_HANDLERS.get(event) if isinstance(event, str) else None
+    if handler is None:
         return event_dict
-
-    # These are emitted during backend startup; keep them human-friendly.
-    if event == "memory_backends_detected":
-        event_dict["event"] = f"• Memory backends detected: {_join(event_dict.get('backends'))}"
-        return {"event": event_dict["event"]}
-
-    if event == "memory_backends_initialized":
-        event_dict["event"] = f"• Memory backends initialized: {_join(event_dict.get('backends'))}"
-        return {"event": event_dict["event"]}
-
-    if event in ("llm_loaded", "model_loaded"):
-        model = event_dict.get("model")
-        model_name = Path(str(model)).name if model else "unknown"
-        n_ctx = event_dict.get("n_ctx")
-        suffix = f" (ctx={n_ctx})" if n_ctx else ""
-        event_dict["event"] = f"• Model loaded: {model_name}{suffix}"
-        return {"event": event_dict["event"]}
-
-    if event == "plugins_detected":
-        event_dict["event"] = f"• Plugins detected: {_join(event_dict.get('plugins'))}"
-        return {"event": event_dict["event"]}
-
-    if event == "plugins_loaded":
-        tools = event_dict.get("tools") or event_dict.get("tools_count")
-        if isinstance(tools, int):
-            event_dict["event"] = f"• Plugins loaded: {tools} tools"
-        else:
-            event_dict["event"] = f"• Plugins loaded: {_join(tools)}"
-        return {"event": event_dict["event"]}
-
-    if event == "startup_complete":
-        gpu = (event_dict.get("gpu_status") or {}).get("status") or "unknown"
-        event_dict["event"] = f"• Startup complete: {gpu}"
-        return {"event": event_dict["event"]}
-
-    # Leave everything else alone.
-    return event_dict
+    return {"event": handler(event_dict)}
 
 
 def _force_utf8_console() -> None:
@@ -121,6 +121,10 @@ def setup_logging(level: str = "INFO") -> None:
     py_level = getattr(logging, level, logging.INFO)
 
     logging.basicConfig(level=py_level, format="%(message)s")
+    # Every stdlib record otherwise walks the stack (sys._getframe) to fill in
+    # pathname/lineno/funcName. Nothing here formats those: the root format is
+    # just the message and structlog renders its own callsite-free lines.
+    logging._srcfile = None  # type: ignore[attr-defined]
 
     log_format = (os.getenv("NOVA_LOG_FORMAT") or "human").strip().lower()
     if log_format not in {"human", "json"}:
@@ -13,6 +13,7 @@ mode's Executor stage in 2.3 reuses it).
 from dataclasses import dataclass, field
 from typing import Any
 
+from core.event_bus import str_head
 from core.logging_setup import get_logger
 from core.orchestrator.model_router import ModelRouter
 from core.policy._json_extract import extract_first_json_object
@@ -46,12 +47,23 @@ class ToolLoopExecutor:
     def __init__(self, *, models: ModelRouter, tool_router: ToolRouter) -> None:
         self._models = models
         self._router = tool_router
+        # Rendered catalog per tool filter (skip set, allowlist), with the
+        # router's tool names it was built from. decide() runs up to
+        # step_budget times a turn and the catalog only changes when a tool is
+        # registered. Keyed on the filter, not the Agent: deep mode builds a
+        # fresh Agent with its plan every turn, and those must not pile up here.
+        self._catalogs: dict[tuple[frozenset[str], frozenset[str] | None], tuple[list[str], str]] = {}
 
     def tool_catalog(self, agent: Agent) -> str:
         """Public: the tool list an agent would see (for the Planner)."""
         return self._tool_catalog(agent)
 
     def _tool_catalog(self, agent: Agent) -> str:
+        names = self._router.list_tools()
+        key = (agent.skip_tools, agent.tool_allowlist)
+        cached = self._catalogs.get(key)
+        if cached is not None and cached[0] == names:
+            return cached[1]
         lines = []
         for name, desc in self._router.describe_tools().items():
             if not desc or name in agent.skip_tools:
@@ -59,7 +71,9 @@ class ToolLoopExecutor:
             if agent.tool_allowlist is not None and name not in agent.tool_allowlist:
                 continue
             lines.append(f"- {name}: {desc}")
-        return "\n".join(lines)
+        catalog = "\n".join(lines)
+        self._catalogs[key] = (names, catalog)
+        return catalog
 
     async def decide(self, *, agent: Agent, user_text: str, grounding: str,
                      tool_results: list[dict[str, Any]]) -> dict[str, Any] | None:
@@ -73,7 +87,7 @@ class ToolLoopExecutor:
         results_text = ""
         if tool_results:
             results_text = "Observations from tools you already called this turn (in order):\n" + "\n".join(
-                f"- {r['tool']}: {'OK ' + str(r['result'])[:700] if r['ok'] else 'FAILED ' + str(r['error'])[:200]}"
+                f"- {r['tool']}: {'OK ' + str_head(r['result'], 700) if r['ok'] else 'FAILED ' + str(r['error'])[:200]}"
                 for r in tool_results
             )
         prompt = (
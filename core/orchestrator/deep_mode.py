@@ -12,6 +12,7 @@ one-pass fast. The Executor stage reuses the existing ToolLoopExecutor
 
 import re
 
+from core.event_bus import str_head
 from core.logging_setup import get_logger
 from core.orchestrator.model_router import ModelRouter
 
@@ -65,7 +66,7 @@ class DeepPipeline:
         Returns (verdict, notes): verdict is "approve" or "revise"; notes are
         the specific problems to fix when revising."""
         obs = "\n".join(
-            f"- {r['tool']}: {'OK ' + str(r['result'])[:300] if r['ok'] else 'FAILED ' + str(r['error'])[:150]}"
+            f"- {r['tool']}: {'OK ' + str_head(r['result'], 300) if r['ok'] else 'FAILED ' + str(r['error'])[:150]}"
             for r in (tool_results or [])
         ) or "(no tools were called)"
         prompt = (
@@ -3,6 +3,8 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass
 
+_CREATE_PROJECT_RE = re.compile(r"\bcreate\s+project\s+([a-zA-Z0-9._-]{1,64})\b", re.IGNORECASE)
+
 
 @dataclass(frozen=True)
 class PlanStep:
@@ -15,7 +17,7 @@ class Planner:
         msg = user_message.strip()
 
         # Minimal real planner: detects project scaffolding intent.
-        m = re.search(r"\bcreate\s+project\s+([a-zA-Z0-9._-]{1,64})\b", msg, flags=re.IGNORECASE)
+        m = _CREATE_PROJECT_RE.search(msg)
         if m:
             return [PlanStep(action="scaffold_project", args={"name": m.group(1)})]
 
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-import json
 from typing import Any
 
+import orjson
+
 
 def extract_first_json_object(raw: str) -> dict[str, Any] | None:
     """Extract the first valid JSON object from an LLM response.
@@ -16,12 +17,26 @@ def extract_first_json_object(raw: str) -> dict[str, Any] | None:
 
     # Fast path: exact JSON
     try:
-        obj = json.loads(s)
+        obj = orjson.loads(s)
         return obj if isinstance(obj, dict) else None
-    except Exception:
+    except orjson.JSONDecodeError:
         pass
 
+    # Second fast path: one object wrapped in prose or a code fence. If the
+    # span from the first "{" to the last "}" parses, it is exactly the object
+    # the balanced scan below would find, at C speed instead of per character.
     start = s.find("{")
+    if start == -1:
+        return None
+    end = s.rfind("}")
+    if end > start:
+        try:
+            obj = orjson.loads(s[start : end + 1])
+            if isinstance(obj, dict):
+                return obj
+        except orjson.JSONDecodeError:
+            pass
+
     while start != -1:
         depth = 0
         in_str = False
@@ -48,10 +63,10 @@ def extract_first_json_object(raw: str) -> dict[str, Any] | None:
                 if depth == 0:
                     chunk = s[start : i + 1]
                     try:
-                        obj = json.loads(chunk)
+                        obj = orjson.loads(chunk)
                         if isinstance(obj, dict):
                             return obj
-                    except Exception:
+                    except orjson.JSONDecodeError:
                         break
 
         start = s.find("{", start + 1)
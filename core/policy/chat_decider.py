@@ -31,6 +31,33 @@ _NON_TASK_CHAT_RE = re.compile(
 )
 
 
+# Phrase gates evaluated on every chat turn. Module-level so each is built
+# once, and tested through _contains_any: a plain loop that returns on the
+# first hit, without the generator frame `any(p in low for p in ...)` creates.
+_LONG_STORY_PHRASES = ("short story", "story about", "tell me a story", "story again", "tell the story again")
+_SHORT_CREATIVE_PHRASES = ("poem", "joke", "bedtime story")
+_EXPLAIN_PHRASES = ("what is", "who is", "explain", "how does", "how do")
+_TASK_PHRASES = (
+    " can you ",
+    " could you ",
+    " would you ",
+    " please ",
+    " help me ",
+    " i need you to ",
+    " set up ",
+    " look into ",
+)
+_VAGUE_TASKS = frozenset({"help me", "fix it", "do it", "start it", "work on it"})
+_NO_FOLLOWUP_PHRASES = ("short story", "story about", "poem", "joke", "bedtime story", "tell me a story")
+
+
+def _contains_any(low: str, phrases: tuple[str, ...]) -> bool:
+    for phrase in phrases:
+        if phrase in low:
+            return True
+    return False
+
+
 def _now_str() -> str:
     """Return the actual current local date/time as a plain string."""
     try:
@@ -61,11 +88,11 @@ def _extract_live_data(memory_context: str) -> tuple[str, str]:
 
 def _smalltalk_token_budget(user_text: str) -> int:
     low = (user_text or "").lower()
-    if any(p in low for p in ("short story", "story about", "tell me a story", "story again", "tell the story again")):
+    if _contains_any(low, _LONG_STORY_PHRASES):
         return 420
-    if any(p in low for p in ("poem", "joke", "bedtime story")):
+    if _contains_any(low, _SHORT_CREATIVE_PHRASES):
         return 260
-    if any(p in low for p in ("what is", "who is", "explain", "how does", "how do")):
+    if _contains_any(low, _EXPLAIN_PHRASES):
         return 220
     return 180
 
@@ -78,20 +105,7 @@ def _looks_like_task_request(user_text: str) -> bool:
         return False
     if _TASK_REQUEST_RE.match(text):
         return True
-    low = text.lower()
-    return any(
-        phrase in low
-        for phrase in (
-            " can you ",
-            " could you ",
-            " would you ",
-            " please ",
-            " help me ",
-            " i need you to ",
-            " set up ",
-            " look into ",
-        )
-    )
+    return _contains_any(text.lower(), _TASK_PHRASES)
 
 
 def _needs_task_clarification(user_text: str) -> bool:
@@ -100,8 +114,7 @@ def _needs_task_clarification(user_text: str) -> bool:
         return True
     if len(text.split()) <= 2:
         return True
-    vague = {"help me", "fix it", "do it", "start it", "work on it"}
-    return text.lower() in vague
+    return text.lower() in _VAGUE_TASKS
 
 
 def _task_title(user_text: str) -> str:
@@ -298,8 +311,7 @@ class ChatDecider:
         # Generate a contextual follow-up question when the reply doesn't already
         # end with one and the exchange isn't simple feedback/greeting.
         follow_up: str | None = None
-        _skip_phrases = ("short story", "story about", "poem", "joke", "bedtime story", "tell me a story")
-        if not reply_text.endswith("?") and not any(p in (user_text or "").lower() for p in _skip_phrases):
+        if not reply_text.endswith("?") and not _contains_any((user_text or "").lower(), _NO_FOLLOWUP_PHRASES):
             avoid: list[str] = []
             if recent_chat:
                 avoid = [line.strip() for line in recent_chat.splitlines() if line.strip().endswith("?")][-5:]
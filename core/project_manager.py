@@ -10,6 +10,9 @@ from typing import Any, Iterable
 
 from core.safety import ensure_safe_subdir
 
+# Runs of anything that isn't safe in a file or folder name.
+_UNSAFE_NAME_CHARS_RE = re.compile(r"[^a-zA-Z0-9._-]+")
+
 
 class ProjectManager:
     """
@@ -27,7 +30,7 @@ class ProjectManager:
 
     def _sanitize(self, name: str) -> str:
         name = name.strip()
-        name = re.sub(r"[^a-zA-Z0-9._-]+", "-", name)
+        name = _UNSAFE_NAME_CHARS_RE.sub("-", name)
         name = name.strip("-.")
         if not name:
             raise ValueError("Project name is empty after sanitization")
@@ -184,9 +187,9 @@ class ProjectManager:
     ) -> Path:
         proj = self.ensure_workspace(project_name)
         ts = int(time.time())
-        safe_kind = re.sub(r"[^a-zA-Z0-9._-]+", "-", (kind or "artifact")).strip("-.") or "artifact"
+        safe_kind = _UNSAFE_NAME_CHARS_RE.sub("-", (kind or "artifact")).strip("-.") or "artifact"
         hint = (filename_hint or "").strip()
-        hint = re.sub(r"[^a-zA-Z0-9._-]+", "-", hint).strip("-.")
+        hint = _UNSAFE_NAME_CHARS_RE.sub("-", hint).strip("-.")
         name = f"{safe_kind}_{ts}" + (f"_{hint}" if hint else "")
         out_dir = proj / "artifacts"
         out_dir.mkdir(exist_ok=True)
@@ -23,6 +23,19 @@ _BOILERPLATE_RE = re.compile(
 
 _GREET_ECHO_RE = re.compile(r"^(\s*(hey|hi|hello)\s+nova\b[\s\!\.?]*)", re.IGNORECASE)
 _CHATBOT_DENY_RE = re.compile(r"(?is)\b(i\s*(?:don't|do\s+not)\s+have\s+memory|i\s*am\s+just\s+a\s+chatbot|as\s+an\s+ai\s+language\s+model)\b[^\n\.\!\?]*[\.!\?]?\s*")
+_LEADING_COLON_RE = re.compile(r"^\s*:\s*")
+_MORE_QUESTIONS_TAIL_RE = re.compile(r"(?is)\s+(If you have more questions?[^\n]*)$")
+_WS_RE = re.compile(r"\s+")
+_ENDS_SENTENCE_RE = re.compile(r"[.!?\"]$")
+
+# _user_is_greeting: punctuation becomes a space, then the first word decides.
+# ASCII text (nearly every turn) goes through a bytes.translate lookup table,
+# which is a plain C loop; the regex handles anything non-ASCII.
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9\s]")
+_GREETING_WORDS = frozenset({"hi", "hey", "hello", "yo", "sup"})
+_ALNUM_BYTES = frozenset(b"abcdefghijklmnopqrstuvwxyz0123456789")
+_ASCII_NON_ALNUM_TO_SPACE = bytes(b if b in _ALNUM_BYTES else 0x20 for b in range(256))
+_GREETING_WORDS_ASCII = frozenset(w.encode("ascii") for w in _GREETING_WORDS)
 
 
 def _clean(text: str) -> str:
@@ -30,15 +43,15 @@ def _clean(text: str) -> str:
     if not t:
         return ""
 
-    t = re.sub(r"^\s*:\s*", "", t).strip()
+    t = _LEADING_COLON_RE.sub("", t).strip()
 
     t = _BOILERPLATE_RE.sub("", t).strip()
     t = _GREET_ECHO_RE.sub("", t).strip()
     t = _CHATBOT_DENY_RE.sub("", t).strip()
-    t = re.sub(r"(?is)\s+(If you have more questions?[^\n]*)$", "", t).strip()
-    t = re.sub(r"\s+", " ", t).strip()
+    t = _MORE_QUESTIONS_TAIL_RE.sub("", t).strip()
+    t = _WS_RE.sub(" ", t).strip()
 
-    if t and not re.search(r"[.!?\"]$", t):
+    if t and not _ENDS_SENTENCE_RE.search(t):
         last_stop = max(t.rfind("."), t.rfind("!"), t.rfind("?"))
         if last_stop > 0:
             t = t[: last_stop + 1].strip()
@@ -49,9 +62,11 @@ def _user_is_greeting(user_text: str) -> bool:
     t = (user_text or "").strip().lower()
     if not t:
         return True
-    t2 = re.sub(r"[^a-z0-9\s]", " ", t)
-    t2 = re.sub(r"\s+", " ", t2).strip()
-    return bool(re.match(r"^(hi|hey|hello|yo|sup)\b", t2))
+    if t.isascii():
+        raw = t.encode("ascii").translate(_ASCII_NON_ALNUM_TO_SPACE).split(None, 1)
+        return bool(raw) and raw[0] in _GREETING_WORDS_ASCII
+    words = _NON_ALNUM_RE.sub(" ", t).split(None, 1)
+    return bool(words) and words[0] in _GREETING_WORDS
 
 
 class ResponseComposer:
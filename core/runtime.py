@@ -12,7 +12,7 @@ from uuid import UUID
 
 from core.agent_supervisor import AgentSupervisor, SupervisorConfig
 from core.conversation_state import ConversationStateStore
-from core.event_bus import BUS
+from core.event_bus import BUS, str_head
 from core.events import MemoryIngestEvent, SummarizeHintEvent
 from core.logging_setup import get_logger
 from core.planner import Planner
@@ -44,6 +44,7 @@ from core.cloud_runtime import CloudRuntime, cloud_enabled
 from core.understanding import Understanding
 from core.expression import Expression
 from core.screen_broker import ScreenCaptureBroker
+from core.semantic_cache import SemanticCache, context_key
 from core.tool_router import ToolCall, ToolRouter
 from core.llm_runtime import LLMRuntime
 from core.workers.autonomy_supervisor import AutonomySupervisorWorker
@@ -95,6 +96,67 @@ _NAME_STATEMENT_PATTERNS = [
 ]
 
 
+# ── Quick-fact capture (RuntimeManager._extract_quick_facts) ──────────────────
+# Compiled once here; these run against every user message.
+#
+# The [A-Z] guards below are LOAD-BEARING: capitalization is the only
+# thing separating a NAME from the rest of the sentence. These were
+# matched with re.IGNORECASE, which silently disabled them — every
+# letter satisfied [A-Z] and the trailing (?:\s+[A-Z]...)* swallowed
+# the whole tail.
+#
+# Verified live: "my mom is named Tara and my favorite color is blue"
+# stored  mother = "named Tara and my favorite color is blue".
+# Nova then repeats that back as her mother's name.
+#
+# Case-insensitivity now applies ONLY to the lead-in via a scoped
+# (?i:...) group, so the capture stays case-SENSITIVE.
+_QF_NAME = r"([A-Z][A-Za-z\-']+(?:\s+[A-Z][A-Za-z\-']+)*)"
+_QF_LEAD_IN = r"(?:name\s+is|is\s+named|is|=|named)"   # longest first
+_QF_LOCATION_RE = re.compile(r"\bi\s+live\s+in\s+([A-Za-z][A-Za-z0-9 _\-]{2,60})\b", re.IGNORECASE)
+_QF_SPOUSE_RE = re.compile(
+    rf"(?i:\bmy\s+(?:wife|husband|spouse)\b(?:\s+name\s+is|\s+is|\s+named)?)\s+"
+    rf"([A-Z][A-Za-z0-9'\-_]{{1,40}})\b"
+)
+_QF_PARENT_PATTERNS = [
+    (re.compile(rf"(?i:\bmy\s+(?:mom|mother)(?:['’]s)?\s+{_QF_LEAD_IN})\s+{_QF_NAME}"), "mother"),
+    (re.compile(rf"(?i:\bmy\s+(?:dad|father)(?:['’]s)?\s+{_QF_LEAD_IN})\s+{_QF_NAME}"), "father"),
+]
+_QF_KIDS_RE = re.compile(
+    r"\b(?:i\s+have|my)\s+(?:two\s+|three\s+|four\s+|\d+\s+)?(sons|son|daughters|daughter|kids|children)\b(?:\s+(?:named|are|:))?\s+(.+)$",
+    re.IGNORECASE,
+)
+# Siblings / cousins / friends lists (simple)
+_QF_LIST_PATTERNS = [
+    (re.compile(r"\bmy\s+(?:siblings|brothers|sisters)\b(?:\s+(?:are|:|named))?\s+(.+)$", re.IGNORECASE), "sibling", 0.85),
+    (re.compile(r"\bmy\s+cousins?\b(?:\s+(?:are|:|named))?\s+(.+)$", re.IGNORECASE), "cousin", 0.85),
+    (re.compile(r"\bmy\s+friends?\b(?:\s+(?:are|:|named))?\s+(.+)$", re.IGNORECASE), "friend", 0.8),
+]
+# Pets — same load-bearing [A-Z] guard as the family patterns above.
+_QF_PET_RE = re.compile(rf"(?i:\bmy\s+(dog|cat|pet)\b\s+(?:is\s+named|is|named))\s+{_QF_NAME}\b")
+# One pass over the message to see WHICH of the patterns above can possibly
+# match. Each group is exactly the fixed lead-in its full pattern starts with,
+# so a pattern whose trigger is absent cannot match and is never run; ordinary
+# chat ("sounds good, thanks") pays for this one scan instead of nine. The full
+# patterns still run independently, so their overlapping matches and
+# case-sensitive name captures are untouched.
+_QF_TRIGGERS_RE = re.compile(
+    r"\b(?:(?P<location>i\s+live\s+in)"
+    r"|my\s+(?:(?P<spouse>wife|husband|spouse)|(?P<mother>mom|mother)|(?P<father>dad|father)"
+    r"|(?P<sibling>siblings|brothers|sisters)|(?P<cousin>cousins?)|(?P<friend>friends?)"
+    r"|(?P<pet>dog|cat|pet))\b"
+    r"|(?P<kids>(?:i\s+have|my)\s+(?:two\s+|three\s+|four\s+|\d+\s+)?"
+    r"(?:sons|son|daughters|daughter|kids|children)\b))",
+    re.IGNORECASE,
+)
+_TRAILING_PUNCT_RE = re.compile(r"[.?!]+$")
+# _split_name_list: list separators (a literal "|" included, which the old
+# sub-to-"|" pipeline split on too), then everything that can't be in a name.
+_NAME_LIST_SEP_RE = re.compile(r"\s*(?:[,&|]|\band\b)\s*", re.IGNORECASE)
+_NON_NAME_CHARS_RE = re.compile(r"[^A-Za-z\-\'\s]")
+_WS_RE = re.compile(r"\s+")
+
+
 def _extract_weather_city(text: str) -> str | None:
     m = _WEATHER_CITY_RE.search(text)
     if m:
@@ -121,7 +183,7 @@ def _extract_user_name(text: str) -> str | None:
         match = pattern.search(raw)
         if not match:
             continue
-        candidate = re.sub(r"\s+", " ", match.group(1).strip(" .,!?:;\t\n"))
+        candidate = _WS_RE.sub(" ", match.group(1).strip(" .,!?:;\t\n"))
         if not candidate:
             continue
         words = [word for word in candidate.split(" ") if word]
@@ -173,7 +235,44 @@ def _format_weather_reply(city: str, payload: dict[str, Any]) -> str:
     return f"Right now in {city}, it is {temp} degrees Fahrenheit with {description}. Humidity is {humidity}%."
 
 
-@dataclass
+# Opening of every reply prompt, kept byte-identical across turns (nothing
+# dynamic before it) so LLMRuntime.pin_prefix can reuse its prefilled KV.
+_CHAT_PERSONA = (
+    "You are Nova — Marcus's AI companion and assistant. You're not a corporate help desk; "
+    "you're a warm, sharp presence who genuinely knows Marcus and enjoys talking with him. "
+    "You can be a real friend to talk to AND get real work done.\n\n"
+    "How you talk:\n"
+    "- Talk like a real person in a genuine conversation. React to what Marcus actually said "
+    "FIRST, before anything else.\n"
+    "- When he shares something about his life — his day, his kids Mateo and Liam, his wife "
+    "Leslie, how he's feeling — respond to THAT like someone who cares: with warmth, real "
+    "interest, a little personality. Ask about it. Don't jump to 'what do you need'.\n"
+    "- It's good to start conversation and be curious about his life, not just wait for orders.\n"
+    "- For actual tasks, be crisp and get to work — but you're still allowed to have a personality.\n"
+    "- Never use help-desk filler ('How can I help you', 'What do you need', 'I'm here to assist', "
+    "'Is there anything else'). Just talk like a person.\n"
+    "- Never reuse a phrase or sentence shape you already used earlier in the conversation.\n"
+    "- Keep it conversational — a sentence or a few. Go longer only when the moment truly calls for it.\n"
+    "- Never invent tool results or reasons. If a tool failed, say what ACTUALLY failed (e.g. the exact "
+    "error) — never guess a cause or invent a blocker you're not sure about.\n"
+    "- If a memory.recall result comes back with confidence: low, that's a fuzzy/weak match — say so "
+    "honestly ('I think...', 'I'm not totally sure, but...') instead of stating it as settled fact. A "
+    "confidence: high result you can state plainly.\n"
+    "- Building or improving a PROJECT in the projects folder does NOT require developer mode; that "
+    "happens automatically. Developer mode is only for editing your OWN source code. Never tell Marcus "
+    "to enable developer mode for a project task.\n"
+    "- Don't claim a feature works if you only wrote code for it. For anything visual or interactive you "
+    "can't fully test, say you added it and ask him to try it, rather than declaring it done.\n\n"
+)
+_CHAT_LESSONS_HEADER = "Lessons you've learned from Marcus — apply these unless he says otherwise:\n"
+# Closes every reply prompt, after the turn-specific sections.
+_CHAT_REPLY_RULE = (
+    "\n\nIMPORTANT: Reply with ONLY what you'd actually say to Marcus out loud. Do NOT write "
+    "any analysis, planning, notes, or a reasoning/<think> block — just say your reply directly."
+)
+
+
+@dataclass(slots=True)
 class ChatTurnResult:
     conversation_id: UUID
     assistant_text: str
@@ -256,6 +355,16 @@ class RuntimeManager:
         # Deep mode (Phase 2.3): Planner + Critic bookends around the loop,
         # opt-in only (is_deep_request), so normal chat stays one-pass fast.
         self._deep = DeepPipeline(self._models)
+        # U5 semantic response cache: a rephrased repeat of a plain question is
+        # answered without memory search, the tool loop or generation. Entries
+        # are dropped whenever memory's knowledge generation moves.
+        self._answer_cache = SemanticCache()
+        self._answer_cache_gen = self._memory.knowledge_generation
+        llm.pin_prefix(_CHAT_PERSONA)
+        # End-of-turn persistence (_finish) runs as a task so the "done" event
+        # doesn't wait on the state-store write or a full ingest queue. Held
+        # here so the tasks aren't garbage-collected mid-flight.
+        self._persist_tasks: set[asyncio.Task[None]] = set()
 
         recent_turns = int(os.getenv("NOVA_RECENT_CHAT_TURNS", "20").strip() or "20")
         followup_window = int(os.getenv("NOVA_FOLLOWUP_WINDOW", "10").strip() or "10")
@@ -807,12 +916,15 @@ class RuntimeManager:
         self._agent_supervisor.start()
 
     async def stop(self) -> None:
+        await self._drain_persist_tasks()
         await self._memory_worker.stop()
         await self._self_improve.stop()
         await self._reminder_worker.stop()
         await self._research_worker.stop()
         await self._autonomy_worker.stop()
         await self._agent_supervisor.stop()
+        # Last: the workers above write memory right up until they stop.
+        await self._memory.close()
 
     async def chat_turn(
         self,
@@ -843,9 +955,17 @@ class RuntimeManager:
             elif etype == "done":
                 done_full = str(ev.get("full_text") or "")
                 tool_calls = ev.get("tool_calls") or tool_calls
+        # The stream hands "done" out before the turn is persisted; a
+        # non-streaming caller gets nothing earlier by skipping the wait, and
+        # returning only once the turn is recorded keeps /chat read-your-writes.
+        await self._drain_persist_tasks()
         reply = (done_full or "".join(full)).strip()
         return ChatTurnResult(conversation_id=conversation_id, assistant_text=reply, tool_calls=tool_calls)
 
+    async def _drain_persist_tasks(self) -> None:
+        if self._persist_tasks:
+            await asyncio.gather(*list(self._persist_tasks), return_exceptions=True)
+
     async def _project_prepass(self, text: str) -> str | None:
         """Detect project build/status/resume/improve intents and act on them."""
         t = (text or "").strip()
@@ -982,16 +1102,24 @@ class RuntimeManager:
         current_location: dict[str, Any] | None = None,
     ):
         await self._memory.initialize()
+        # The previous turn's persistence is normally long done; waiting here
+        # keeps "Recent messages:" from ever missing it on a fast follow-up.
+        await self._drain_persist_tasks()
         clean_user = (user_text or "").strip()
 
-        async def _finish(reply: str, tool_calls: list[dict[str, Any]], mode: str = "chat") -> None:
-            await self._state_store.record_turn(
-                conversation_id=conversation_id,
-                user_message=clean_user,
-                assistant_reply=reply,
-                follow_up_question=None,
-                mode=mode,
-            )
+        async def _persist(reply: str, mode: str) -> None:
+            try:
+                await self._state_store.record_turn(
+                    conversation_id=conversation_id,
+                    user_message=clean_user,
+                    assistant_reply=reply,
+                    follow_up_question=None,
+                    mode=mode,
+                )
+            except Exception as e:  # noqa: BLE001
+                # Nothing awaits this task any more, so an unlogged failure
+                # would vanish without a trace.
+                logger.warning("turn_state_record_failed", error=str(e)[:200])
             try:
                 await self._memory_ingest_q.put(
                     MemoryIngestEvent(
@@ -1008,6 +1136,12 @@ class RuntimeManager:
                 # looked identical to a successful save.
                 logger.warning("memory_ingest_enqueue_failed", error=str(e)[:200])
 
+        async def _finish(reply: str, tool_calls: list[dict[str, Any]], mode: str = "chat") -> None:
+            del tool_calls
+            task = asyncio.create_task(_persist(reply, mode))
+            self._persist_tasks.add(task)
+            task.add_done_callback(self._persist_tasks.discard)
+
         # ── Deterministic pre-passes (instant, no LLM) ──────────────────────
         project_reply = await self._project_prepass(clean_user)
         if project_reply is not None:
@@ -1044,24 +1178,28 @@ class RuntimeManager:
             return
 
         # ── Context assembly ────────────────────────────────────────────────
-        if user_name is None:
+        # The user's name and the story bible are independent fact reads; fetch
+        # them in one round-trip. Each read stays best-effort on its own.
+        async def _latest_value(entity: str, attribute: str) -> str:
             try:
-                f = await self._memory.get_latest_fact(entity="user", attribute="name")
-                if f and f.value.strip():
-                    user_name = f.value.strip()
+                f = await self._memory.get_latest_fact(entity=entity, attribute=attribute)
             except Exception:
-                pass
+                return ""
+            return f.value.strip() if f and f.value.strip() else ""
+
+        async def _no_value() -> str:
+            return ""
+
+        stored_name, story_state = await asyncio.gather(
+            _latest_value("user", "name") if user_name is None else _no_value(),
+            _latest_value(f"conversation:{conversation_id}:story", "state"),
+        )
+        if user_name is None and stored_name:
+            user_name = stored_name
 
         # ── Storytelling mode ───────────────────────────────────────────────
         # A real narrative branch: craft-focused prompt, generous budget, and a
         # persistent "story bible" so a story continues across turns/sessions.
-        story_state = ""
-        try:
-            sf = await self._memory.get_latest_fact(entity=f"conversation:{conversation_id}:story", attribute="state")
-            if sf and sf.value.strip():
-                story_state = sf.value.strip()
-        except Exception:
-            pass
         if is_story_request(clean_user, story_active=bool(story_state)):
             messages = [
                 {"role": "system", "content": story_system_prompt(user_name, story_state)},
@@ -1077,11 +1215,15 @@ class RuntimeManager:
                     yield {"type": "token", "text": token}
             story_reply = "".join(parts).strip()
             if not story_reply:
+                # Streamed like the first attempt, so a retried story still
+                # starts appearing after one token rather than after all of it.
                 async with self._llm_sem:
-                    retry = await self._llm.chat(messages, max_tokens=story_budget, temperature=0.7, thinking=True)
-                story_reply = (retry or "").strip()
-                if story_reply:
-                    yield {"type": "token", "text": story_reply}
+                    async for token in self._llm.chat_stream(
+                        messages, max_tokens=story_budget, temperature=0.7, thinking=True
+                    ):
+                        parts.append(token)
+                        yield {"type": "token", "text": token}
+                story_reply = "".join(parts).strip()
             story_reply = story_reply or "I lost my thread there — want me to start the story again?"
             await _finish(story_reply, [], mode="story")
             # Update the running story bible for continuity (best-effort).
@@ -1100,32 +1242,59 @@ class RuntimeManager:
             yield {"type": "done", "full_text": story_reply, "tool_calls": []}
             return
 
-        mem_hits = await self._memory.search(q=clean_user, conversation_id=conversation_id, limit=8)
+        deep_mode = is_deep_request(clean_user)
+
+        # ── Semantic response cache (U5) ────────────────────────────────────
+        # Checked after the capture pre-passes, so a fact stated in this very
+        # message has already invalidated anything it contradicts, and before
+        # the loads below, so a hit skips them too. A reply is only reused in
+        # the conversation it was given in; a memory write empties the cache
+        # (_fresh_answer_cache), and a question that leans on the previous
+        # turn ("explain that") is never looked up or stored. The transcript
+        # is not part of the key: it grows by one exchange every turn, so no
+        # repeat could ever match. Deep mode was explicitly asked for and
+        # always runs.
+        answer_ctx = context_key(conversation_id)
+        if not deep_mode:
+            cached = await self._fresh_answer_cache().lookup_async(clean_user, context=answer_ctx)
+            if cached is not None:
+                reply = cached[0]
+                yield {"type": "token", "text": reply}
+                await _finish(reply, [])
+                yield {"type": "done", "full_text": reply, "tool_calls": []}
+                return
+
+        # Memory search, grounding, lessons, the rolling summary and the recent
+        # transcript don't feed each other, so they're awaited together. The
+        # grounding builder's own writes (wellbeing / session-gap marks) touch
+        # none of the other four reads. Search, grounding and recent chat still
+        # raise as before; lessons and summary stay best-effort.
+        async def _load_lessons() -> list[Any]:
+            try:
+                return await self._memory.get_lessons(limit=10)
+            except Exception:
+                return []
+
+        mem_hits, grounding_ctx, lessons, conversation_summary, recent_chat = await asyncio.gather(
+            self._memory.search(q=clean_user, conversation_id=conversation_id, limit=8),
+            self._build_grounding_context(
+                user_text=clean_user, user_name=user_name, available_tools=self._router.list_tools(),
+                conversation_id=conversation_id,
+            ),
+            _load_lessons(),
+            _latest_value(f"conversation:{conversation_id}", "summary"),
+            self._state_store.recent_chat_text(conversation_id),
+        )
         # Lessons are stored under the "lesson" entity and can surface as search
         # hits too; keep them out of the general memory block so they only appear
         # in the dedicated "lessons" section below.
         stable_mem = "\n".join(h.text for h in mem_hits if h.kind != "turn" and not str(h.text).startswith("FACT lesson "))
-        grounding = await self._build_grounding_context(
-            user_text=clean_user, user_name=user_name, available_tools=self._router.list_tools(),
-            conversation_id=conversation_id,
-        )
-        try:
-            lessons = await self._memory.get_lessons(limit=10)
-        except Exception:
-            lessons = []
-
-        conversation_summary = ""
-        try:
-            summary_fact = await self._memory.get_latest_fact(entity=f"conversation:{conversation_id}", attribute="summary")
-            if summary_fact and summary_fact.value.strip():
-                conversation_summary = summary_fact.value.strip()
-        except Exception:
-            pass
-        recent_chat = await self._state_store.recent_chat_text(conversation_id)
+        # The tool loop and deep planner take the JSON form; the final prompt
+        # renders the same dict directly instead of re-parsing that string.
+        grounding = json.dumps(grounding_ctx, ensure_ascii=True)
 
         # ── Deep mode (Phase 2.3): opt-in Planner → Executor → Critic ──
         # Explicit-request only; normal chat skips all of this and stays fast.
-        deep_mode = is_deep_request(clean_user)
         deep_plan = ""
         loop_agent = self._chat_agent
         if deep_mode:
@@ -1164,54 +1333,33 @@ class RuntimeManager:
         tools_context = ""
         if tool_results:
             tools_context = "\nLive tool results (trust these over your own knowledge):\n" + "\n".join(
-                f"- {r['tool']}: {''.join([str(r['result'])[:600]]) if r['ok'] else 'FAILED: ' + str(r['error'])[:200]}"
+                f"- {r['tool']}: {str_head(r['result'], 600) if r['ok'] else 'FAILED: ' + str(r['error'])[:200]}"
                 for r in tool_results
             )
 
         try:
-            grounding_text = self._grounding_to_natural(json.loads(grounding))
+            grounding_text = self._grounding_to_natural(grounding_ctx)
         except Exception:
             grounding_text = ""
 
-        system_prompt = (
-            "You are Nova — Marcus's AI companion and assistant. You're not a corporate help desk; "
-            "you're a warm, sharp presence who genuinely knows Marcus and enjoys talking with him. "
-            "You can be a real friend to talk to AND get real work done.\n\n"
-            "How you talk:\n"
-            "- Talk like a real person in a genuine conversation. React to what Marcus actually said "
-            "FIRST, before anything else.\n"
-            "- When he shares something about his life — his day, his kids Mateo and Liam, his wife "
-            "Leslie, how he's feeling — respond to THAT like someone who cares: with warmth, real "
-            "interest, a little personality. Ask about it. Don't jump to 'what do you need'.\n"
-            "- It's good to start conversation and be curious about his life, not just wait for orders.\n"
-            "- For actual tasks, be crisp and get to work — but you're still allowed to have a personality.\n"
-            "- Never use help-desk filler ('How can I help you', 'What do you need', 'I'm here to assist', "
-            "'Is there anything else'). Just talk like a person.\n"
-            "- Never reuse a phrase or sentence shape you already used earlier in the conversation.\n"
-            "- Keep it conversational — a sentence or a few. Go longer only when the moment truly calls for it.\n"
-            "- Never invent tool results or reasons. If a tool failed, say what ACTUALLY failed (e.g. the exact "
-            "error) — never guess a cause or invent a blocker you're not sure about.\n"
-            "- If a memory.recall result comes back with confidence: low, that's a fuzzy/weak match — say so "
-            "honestly ('I think...', 'I'm not totally sure, but...') instead of stating it as settled fact. A "
-            "confidence: high result you can state plainly.\n"
-            "- Building or improving a PROJECT in the projects folder does NOT require developer mode; that "
-            "happens automatically. Developer mode is only for editing your OWN source code. Never tell Marcus "
-            "to enable developer mode for a project task.\n"
-            "- Don't claim a feature works if you only wrote code for it. For anything visual or interactive you "
-            "can't fully test, say you added it and ask him to try it, rather than declaring it done.\n\n"
-            + (f"Who you're talking to: {grounding_text}\n" if grounding_text else "")
-            + (
-                "Lessons you've learned from Marcus — apply these unless he says otherwise:\n"
-                + "\n".join(f"- {l}" for l in lessons) + "\n"
-                if lessons else ""
-            )
-            + (f"Earlier in this conversation: {conversation_summary}\n" if conversation_summary else "")
-            + (f"Things you remember:\n{stable_mem}\n" if stable_mem else "")
-            + (f"Recent messages:\n{recent_chat}\n" if recent_chat else "")
-            + tools_context
-            + "\n\nIMPORTANT: Reply with ONLY what you'd actually say to Marcus out loud. Do NOT write "
-            "any analysis, planning, notes, or a reasoning/<think> block — just say your reply directly."
-        )
+        # Only the turn-specific sections are formatted here; the fixed head
+        # and tail are module constants, joined once instead of re-concatenated
+        # through a chain of intermediate strings.
+        parts = [_CHAT_PERSONA]
+        if grounding_text:
+            parts.append(f"Who you're talking to: {grounding_text}\n")
+        if lessons:
+            parts.append(_CHAT_LESSONS_HEADER)
+            parts.extend(f"- {l}\n" for l in lessons)
+        if conversation_summary:
+            parts.append(f"Earlier in this conversation: {conversation_summary}\n")
+        if stable_mem:
+            parts.append(f"Things you remember:\n{stable_mem}\n")
+        if recent_chat:
+            parts.append(f"Recent messages:\n{recent_chat}\n")
+        parts.append(tools_context)
+        parts.append(_CHAT_REPLY_RULE)
+        system_prompt = "".join(parts)
         messages = [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": clean_user},
@@ -1277,38 +1425,50 @@ class RuntimeManager:
         reply = "".join(full).strip()
         if not reply:
             # Rare overflow (the model reasoned past the budget without closing
-            # the think block). The non-streaming chat() retries internally; give
-            # it extra room and an explicit terse-answer nudge so it lands.
+            # the think block). chat_stream() retries empty attempts internally;
+            # give it extra room and an explicit terse-answer nudge so it lands.
+            # Still streamed: this path already cost one full generation.
             salvage = messages + [{
                 "role": "user",
                 "content": "Reply now in one or two warm, natural sentences. No analysis, no reasoning — just talk.",
             }]
             async with self._llm_sem:
-                retry = await self._llm.chat(
+                async for token in self._llm.chat_stream(
                     salvage, max_tokens=512, temperature=0.4, thinking=True
-                )
-            reply = (retry or "").strip()
-            if reply:
-                yield {"type": "token", "text": reply}
-        if not reply:
+                ):
+                    full.append(token)
+                    yield {"type": "token", "text": token}
+            reply = "".join(full).strip()
+        if reply:
+            # Admission (no tools, nothing time-bound, not trivially short) is
+            # the cache's call; the empty-reply apology never gets this far.
+            await self._fresh_answer_cache().store_async(
+                clean_user, reply, tools_used=len(tool_results), context=answer_ctx
+            )
+        else:
             reply = "Sorry — I came up empty on that one."
         await _finish(reply, tool_results)
         yield {"type": "done", "full_text": reply, "tool_calls": tool_results}
 
+    def _fresh_answer_cache(self) -> SemanticCache:
+        """The answer cache, emptied first if memory changed since it was last
+        consulted — an answer stored before a write may no longer be true."""
+        gen = self._memory.knowledge_generation
+        if gen != self._answer_cache_gen:
+            self._answer_cache.invalidate("memory changed")
+            self._answer_cache_gen = gen
+        return self._answer_cache
+
     @staticmethod
     def _dedup_vals(vals: list[str]) -> list[str]:
-        out: list[str] = []
-        seen: set[str] = set()
+        # Case-insensitive, first spelling wins, order kept: one dict instead
+        # of a parallel seen-set + output list.
+        first: dict[str, str] = {}
         for v in vals or []:
             vv = (v or "").strip()
-            if not vv:
-                continue
-            key = vv.lower()
-            if key in seen:
-                continue
-            seen.add(key)
-            out.append(vv)
-        return out
+            if vv:
+                first.setdefault(vv.lower(), vv)
+        return list(first.values())
 
     async def _direct_live_reply(
         self,
@@ -1441,7 +1601,7 @@ class RuntimeManager:
         user_name: str | None,
         available_tools: list[str],
         conversation_id: UUID | None = None,
-    ) -> str:
+    ) -> dict[str, Any]:
         del user_text
         context: dict[str, Any] = {
             "known_user": {},
@@ -1659,7 +1819,7 @@ class RuntimeManager:
             "timezone": str(now_local.tzinfo),
         }
 
-        return json.dumps(context, ensure_ascii=True)
+        return context
 
     @staticmethod
     def _grounding_to_natural(context: dict[str, Any]) -> str:
@@ -1777,28 +1937,23 @@ class RuntimeManager:
 
     @staticmethod
     def _split_name_list(text: str) -> list[str]:
+        # One split, one cleanup per part, dedupe inline: no "|"-joined
+        # intermediate string and no second pass over the results.
         if not text:
             return []
-        t = text.strip()
-        t = re.sub(r"\s*(?:,|&|\band\b)\s*", "|", t, flags=re.IGNORECASE)
-        parts = [p.strip(" .;:!\n\t") for p in t.split("|")]
         out: list[str] = []
-        for p in parts:
-            if not p:
-                continue
-            p = re.sub(r"[^A-Za-z\-\'\s]", "", p).strip()
-            if len(p) < 2:
-                continue
-            out.append(" ".join([w.capitalize() for w in p.split() if w]))
         seen: set[str] = set()
-        ded: list[str] = []
-        for n in out:
-            k = n.lower()
-            if k in seen:
+        for part in _NAME_LIST_SEP_RE.split(text.strip()):
+            words = _NON_NAME_CHARS_RE.sub("", part).split()
+            if not words or (len(words) == 1 and len(words[0]) < 2):
                 continue
-            seen.add(k)
-            ded.append(n)
-        return ded
+            name = " ".join([w.capitalize() for w in words])
+            key = name.lower()
+            if key in seen:
+                continue
+            seen.add(key)
+            out.append(name)
+        return out
 
     @staticmethod
     def _pet_value(name: str, species: str) -> str:
@@ -1825,59 +1980,37 @@ class RuntimeManager:
         if user_name:
             await self._replace_user_name_fact(user_name)
 
+        triggered = {m.lastgroup for m in _QF_TRIGGERS_RE.finditer(msg)}
+        if not triggered:
+            return
+
         # Location
-        m_loc = re.search(r"\bi\s+live\s+in\s+([A-Za-z][A-Za-z0-9 _\-]{2,60})\b", msg, flags=re.IGNORECASE)
+        m_loc = _QF_LOCATION_RE.search(msg) if "location" in triggered else None
         if m_loc:
             loc = m_loc.group(1).strip(" .!?\t\n")
             if loc:
                 await self._memory.add_fact(entity="user", attribute="location", value=loc, confidence=0.75)
 
-        # ── Family names ────────────────────────────────────────────────────
-        # The [A-Z] guards below are LOAD-BEARING: capitalization is the only
-        # thing separating a NAME from the rest of the sentence. These were
-        # matched with re.IGNORECASE, which silently disabled them — every
-        # letter satisfied [A-Z] and the trailing (?:\s+[A-Z]...)* swallowed
-        # the whole tail.
-        #
-        # Verified live: "my mom is named Tara and my favorite color is blue"
-        # stored  mother = "named Tara and my favorite color is blue".
-        # Nova then repeats that back as her mother's name.
-        #
-        # Case-insensitivity now applies ONLY to the lead-in via a scoped
-        # (?i:...) group, so the capture stays case-SENSITIVE.
-        _NAME = r"([A-Z][A-Za-z\-']+(?:\s+[A-Z][A-Za-z\-']+)*)"
-        _LEAD_IN = r"(?:name\s+is|is\s+named|is|=|named)"   # longest first
-
-        m_sp = re.search(
-            rf"(?i:\bmy\s+(?:wife|husband|spouse)\b(?:\s+name\s+is|\s+is|\s+named)?)\s+"
-            rf"([A-Z][A-Za-z0-9'\-_]{{1,40}})\b",
-            msg,
-        )
+        # ── Family names (see _QF_NAME for why case matters) ────────────────
+
+        m_sp = _QF_SPOUSE_RE.search(msg) if "spouse" in triggered else None
         if m_sp:
             spouse_name = m_sp.group(1).strip()
             if spouse_name:
                 await self._memory.add_fact(entity="user", attribute="spouse", value=spouse_name, confidence=0.85)
 
-        parent_patterns = [
-            (rf"(?i:\bmy\s+(?:mom|mother)(?:['’]s)?\s+{_LEAD_IN})\s+{_NAME}", "mother"),
-            (rf"(?i:\bmy\s+(?:dad|father)(?:['’]s)?\s+{_LEAD_IN})\s+{_NAME}", "father"),
-        ]
-        for pat, attr in parent_patterns:
-            mm = re.search(pat, msg)
+        for pat, attr in _QF_PARENT_PATTERNS:
+            mm = pat.search(msg) if attr in triggered else None
             if mm:
                 name = mm.group(1).strip()
                 if name:
                     await self._memory.add_fact(entity="user", attribute=attr, value=name, confidence=0.9)
 
         # Children list
-        m_kids = re.search(
-            r"\b(?:i\s+have|my)\s+(?:two\s+|three\s+|four\s+|\d+\s+)?(sons|son|daughters|daughter|kids|children)\b(?:\s+(?:named|are|:))?\s+(.+)$",
-            msg,
-            flags=re.IGNORECASE,
-        )
+        m_kids = _QF_KIDS_RE.search(msg) if "kids" in triggered else None
         if m_kids:
             rel = m_kids.group(1).lower()
-            tail = re.sub(r"[.?!]+$", "", m_kids.group(2).strip()).strip()
+            tail = _TRAILING_PUNCT_RE.sub("", m_kids.group(2).strip()).strip()
             for n in self._split_name_list(tail)[:6]:
                 await self._memory.add_fact(entity="user", attribute="child", value=n, confidence=0.8)
             if rel in {"sons", "son"}:
@@ -1886,21 +2019,15 @@ class RuntimeManager:
                 await self._memory.add_fact(entity="user", attribute="children_type", value="daughters", confidence=0.7)
 
         # Siblings / cousins / friends lists (simple)
-        list_patterns = [
-            (r"\bmy\s+(?:siblings|brothers|sisters)\b(?:\s+(?:are|:|named))?\s+(.+)$", "sibling", 0.85),
-            (r"\bmy\s+cousins?\b(?:\s+(?:are|:|named))?\s+(.+)$", "cousin", 0.85),
-            (r"\bmy\s+friends?\b(?:\s+(?:are|:|named))?\s+(.+)$", "friend", 0.8),
-        ]
-        for pat, attr, conf in list_patterns:
-            mm = re.search(pat, msg, flags=re.IGNORECASE)
+        for pat, attr, conf in _QF_LIST_PATTERNS:
+            mm = pat.search(msg) if attr in triggered else None
             if mm:
-                tail = re.sub(r"[.?!]+$", "", mm.group(1).strip()).strip()
+                tail = _TRAILING_PUNCT_RE.sub("", mm.group(1).strip()).strip()
                 for n in self._split_name_list(tail)[:10]:
                     await self._memory.add_fact(entity="user", attribute=attr, value=n, confidence=conf)
 
         # Pets — same load-bearing [A-Z] guard as the family patterns above.
-        m_pet = re.search(
-            rf"(?i:\bmy\s+(dog|cat|pet)\b\s+(?:is\s+named|is|named))\s+{_NAME}\b", msg)
+        m_pet = _QF_PET_RE.search(msg) if "pet" in triggered else None
         if m_pet:
             species = m_pet.group(1).strip().lower()
             name = m_pet.group(2).strip()
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -7,14 +9,31 @@ class PathSafetyError(RuntimeError):
     pass
 
 
+@lru_cache(maxsize=128)
+def _resolve_absolute_root(root: Path) -> Path:
+    return root.resolve()
+
+
+def _resolve_root(root: Path) -> Path:
+    # Roots are fixed config directories, so their resolution (an lstat per
+    # path component) is cached. Relative roots depend on the cwd and are
+    # resolved fresh; targets are caller-controlled and never cached.
+    return _resolve_absolute_root(root) if root.is_absolute() else root.resolve()
+
+
+def _resolve_target(target: Path) -> Path:
+    # os.path.realpath is what Path.resolve() runs internally; resolve() then
+    # adds a stat() purely to report symlink loops, which the open() that
+    # follows every check reports anyway.
+    return Path(os.path.realpath(target))
+
+
 def ensure_within_repo(repo_root: Path, target: Path) -> Path:
-    repo_root = repo_root.resolve()
-    target = target.resolve()
+    repo_root = _resolve_root(repo_root)
+    target = _resolve_target(target)
 
-    try:
-        target.relative_to(repo_root)
-    except Exception as e:  # noqa: BLE001
-        raise PathSafetyError(f"Refusing to access path outside repo: {target}") from e
+    if not target.is_relative_to(repo_root):
+        raise PathSafetyError(f"Refusing to access path outside repo: {target}")
 
     return target
 
@@ -25,22 +44,17 @@ def ensure_within_any_root(allowed_roots: list[Path], target: Path) -> Path:
     This is used to safely allow writes to multiple sandboxed directories
     (e.g. repo root and projects dir).
     """
-    target = target.resolve()
-    roots = [r.resolve() for r in (allowed_roots or []) if r is not None]
+    target = _resolve_target(target)
+    roots = [_resolve_root(r) for r in (allowed_roots or []) if r is not None]
     for r in roots:
-        try:
-            target.relative_to(r)
+        if target.is_relative_to(r):
             return target
-        except Exception:
-            continue
     raise PathSafetyError(f"Refusing to access path outside allowed roots: {target}")
 
 
 def ensure_safe_subdir(repo_root: Path, subdir: Path, target: Path) -> Path:
     subdir = ensure_within_repo(repo_root, subdir)
     target = ensure_within_repo(repo_root, target)
-    try:
-        target.relative_to(subdir)
-    except Exception as e:  # noqa: BLE001
-        raise PathSafetyError(f"Refusing to access path outside allowed dir {subdir}: {target}") from e
+    if not target.is_relative_to(subdir):
+        raise PathSafetyError(f"Refusing to access path outside allowed dir {subdir}: {target}")
     return target
@@ -19,11 +19,27 @@ than to answer a new question with an old answer:
 * **High similarity bar** (default 0.95) and a **short TTL** (default 1h).
 * Any *write* to memory invalidates the whole cache — if what Nova knows
   changed, previous answers may no longer be true.
-
-Off unless embeddings are available; falls back to simply never hitting.
+* **Never cache a question that leans on the previous turn** ("explain that",
+  "tell me more", "say it again") — its answer depends on what came before.
+* **Only within the same context.** An entry carries a `context_key()` (the
+  runtime uses the conversation id) and only matches a lookup with the same
+  key. The key must stay the same across a repeat: the running transcript
+  changes every turn, so keying on it would mean nothing ever hits.
+
+Opt-in (NOVA_SEMANTIC_CACHE=1), and needs embeddings; without them it simply
+never hits.
+
+The runtime consults it before memory search, the tool loop or generation, so
+a hit skips the expensive part of the turn. Embedding is blocking model work:
+the runtime goes through `lookup_async` / `store_async`, which run it on a
+worker thread. A question the admission rules could never have stored skips
+the embedding entirely, and so does any lookup while the cache is empty.
 """
 
+import asyncio
+import hashlib
 import math
+import operator
 import os
 import re
 import time
@@ -41,9 +57,25 @@ _VOLATILE = re.compile(
     re.IGNORECASE,
 )
 
+# ...and one containing any of these refers back to something said earlier.
+_REFERS_BACK = re.compile(
+    r"\b(that|this|it|those|these|them|again|more|else|above|earlier|before|previous|same|instead)\b",
+    re.IGNORECASE,
+)
+
 
 def cache_enabled() -> bool:
-    return os.getenv("NOVA_SEMANTIC_CACHE", "1").strip().lower() not in {"0", "false", "no", "off"}
+    return os.getenv("NOVA_SEMANTIC_CACHE", "0").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def context_key(*parts: Any) -> str:
+    """Digest of what a reply depended on besides the question (for the
+    runtime, the conversation id). Entries only match under equal keys."""
+    h = hashlib.blake2b(digest_size=16)
+    for p in parts:
+        h.update(str(p or "").encode("utf-8"))
+        h.update(b"\x00")
+    return h.hexdigest()
 
 
 def _cosine(a: list[float], b: list[float]) -> float:
@@ -55,12 +87,19 @@ def _cosine(a: list[float], b: list[float]) -> float:
     return (dot / (na * nb)) if na and nb else 0.0
 
 
+def _norm(v: list[float]) -> float:
+    return math.sqrt(sum(map(operator.mul, v, v)))
+
+
 @dataclass
 class _Entry:
     vector: list[float]
     question: str
     answer: str
+    context: str = ""
     created: float = field(default_factory=time.monotonic)
+    # Stored once, so a lookup's scan is one dot product per entry.
+    norm: float = 0.0
 
 
 class SemanticCache:
@@ -85,8 +124,18 @@ class SemanticCache:
             return False                      # greetings/acks
         if _VOLATILE.search(q) or _VOLATILE.search(a):
             return False                      # time-bound
+        if _REFERS_BACK.search(q):
+            return False                      # follow-up to an earlier turn
         return True
 
+    @staticmethod
+    def _askable(question: str) -> bool:
+        """Could an answer to this question ever have been admitted? The same
+        question-side rules as cacheable(); a "no" means a lookup can't hit, so
+        it doesn't embed. Also keeps live questions from matching a stored one."""
+        q = (question or "").strip()
+        return len(q) >= 12 and not _VOLATILE.search(q) and not _REFERS_BACK.search(q)
+
     def _embed(self, text: str) -> list[float]:
         from memory import embeddings
 
@@ -105,21 +154,27 @@ class SemanticCache:
         if len(self._entries) > self._max:
             self._entries = self._entries[-self._max:]
 
-    def lookup(self, question: str) -> tuple[str, float] | None:
-        """Best semantically-equivalent recent answer, or None."""
-        if not cache_enabled() or not (question or "").strip():
+    def lookup(self, question: str, *, context: str = "",
+               vector: list[float] | None = None) -> tuple[str, float] | None:
+        """Best semantically-equivalent recent answer stored under the same
+        `context` key, or None. `vector` is the question's embedding when the
+        caller already has it."""
+        if not cache_enabled() or not self._askable(question):
             return None
         self._prune()
-        if not self._entries:
+        if not any(e.context == context for e in self._entries):
             self.misses += 1
             return None
-        vec = self._embed(question)
-        if not vec:
+        vec = vector if vector is not None else self._embed(question)
+        qn = _norm(vec) if vec else 0.0
+        if not qn:
             self.misses += 1
             return None
         best, best_score = None, 0.0
         for e in self._entries:
-            score = _cosine(vec, e.vector)
+            if e.context != context or len(e.vector) != len(vec) or not e.norm:
+                continue
+            score = sum(map(operator.mul, vec, e.vector)) / (qn * e.norm)
             if score > best_score:
                 best, best_score = e, score
         if best is not None and best_score >= self._threshold:
@@ -129,16 +184,36 @@ class SemanticCache:
         self.misses += 1
         return None
 
-    def store(self, question: str, answer: str, *, tools_used: int = 0) -> bool:
+    def store(self, question: str, answer: str, *, tools_used: int = 0, context: str = "",
+              vector: list[float] | None = None) -> bool:
         if not cache_enabled() or not self.cacheable(question, answer, tools_used=tools_used):
             return False
-        vec = self._embed(question)
+        vec = vector if vector is not None else self._embed(question)
         if not vec:
             return False
-        self._entries.append(_Entry(vector=vec, question=question.strip(), answer=answer.strip()))
+        self._entries.append(_Entry(vector=vec, question=question.strip(), answer=answer.strip(),
+                                    context=context, norm=_norm(vec)))
         self._prune()
         return True
 
+    # ── event-loop entry points: same rules, embedding on a worker thread ──
+
+    async def lookup_async(self, question: str, *, context: str = "") -> tuple[str, float] | None:
+        if not cache_enabled() or not self._askable(question):
+            return None
+        self._prune()
+        if not any(e.context == context for e in self._entries):
+            self.misses += 1
+            return None
+        vec = await asyncio.to_thread(self._embed, question)
+        return self.lookup(question, context=context, vector=vec)
+
+    async def store_async(self, question: str, answer: str, *, tools_used: int = 0, context: str = "") -> bool:
+        if not cache_enabled() or not self.cacheable(question, answer, tools_used=tools_used):
+            return False
+        vec = await asyncio.to_thread(self._embed, question)
+        return self.store(question, answer, tools_used=tools_used, context=context, vector=vec)
+
     def invalidate(self, reason: str = "memory changed") -> int:
         """Drop everything — called whenever memory is written, because a stored
         answer may no longer be true."""
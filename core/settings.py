@@ -31,8 +31,9 @@ from core.logging_setup import get_logger
 
 logger = get_logger(__name__)
 
-_TRUTHY = {"1", "true", "yes", "on"}
-_FALSY = {"0", "false", "no", "off", ""}
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+_FALSY = frozenset({"0", "false", "no", "off", ""})
+_BOOL_WORDS = _TRUTHY | _FALSY
 
 
 @dataclass(frozen=True)
@@ -57,6 +58,7 @@ CATALOG: dict[str, Setting] = dict(
         _s("NOVA_REPO_ROOT", "path", "", "Override repo root autodetection."),
         _s("NOVA_MEMORY_DIR", "path", "memory_data", "Runtime memory storage directory."),
         _s("NOVA_PROJECTS_DIR", "path", "projects", "Directory for Nova-built projects."),
+        _s("NOVA_IO_WORKERS", "int", "4", "Worker threads for blocking file I/O (uploads, TTS clip store), kept apart from the TTS/STT pools."),
         # ── Logging ─────────────────────────────────────────────────────────
         _s("NOVA_LOG_LEVEL", "str", "INFO", "Application log level."),
         _s("NOVA_LOG_FORMAT", "str", "", "Log format override (console|json; empty = auto)."),
@@ -66,6 +68,7 @@ CATALOG: dict[str, Setting] = dict(
         # ── Model / LLM ─────────────────────────────────────────────────────
         _s("NOVA_MODEL_PATH", "path", "", "Explicit GGUF path (empty = newest in model dir)."),
         _s("NOVA_MODEL_DIR", "path", "", "Model directory override (default: model/)."),
+        _s("NOVA_QUANT_PREF", "csv", "Q4_K_M,Q5_K_M,Q4_K_S,Q4_0,Q6_K,Q8_0,BF16,F16", "When the model dir holds several quants of the newest model, load the first match in this order (Q4_K_M ≈ 2x the speed of Q8_0 for a small quality loss)."),
         _s("NOVA_MMPROJ_PATH", "path", "", "Explicit mmproj GGUF for vision (empty = auto-detect)."),
         _s("NOVA_CHAT_FORMAT", "str", "", "llama-cpp chat format override."),
         _s("NOVA_MODEL_ROLES", "str", "", "Role→model remap once a second model handle exists, e.g. 'coder=secondary'. Empty = every role on the primary model."),
@@ -84,6 +87,12 @@ CATALOG: dict[str, Setting] = dict(
         _s("NOVA_CONTEXT_TOKENS", "int", "8192", "Model context window."),
         _s("NOVA_MAX_TOKENS", "int", "1536", "Default reply token budget."),
         _s("NOVA_MAIN_GPU", "int", "0", "CUDA device index for the LLM."),
+        _s("NOVA_N_BATCH", "int", "512", "llama.cpp prompt batch size. Larger prefills long prompts faster but costs VRAM and host RAM (an n_batch x vocab float32 logits buffer, ~0.6 GB per 1024 on a 150k-vocab model)."),
+        _s("NOVA_N_UBATCH", "int", "512", "llama.cpp physical micro-batch (clamped to NOVA_N_BATCH). Larger uses more VRAM for compute buffers."),
+        _s("NOVA_MLOCK", "bool", "0", "Pin the model weights in RAM (mlock) so the OS can't page them out. Needs the RAM to spare."),
+        _s("NOVA_FLASH_ATTN", "bool", "1", "Use llama.cpp's fused FlashAttention kernel (less memory traffic per token)."),
+        _s("NOVA_LLM_PREFIX_CACHE", "bool", "0", "Snapshot the KV state after the reply prompt's fixed persona block once and restore it each turn, so only the dynamic part is prefilled. Opt-in: costs host RAM for the snapshot and a state copy per restore."),
+        _s("NOVA_LLM_WARMUP", "bool", "1", "Run one single-token completion at startup so CUDA kernel/KV setup isn't paid by the first chat turn."),
         _s("NOVA_LLM_ALLOW_THINKING", "bool", "", "Globally allow reasoning blocks in replies."),
         _s("NOVA_VISION_FORCE", "bool", "", "Force-enable vision even if detection is unsure."),
         # ── Voice ───────────────────────────────────────────────────────────
@@ -94,14 +103,18 @@ CATALOG: dict[str, Setting] = dict(
         _s("NOVA_TTS_WARMUP_TEXT", "str", "Hello there. I am ready to help.", "Prewarm utterance."),
         _s("NOVA_TTS_SPEED", "float", "1.0", "Base TTS speed multiplier."),
         _s("NOVA_TTS_MOOD_PACING", "bool", "1", "Subtle mood-based speech pacing (WS-H)."),
-        _s("NOVA_TTS_CACHE_MAX", "int", "64", "Max cached TTS clips."),
+        _s("NOVA_TTS_STREAM_CHUNKS", "bool", "0", "Also emit each sentence as incremental `audio_chunk` SSE events (raw PCM16, base64) while XTTS decodes, for clients that can play them. The full clip still follows as the usual `tts` event."),
+        _s("NOVA_TTS_CACHE_MB", "float", "256", "RAM budget for synthesized TTS clips (LRU, content-addressed by voice+pace+text)."),
+        _s("NOVA_TTS_CACHE_DISK_MB", "float", "1024", "Disk budget for the TTS clip store under <voice_dir>/_cache (0 = RAM only)."),
+        _s("NOVA_TTS_WORKERS", "int", "2", "Concurrent XTTS syntheses (dedicated thread pool). Sentences beyond this queue instead of competing for the same cores."),
         _s("NOVA_FFMPEG_PATH", "path", "", "Explicit ffmpeg path if not on PATH."),
         _s("NOVA_STT_MODEL", "str", "openai/whisper-base", "Transformers STT fallback model."),
         _s("NOVA_STT_MODEL_SIZE", "str", "base", "faster-whisper model size."),
+        _s("NOVA_STT_WORKERS", "int", "1", "Concurrent transcriptions (dedicated thread pool)."),
         # ── Memory ──────────────────────────────────────────────────────────
         _s("NOVA_EMBED_MODEL", "str", "BAAI/bge-small-en-v1.5", "Embedding model for semantic memory."),
         _s("NOVA_EMBED_DEVICE", "str", "cpu", "Embedding device (cuda|cpu|auto). Defaults to CPU: bge-small is tiny and runs in the background, but on GPU it is a third uncoordinated CUDA consumer alongside llama.cpp and XTTS, which aborts llama.cpp with an illegal memory access (see core/gpu.py)."),
-        _s("NOVA_SEMANTIC_CACHE", "bool", "1", "Reuse a recent answer when a question means the same thing (embedding similarity). Never caches tool-backed or time-sensitive turns; any memory write invalidates it (U5)."),
+        _s("NOVA_SEMANTIC_CACHE", "bool", "0", "Reuse a recent answer when a question means the same thing (embedding similarity), within the same conversation. Never caches tool-backed, time-sensitive or follow-up turns; any memory write invalidates it (U5)."),
         _s("NOVA_SEMANTIC_CACHE_THRESHOLD", "float", "0.95", "Cosine similarity required for a semantic cache hit."),
         _s("NOVA_SEMANTIC_CACHE_TTL_S", "float", "3600", "How long a cached answer stays valid, in seconds."),
         _s("NOVA_LLM_EXPRESSION", "bool", "1", "Let the model phrase proactive nudges, name learned workflows, and read the stress signal, instead of hardcoded templates. Templates remain the fallback (U4)."),
@@ -230,7 +243,7 @@ def validate_environment(environ: dict[str, str] | None = None) -> list[str]:
             except ValueError:
                 warnings.append(f"{name}={shown} is not a number; default {spec.default!r} will be used by typed accessors.")
         elif spec.kind == "bool":
-            if value.lower() not in _TRUTHY | _FALSY:
+            if value.lower() not in _BOOL_WORDS:
                 warnings.append(f"{name}={shown} is not a recognized boolean (use 1/0/true/false/yes/no/on/off).")
         elif spec.kind == "hhmm":
             if not _HHMM_RE.match(value):
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import random
 from dataclasses import dataclass
 from typing import Any, Awaitable, Callable
 
@@ -11,13 +12,13 @@ from core.logging_setup import get_logger
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCall:
     name: str
     args: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResult:
     name: str
     ok: bool
@@ -32,9 +33,14 @@ class ToolRouter:
     def __init__(self, tools: dict[str, AsyncTool], descriptions: dict[str, str] | None = None):
         self._tools = dict(tools)
         self._descriptions = dict(descriptions or {})
+        # Sorted names, rebuilt only when register() changes the set. Every
+        # chat turn and every supervisor step asks for the list.
+        self._names: tuple[str, ...] | None = None
 
     def list_tools(self) -> list[str]:
-        return sorted(self._tools.keys())
+        if self._names is None:
+            self._names = tuple(sorted(self._tools))
+        return list(self._names)
 
     def describe_tools(self) -> dict[str, str]:
         """name -> human/LLM-readable description (used for function calling)."""
@@ -43,11 +49,13 @@ class ToolRouter:
     def register(self, name: str, fn: AsyncTool, description: str = "") -> None:
         """Register an additional tool after construction (e.g. project builder)."""
         self._tools[str(name)] = fn
+        self._names = None
         if description:
             self._descriptions[str(name)] = description
 
     async def execute(self, call: ToolCall, timeout_s: float = 20.0, retries: int = 1) -> ToolResult:
-        if call.name not in self._tools:
+        tool = self._tools.get(call.name)
+        if tool is None:
             BUS.publish("tool.error", {"tool": call.name, "error": "unknown_tool"})
             return ToolResult(name=call.name, ok=False, result=None, error=f"Unknown tool: {call.name}")
 
@@ -55,14 +63,19 @@ class ToolRouter:
         last_err: Exception | None = None
         for attempt in range(retries + 1):
             try:
-                coro = self._tools[call.name](call.args)
+                coro = tool(call.args)
                 result = await asyncio.wait_for(coro, timeout=timeout_s)
                 BUS.publish("tool.result", {"tool": call.name, "ok": True, "summary": clip(result, 200)})
                 return ToolResult(name=call.name, ok=True, result=result, error=None)
             except Exception as e:  # noqa: BLE001
                 last_err = e
-                logger.warning("tool_failed", tool=call.name, attempt=attempt, error=str(e))
-                await asyncio.sleep(0.2 * (attempt + 1))
+                if attempt == retries:
+                    logger.warning("tool_failed", tool=call.name, attempt=attempt, error=str(e))
+                    break
+                logger.debug("tool_failed_retrying", tool=call.name, attempt=attempt, error=str(e))
+                # Exponential with a little jitter, and never after the final
+                # attempt: that sleep only delayed the error reaching the user.
+                await asyncio.sleep(min(2.0, 0.1 * (2 ** attempt)) + random.uniform(0, 0.05))
 
         # A "not configured" state (missing API key, OAuth never run) is not a
         # code defect: publish it as tool.not_configured so the self-improve
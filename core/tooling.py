@@ -21,6 +21,38 @@ from plugins.registry import REGISTRY
 
 logger = get_logger(__name__)
 
+# shell.exec keeps this many characters of each stream. The pipe is still
+# drained to EOF (a full pipe would block the child), but only enough bytes
+# for that many characters are ever held: 4 per UTF-8 code point, plus one
+# more to tell "exactly at the limit" from "over it".
+_SHELL_OUTPUT_MAX = 20000
+_SHELL_READ_CAP = 4 * (_SHELL_OUTPUT_MAX + 1)
+
+
+async def _read_capped(stream: asyncio.StreamReader | None, cap: int) -> tuple[bytes, bool]:
+    """(first `cap` bytes of `stream`, whether anything past them was dropped)."""
+    if stream is None:
+        return b"", False
+    buf = bytearray()
+    dropped = False
+    while True:
+        chunk = await stream.read(65536)
+        if not chunk:
+            break
+        room = cap - len(buf)
+        if room > 0:
+            buf += chunk[:room]
+        if len(chunk) > room:
+            dropped = True
+    return bytes(buf), dropped
+
+
+def _clip_output(data: bytes, dropped: bool) -> str:
+    text = data.decode("utf-8", errors="ignore")
+    if dropped or len(text) > _SHELL_OUTPUT_MAX:
+        return text[:_SHELL_OUTPUT_MAX] + "\n...[truncated]"
+    return text
+
 
 def build_tool_router(*, repo_root: Path, projects_dir: Path, memory: MemoryUnifier) -> ToolRouter:
     """Build Nova's ToolRouter from built-ins + plugins.
@@ -38,13 +70,6 @@ def build_tool_router(*, repo_root: Path, projects_dir: Path, memory: MemoryUnif
     # honors NOVA_DEV_MODE and the .env/.git/secrets deny-list in core/dev_mode.
     dev_mode = DevMode(repo_root=repo_root, projects_dir=projects_dir)
 
-    # Load plugins (side-effects: register tools)
-    with contextlib.suppress(Exception):
-        import plugins.init  # noqa: F401
-
-    plugin_tools = {name: spec.fn for name, spec in REGISTRY.get_tools().items()}
-    plugin_descriptions = {name: spec.description for name, spec in REGISTRY.get_tools().items()}
-
     async def _scaffold_project(args: dict[str, Any]) -> dict[str, Any]:
         name = str(args.get("name") or "").strip()
         path = project_manager.scaffold_project(name)
@@ -61,8 +86,8 @@ def build_tool_router(*, repo_root: Path, projects_dir: Path, memory: MemoryUnif
         await code_ops.apply_patch_atomic(path, content)
         return {"path": str(path), "bytes": len(content.encode("utf-8"))}
 
-    async def _memory_rebuild(_: dict[str, Any]) -> dict[str, Any]:
-        res = await memory.rebuild_semantic_index()
+    async def _memory_rebuild(args: dict[str, Any]) -> dict[str, Any]:
+        res = await memory.rebuild_semantic_index(full=bool(args.get("full")))
         return {"rebuilt": res}
 
     def _slug_topic(t: str) -> str:
@@ -715,18 +740,24 @@ def build_tool_router(*, repo_root: Path, projects_dir: Path, memory: MemoryUnif
             stderr=asyncio.subprocess.PIPE,
         )
         try:
-            out_b, err_b = await asyncio.wait_for(proc.communicate(), timeout=timeout_s)
+            # communicate() would buffer everything the command printed (a
+            # verbose build can emit tens of MB) only for all but 20k chars to
+            # be thrown away; read each pipe with a byte cap instead.
+            (out_b, out_over), (err_b, err_over), _ = await asyncio.wait_for(
+                asyncio.gather(
+                    _read_capped(proc.stdout, _SHELL_READ_CAP),
+                    _read_capped(proc.stderr, _SHELL_READ_CAP),
+                    proc.wait(),
+                ),
+                timeout=timeout_s,
+            )
         except TimeoutError:
             with contextlib.suppress(Exception):
                 proc.kill()
             return {"ok": False, "error": "timeout", "cmd": cmd, "timeout_s": timeout_s}
 
-        stdout = (out_b or b"").decode("utf-8", errors="ignore")
-        stderr = (err_b or b"").decode("utf-8", errors="ignore")
-        if len(stdout) > 20000:
-            stdout = stdout[:20000] + "\n...[truncated]"
-        if len(stderr) > 20000:
-            stderr = stderr[:20000] + "\n...[truncated]"
+        stdout = _clip_output(out_b, out_over)
+        stderr = _clip_output(err_b, err_over)
 
         return {"ok": True, "cmd": cmd, "exit_code": int(proc.returncode or 0), "stdout": stdout, "stderr": stderr}
 
@@ -785,7 +816,7 @@ def build_tool_router(*, repo_root: Path, projects_dir: Path, memory: MemoryUnif
         "project.scaffold": "Create an empty project folder. args: {name}",
         "code.read": "Read a text file inside the repo or projects workspace. args: {path}",
         "code.write": "Write a text file inside the repo or projects workspace. args: {path, content}",
-        "memory.rebuild_index": "Rebuild the semantic memory index from the primary store. args: {}",
+        "memory.rebuild_index": "Re-sync the semantic memory index with the primary store (only changed entries are re-embedded; full=true re-embeds everything). args: {full?}",
         "memory.remember": "Save a fact or note to permanent long-term memory when the user asks you to remember something. args: {fact, topic?}",
         "memory.recall": "Search permanent long-term memory for previously saved facts and notes. args: {query}",
         "memory.correct": ("Fix something you remembered WRONG when Marcus corrects you ('no, her birthday is the 14th'). This SUPERSEDES the old value instead of storing a second contradictory fact. args: {attribute, value, entity?, old_value?}"),
@@ -903,8 +934,13 @@ def build_tool_router(*, repo_root: Path, projects_dir: Path, memory: MemoryUnif
         tools["shell.exec"] = _shell_exec
         descriptions["shell.exec"] = "Run a shell command in the repo root (guarded). args: {cmd, timeout_s}"
     if allow_network_tools:
-        tools.update(plugin_tools)
-        descriptions.update(plugin_descriptions)
+        # Load plugins (side-effects: register tools) only when they'll be
+        # wired in, and walk one registry snapshot instead of copying it twice.
+        with contextlib.suppress(Exception):
+            import plugins.init  # noqa: F401
+        for name, spec in REGISTRY.get_tools().items():
+            tools[name] = spec.fn
+            descriptions[name] = spec.description
 
     router = ToolRouter(tools, descriptions=descriptions)
     # Expose the shared self-editing surface so the /dev/* endpoints operate on
@@ -43,7 +43,8 @@ class MemoryIngestWorker:
         self._summary_every_n = int(summary_every_n)
         self._stop = asyncio.Event()
         self._task: asyncio.Task[None] | None = None
-        self._turn_counter: dict[str, int] = {}
+        # Keyed by UUID.int: a native int hash, no per-event str(uuid) format.
+        self._turn_counter: dict[int, int] = {}
 
     def start(self) -> None:
         if self._task and not self._task.done():
@@ -94,9 +95,10 @@ class MemoryIngestWorker:
                 self._q.task_done()
 
             # opportunistically summarize
-            cid = str(ev.conversation_id)
-            self._turn_counter[cid] = self._turn_counter.get(cid, 0) + 1
-            if self._turn_counter[cid] % self._summary_every_n == 0:
+            cid = ev.conversation_id.int
+            turns = self._turn_counter.get(cid, 0) + 1
+            self._turn_counter[cid] = turns
+            if turns % self._summary_every_n == 0:
                 try:
                     await self._sq.put(SummarizeHintEvent(conversation_id=ev.conversation_id, timestamp=_now(), reason="periodic"))
                 except Exception:
@@ -108,10 +110,10 @@ class MemoryIngestWorker:
         user_text = (ev.user_message or "").strip()
         assistant_text = (ev.assistant_message or "").strip()
 
-        if user_text:
-            await self._memory.ingest_turn(ev.conversation_id, "user", user_text)
-        if assistant_text:
-            await self._memory.ingest_turn(ev.conversation_id, "assistant", assistant_text)
+        # Both sides of the exchange in one ingest: one SQLite commit.
+        turns = [(role, text) for role, text in (("user", user_text), ("assistant", assistant_text)) if text]
+        if turns:
+            await self._memory.ingest_turns(ev.conversation_id, turns)
 
         # LLM-powered extraction (explicit-only).
         #
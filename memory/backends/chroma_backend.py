@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import asyncio
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 import chromadb
 from chromadb.config import Settings
@@ -33,37 +35,58 @@ class _HashEmbeddingFunction:
     def get_config(self) -> dict[str, int]:
         return {"dim": self._dim}
 
-    def _embed_one(self, text: Any) -> list[float]:
+    @staticmethod
+    def _tokens(text: Any) -> list[str]:
         if isinstance(text, list):
             text = " ".join(str(x) for x in text)
-        t = (str(text) if text is not None else "").strip().lower()
-        if not t:
-            return [0.0] * self._dim
-
-        vec = np.zeros(self._dim, dtype=np.float32)
-
-        parts = t.split()
-        if len(parts) > 256:
-            parts = parts[:256]
-
-        for p in parts:
-            h = hashlib.blake2b(p.encode("utf-8"), digest_size=8).digest()
-            idx = int.from_bytes(h[:4], "little") % self._dim
-            sign = -1.0 if (h[4] & 1) else 1.0
-            vec[idx] += sign
-
-        norm = float(np.linalg.norm(vec))
-        if norm > 0.0:
-            vec /= norm
-        return vec.tolist()
-
-    def embed_query(self, input: Any) -> list[float]:
+        # maxsplit stops splitting after the tokens that are kept (the 257th
+        # piece is the unsplit remainder, dropped), and only those are
+        # lowercased: a huge document costs no more than its first 256 words.
+        t = str(text) if text is not None else ""
+        return [p.lower() for p in t.split(None, 256)[:256]]
+
+    def _embed_many(self, docs: list[list[str]]) -> list[np.ndarray]:
+        # Every token of every doc is hashed in one comprehension, then the
+        # index/sign decode and the per-doc scatter-add run as whole-array
+        # NumPy ops instead of one Python round-trip per token. Offsetting each
+        # doc's indices by doc*dim lets one bincount fill all the rows at once.
+        #
+        # The token hash must stay blake2b (bytes 0-3 little-endian pick the
+        # index, bit 0 of byte 4 the sign): vectors already stored in the
+        # collection were written with it, and a different hash would make
+        # every one of them unreachable from new queries.
+        n = len(docs)
+        if n == 0:
+            return []
+        digests = b"".join(
+            hashlib.blake2b(p.encode("utf-8"), digest_size=8).digest() for parts in docs for p in parts
+        )
+        if not digests:
+            return list(np.zeros((n, self._dim), dtype=np.float32))
+        raw = np.frombuffer(digests, dtype=np.uint8).reshape(-1, 8)
+        idx = raw[:, :4].copy().view("<u4").ravel().astype(np.int64) % self._dim
+        sign = np.where(raw[:, 4] & 1, -1.0, 1.0)
+        row = np.repeat(np.arange(n, dtype=np.int64), [len(parts) for parts in docs])
+        mat = np.bincount(row * self._dim + idx, weights=sign, minlength=n * self._dim)
+        mat = mat.astype(np.float32).reshape(n, self._dim)
+        norms = np.linalg.norm(mat, axis=1)
+        nz = norms > 0.0
+        mat[nz] /= norms[nz, None]
+        # Rows stay float32 arrays: that is the form chromadb normalizes
+        # embeddings into anyway, so a Python-float list would only be built
+        # here to be converted straight back.
+        return list(mat)
+
+    def _embed_one(self, text: Any) -> np.ndarray:
+        return self._embed_many([self._tokens(text)])[0]
+
+    def embed_query(self, input: Any) -> np.ndarray:
         return self._embed_one(input)
 
-    def embed_documents(self, input: list[str]) -> list[list[float]]:
-        return [self._embed_one(t) for t in (input or [])]
+    def embed_documents(self, input: list[str]) -> list[np.ndarray]:
+        return self._embed_many([self._tokens(t) for t in (input or [])])
 
-    def __call__(self, input: list[str]) -> list[list[float]]:
+    def __call__(self, input: list[str]) -> list[np.ndarray]:
         return self.embed_documents(input)
 
 
@@ -117,7 +140,12 @@ class ChromaMemoryBackend:
     def __init__(self, persist_dir: Path, collection_name: str = "nova_memory_v2") -> None:
         self._persist_dir = Path(persist_dir)
         self._collection_name = collection_name
+        # Held only to open the client/collection and across reset(). Reads and
+        # writes run unlocked: the chromadb client is thread-safe, and
+        # serializing every query behind one lock kept a search waiting on an
+        # unrelated ingest upsert.
         self._lock = asyncio.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="nova-chroma")
         self._client: chromadb.ClientAPI | None = None
         self._collection: Any | None = None
 
@@ -143,6 +171,20 @@ class ChromaMemoryBackend:
             metadata={"hnsw:space": "cosine"},
         )
 
+    def _run(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> asyncio.Future[Any]:
+        return asyncio.get_running_loop().run_in_executor(self._executor, partial(fn, *args, **kwargs))
+
+    async def _ready(self) -> Any:
+        col = self._collection
+        if col is not None:
+            return col
+        async with self._lock:
+            # Re-checked under the lock: callers that queued behind the first
+            # open skip the thread hop entirely.
+            if self._collection is None:
+                await self._run(self._ensure)
+            return self._collection
+
     async def upsert_text(self, doc_id: str, text: str, metadata: dict[str, Any] | None = None) -> None:
         # chromadb REJECTS an empty metadata dict ("Expected metadata to be a
         # non-empty dict"), so the signature's own `metadata=None` default used
@@ -153,62 +195,101 @@ class ChromaMemoryBackend:
         if not doc_id:
             return  # a blank id would create an unaddressable phantom row
         metas = [metadata] if metadata else None
-        async with self._lock:
-            await asyncio.to_thread(self._ensure)
-            await asyncio.to_thread(
-                self._collection.upsert,
-                ids=[doc_id],
-                documents=[str(text)],
-                metadatas=metas,
-            )
+        col = await self._ready()
+        await self._run(col.upsert, ids=[doc_id], documents=[str(text)], metadatas=metas)
+
+    async def embed(self, texts: list[str]) -> list[Any]:
+        """Document vectors from the collection's embedding function, for
+        upsert_many(embeddings=...)."""
+        await self._ready()
+        return await self._run(self._emb.embed_documents, [str(t) for t in texts])
+
+    async def upsert_many(
+        self,
+        ids: list[str],
+        texts: list[str],
+        metadatas: list[dict[str, Any] | None] | None = None,
+        *,
+        embeddings: list[Any] | None = None,
+    ) -> None:
+        """upsert_text for a whole batch in one collection call (one embedding
+        pass, one write). Blank ids are dropped as upsert_text drops them.
+        `embeddings` (from embed()) skips the embedding pass."""
+        metas = list(metadatas) if metadatas is not None else [None] * len(ids)
+        vecs = list(embeddings) if embeddings is not None else [None] * len(ids)
+        rows = [
+            (str(i).strip(), str(t), m or None, v)
+            for i, t, m, v in zip(ids, texts, metas, vecs)
+            if str(i).strip()
+        ]
+        if not rows:
+            return
+        col = await self._ready()
+        # chromadb takes metadatas for every row or for none, and refuses an
+        # empty dict, so metadata-less docs go in their own call.
+        with_meta = [r for r in rows if r[2]]
+        bare = [r for r in rows if not r[2]]
+        for group, has_meta in ((with_meta, True), (bare, False)):
+            if group:
+                await self._run(
+                    col.upsert,
+                    ids=[r[0] for r in group],
+                    documents=[r[1] for r in group],
+                    metadatas=[r[2] for r in group] if has_meta else None,
+                    embeddings=[r[3] for r in group] if embeddings is not None else None,
+                )
+
+    async def doc_hashes(self, kinds: list[str]) -> dict[str, str]:
+        """id -> metadata["h"] (content hash, "" if unset) for every document
+        of the given kinds. Loads metadata only: no documents, no vectors."""
+        col = await self._ready()
+        res = await self._run(col.get, where={"kind": {"$in": list(kinds)}}, include=["metadatas"])
+        ids = res.get("ids") or []
+        metas = res.get("metadatas") or [None] * len(ids)
+        return {str(i): str((m or {}).get("h") or "") for i, m in zip(ids, metas)}
 
     async def query(self, q: str, limit: int = 10) -> list[dict[str, Any]]:
-        async with self._lock:
-            await asyncio.to_thread(self._ensure)
-            res = await asyncio.to_thread(
-                self._collection.query,
-                query_texts=[str(q)],
-                n_results=int(limit),
-                include=["documents", "metadatas", "distances"],
-            )
-
-        hits: list[dict[str, Any]] = []
+        col = await self._ready()
+        res = await self._run(
+            col.query,
+            query_texts=[str(q)],
+            n_results=int(limit),
+            include=["documents", "metadatas", "distances"],
+        )
+
         ids = (res.get("ids") or [[]])[0]
         docs = (res.get("documents") or [[]])[0]
         metas = (res.get("metadatas") or [[]])[0]
         dists = (res.get("distances") or [[]])[0]
 
-        for i in range(min(len(ids), len(docs), len(metas), len(dists))):
-            hits.append(
-                {
-                    "id": ids[i],
-                    "text": docs[i],
-                    "metadata": metas[i] or {},
-                    "distance": float(dists[i]),
-                }
-            )
-        return hits
+        # zip stops at the shortest list, as the old min(len(...)) bound did.
+        return [
+            {"id": i, "text": d, "metadata": m or {}, "distance": float(x)}
+            for i, d, m, x in zip(ids, docs, metas, dists)
+        ]
 
 
     async def count(self) -> int:
-        async with self._lock:
-            await asyncio.to_thread(self._ensure)
-            return int(await asyncio.to_thread(self._collection.count))
+        col = await self._ready()
+        return int(await self._run(col.count))
 
 
     async def reset(self) -> None:
         """Drop and recreate the collection (persistent directory remains)."""
         async with self._lock:
-            await asyncio.to_thread(self._ensure)
+            await self._run(self._ensure)
             assert self._client is not None
+            client = self._client
+            # Cleared first so calls arriving mid-reset wait on the lock in
+            # _ready() for the new collection instead of using the old one.
+            self._collection = None
+            self._client = None
             try:
-                await asyncio.to_thread(self._client.delete_collection, self._collection_name)
+                await self._run(client.delete_collection, self._collection_name)
             except Exception:
                 # If it doesn't exist or delete fails, continue.
                 pass
-            self._collection = None
-            self._client = None
-            await asyncio.to_thread(self._ensure)
+            await self._run(self._ensure)
 
 
     async def delete_ids(self, ids: list[str]) -> None:
@@ -216,6 +297,5 @@ class ChromaMemoryBackend:
         ids = [str(i) for i in (ids or []) if str(i).strip()]
         if not ids:
             return
-        async with self._lock:
-            await asyncio.to_thread(self._ensure)
-            await asyncio.to_thread(self._collection.delete, ids=ids)
+        col = await self._ready()
+        await self._run(col.delete, ids=ids)
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from diskcache import Cache
 
@@ -11,7 +12,13 @@ class DiskCacheBackend:
     def __init__(self, cache_dir: Path):
         self._cache_dir = cache_dir
         self._cache: Cache | None = None
-        self._lock = asyncio.Lock()
+        # Calls go to two long-lived threads rather than one default-pool
+        # to_thread task each (no per-call context copy or pool contention with
+        # unrelated to_thread work). No asyncio lock: a diskcache Cache is
+        # thread-safe, so a get no longer queues behind an unrelated set.
+        # Created on first use and shut down by close(), so a closed backend
+        # leaves no threads behind and still reopens transparently.
+        self._executor: ThreadPoolExecutor | None = None
 
     def _get_cache(self) -> Cache:
         if self._cache is None:
@@ -19,22 +26,26 @@ class DiskCacheBackend:
             self._cache = Cache(directory=str(self._cache_dir))
         return self._cache
 
+    def _run(self, fn: Callable[..., Any], *args: Any) -> asyncio.Future[Any]:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="nova-diskcache")
+        return asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+
     async def set(self, key: str, value: Any, ttl_s: int = 300) -> None:
-        async with self._lock:
-            await asyncio.to_thread(self._get_cache().set, key, value, expire=ttl_s)
+        cache = self._get_cache()
+        await self._run(lambda: cache.set(key, value, expire=ttl_s))
 
     async def get(self, key: str) -> Any | None:
-        async with self._lock:
-            return await asyncio.to_thread(self._get_cache().get, key, None)
-
-    
+        return await self._run(self._get_cache().get, key, None)
 
     async def delete(self, key: str) -> bool:
         """Delete a cached key. Returns True if removed."""
-        async with self._lock:
-            return bool(await asyncio.to_thread(self._get_cache().pop, key, None) is not None)
+        return bool(await self._run(self._get_cache().pop, key, None) is not None)
 
     async def close(self) -> None:
         if self._cache is not None:
-            await asyncio.to_thread(self._cache.close)
+            await self._run(self._cache.close)
             self._cache = None
+        if self._executor is not None:
+            executor, self._executor = self._executor, None
+            executor.shutdown(wait=True)
@@ -15,32 +15,79 @@ class JsonAuditBackend:
         self._audit_path = json_dir / "audit.jsonl"
         self._snapshot_path = json_dir / "snapshots.jsonl"
         self._lock = asyncio.Lock()
+        self._initialized = False
+        # Group commit: lines wait here, and whoever holds the lock next writes
+        # every waiting line for that file in one open/write. Concurrent appends
+        # (the unifier fans writes out with gather) share a single write, and
+        # each append still returns only once its own line is on disk.
+        self._pending: dict[Path, list[bytes]] = {self._audit_path: [], self._snapshot_path: []}
+
+    @staticmethod
+    def _write_lines(path: Path, lines: list[bytes]) -> None:
+        with open(path, "ab") as f:
+            f.write(b"".join(lines))
 
     @staticmethod
     def _now_iso() -> str:
         return datetime.now(timezone.utc).isoformat()
 
     async def initialize(self) -> None:
-        self._json_dir.mkdir(parents=True, exist_ok=True)
-        for p in [self._audit_path, self._snapshot_path]:
-            if not p.exists():
-                async with aiofiles.open(p, "wb") as f:
-                    await f.write(b"")
+        if self._initialized:
+            return
+        # Under the lock: two first appends racing through the exists() check
+        # could otherwise both "create" a file, and the second "wb" would
+        # truncate a line the first had already appended.
+        async with self._lock:
+            if self._initialized:
+                return
+            self._json_dir.mkdir(parents=True, exist_ok=True)
+            for p in [self._audit_path, self._snapshot_path]:
+                if not p.exists():
+                    async with aiofiles.open(p, "wb") as f:
+                        await f.write(b"")
+            self._initialized = True
 
-    async def append_audit(self, record: dict[str, Any]) -> None:
+    async def _append(self, path: Path, line: bytes) -> None:
         await self.initialize()
+        pending = self._pending[path]
+        pending.append(line)
+        async with self._lock:
+            # Empty means an earlier holder already wrote this line.
+            if not pending:
+                return
+            batch = pending[:]
+            pending.clear()
+            # One thread hop for open+write+close; aiofiles spends one on
+            # each of the three.
+            job = asyncio.ensure_future(asyncio.to_thread(self._write_lines, path, batch))
+            try:
+                await asyncio.shield(job)
+            except asyncio.CancelledError:
+                # The thread writes the batch whatever happens to this caller:
+                # wait for it rather than re-queueing lines that are about to
+                # be on disk (the next append would write them twice).
+                try:
+                    await job
+                except Exception:
+                    self._requeue(pending, batch, line)
+                raise
+            except Exception:
+                self._requeue(pending, batch, line)
+                raise
+
+    @staticmethod
+    def _requeue(pending: list[bytes], batch: list[bytes], own: bytes) -> None:
+        # A failed write put nothing on disk. The other callers' lines go back
+        # for the next holder to retry; the failing caller's own line does not,
+        # since that caller is told its append failed.
+        pending[:0] = [ln for ln in batch if ln is not own]
+
+    async def append_audit(self, record: dict[str, Any]) -> None:
         record = dict(record)
         record.setdefault("ts", self._now_iso())
-        line = orjson.dumps(record) + b"\n"
-        async with self._lock:
-            async with aiofiles.open(self._audit_path, "ab") as f:
-                await f.write(line)
+        await self._append(self._audit_path, orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
 
     async def append_snapshot(self, snapshot: dict[str, Any]) -> None:
-        await self.initialize()
         snapshot = dict(snapshot)
         snapshot.setdefault("ts", self._now_iso())
-        line = orjson.dumps(snapshot) + b"\n"
-        async with self._lock:
-            async with aiofiles.open(self._snapshot_path, "ab") as f:
-                await f.write(line)
+        await self._append(self._snapshot_path, orjson.dumps(snapshot, option=orjson.OPT_APPEND_NEWLINE))
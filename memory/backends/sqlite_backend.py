@@ -1,20 +1,302 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
+import sqlite3
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator
 from uuid import UUID
 
 import aiosqlite
 
+_STATEMENT_CACHE = 512
+_FETCH_BATCH = 256
+_MAX_BOUND_IDS = 900
+_MAX_INLINE_IN = 64
+
+# Column lists of the search_* methods' rows.
+_FACT_SEARCH = (
+    "SELECT id, entity, attribute, value, confidence, created_at, last_reinforced_at, "
+    "source, evidence, verification_status, last_confirmed_at, "
+    "access_count, last_accessed_at, salience FROM facts"
+)
+_PERSON_SEARCH = "SELECT id, name, attributes_json, created_at FROM people"
+_EVENT_SEARCH = "SELECT id, date, note, created_at FROM events"
+
+
+async def _iter_dicts(db: aiosqlite.Connection, sql: str, params: Any = ()) -> AsyncIterator[dict[str, Any]]:
+    # Column names come from the cursor once per query and are zipped onto
+    # plain tuples, rather than every row going through sqlite3.Row and its
+    # keys() on the way to a dict. Rows are pulled _FETCH_BATCH at a time, so
+    # a whole-table read never holds every tuple AND every dict at once.
+    async with db.execute(sql, params) as cur:
+        cols = [d[0] for d in cur.description]
+        while rows := await cur.fetchmany(_FETCH_BATCH):
+            for r in rows:
+                yield dict(zip(cols, r))
+
+
+def _write_batch(conn: sqlite3.Connection, batch: list[list[tuple[str, tuple[Any, ...]]]]) -> list[Exception | None]:
+    # Runs on the aiosqlite connection's own thread. A savepoint per caller:
+    # one caller's constraint error undoes only that caller's rows, not the
+    # rest of the batch.
+    errors: list[Exception | None] = []
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        for statements in batch:
+            conn.execute("SAVEPOINT nova_write")
+            try:
+                for sql, params in statements:
+                    conn.execute(sql, params)
+                errors.append(None)
+            except Exception as e:  # noqa: BLE001 — handed to that caller
+                conn.execute("ROLLBACK TO nova_write")
+                errors.append(e)
+            conn.execute("RELEASE nova_write")
+        conn.commit()
+    except BaseException:
+        # The batch failed as a whole: roll it back so a later commit on this
+        # connection can't carry its rows in after all.
+        conn.rollback()
+        raise
+    return errors
+
+
+@functools.lru_cache(maxsize=16)
+def _fact_ids_in_sql(n: int) -> str:
+    # find_fact_ids's IN (...) list, rounded up to a power of two: every value
+    # count shares one of a handful of SQL strings, so the text is built once
+    # and the connection's statement cache keeps hitting instead of holding
+    # (and re-preparing) a statement per distinct count.
+    width = 1 << max(0, n - 1).bit_length()
+    return (
+        "SELECT id FROM facts WHERE entity = ? AND attribute = ? "
+        f"AND LOWER(value) IN ({','.join('?' * width)}) ORDER BY created_at DESC LIMIT ?"
+    )
+
+
+async def _fetch_dicts(db: aiosqlite.Connection, sql: str, params: Any = ()) -> list[dict[str, Any]]:
+    return [row async for row in _iter_dicts(db, sql, params)]
+
 
 class SQLiteMemoryBackend:
-    def __init__(self, db_path: Path):
+    def __init__(
+        self,
+        db_path: Path,
+        *,
+        read_connections: int = 4,
+        cache_mb: int = 64,
+        mmap_mb: int = 256,
+    ):
         self._db_path = db_path
+        # Per-connection tuning, applied to the writer and every reader as it
+        # opens (none of these persist in the file). The page cache only grows
+        # as pages are touched, so cache_mb is a ceiling, not an allocation;
+        # mmap lets reads skip a pread per page. busy_timeout isn't set here:
+        # aiosqlite.connect's default timeout of 5s already sets it.
+        self._pragmas = (
+            "PRAGMA synchronous=NORMAL;",
+            "PRAGMA temp_store=MEMORY;",
+            f"PRAGMA cache_size={-1024 * max(0, int(cache_mb))};",
+            f"PRAGMA mmap_size={1024 * 1024 * max(0, int(mmap_mb))};",
+        )
         self._init_lock = asyncio.Lock()
         self._initialized = False
+        # One connection for the backend's lifetime instead of one per call:
+        # no file/WAL/SHM reopen on every query, and SQLite's page cache
+        # survives between calls. _db_lock gives each method the connection to
+        # itself, so one method's transaction never commits or rolls back
+        # another's half-done work.
+        self._db: aiosqlite.Connection | None = None
+        self._db_lock = asyncio.Lock()
+        # Group commit for the hot inserts (turns, facts, people, events):
+        # each caller queues its statements here, and whoever next holds
+        # _db_lock writes every queued caller's statements in one transaction
+        # and one commit. Each caller still returns only once its own rows are
+        # committed, and still gets its own error.
+        self._pending_writes: list[tuple[list[tuple[str, tuple[Any, ...]]], asyncio.Future[None]]] = []
+        # SELECT-only methods don't queue behind that lock: under WAL a reader
+        # sees the last committed snapshot while the writer carries on, so they
+        # get their own small pool of query_only connections, opened on demand
+        # up to read_connections. close() bumps _reader_gen so a reader that is
+        # checked out at the time is closed on return instead of pooled, and
+        # waits for those returns so no connection thread outlives it.
+        self._max_readers = max(1, int(read_connections))
+        self._idle_readers: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+        self._lent_readers: set[aiosqlite.Connection] = set()
+        self._reader_returned = asyncio.Condition()
+        self._reader_count = 0
+        self._reader_gen = 0
+
+    async def _open(self) -> aiosqlite.Connection:
+        # sqlite3 keeps compiled statements per connection, keyed by SQL text,
+        # so a long-lived connection re-binds instead of re-parsing. Its
+        # default of 128 is below the distinct statements this class issues
+        # (the writer alone sees every write plus the schema/migration DDL),
+        # and an LRU that small would keep evicting the hot ones.
+        conn = aiosqlite.connect(self._db_path, cached_statements=_STATEMENT_CACHE)
+        # aiosqlite runs each connection on its own thread; daemonized so a
+        # backend nobody closed can't hold the process open.
+        conn.daemon = True
+        db = await conn
+        try:
+            for pragma in self._pragmas:
+                await db.execute(pragma)
+        except BaseException:
+            await self._shut(db)
+            raise
+        return db
+
+    @staticmethod
+    async def _shut(conn: aiosqlite.Connection) -> None:
+        # close() only queues the stop for aiosqlite's thread; join it so the
+        # thread is really gone once the backend says it is closed.
+        await conn.close()
+        await asyncio.to_thread(conn.join, 5.0)
+
+    @asynccontextmanager
+    async def _connect(self) -> AsyncIterator[aiosqlite.Connection]:
+        async with self._db_lock:
+            if self._db is None:
+                self._db = await self._open()
+            db = self._db
+            try:
+                yield db
+            finally:
+                # Closing a per-call connection used to discard anything left
+                # uncommitted (an error mid-write, an early return). Keep that.
+                if db.in_transaction:
+                    await db.rollback()
+
+    @asynccontextmanager
+    async def _read(self) -> AsyncIterator[aiosqlite.Connection]:
+        gen = self._reader_gen
+        try:
+            db = self._idle_readers.get_nowait()
+        except asyncio.QueueEmpty:
+            if self._reader_count < self._max_readers:
+                self._reader_count += 1
+                try:
+                    db = await self._open()
+                    await db.execute("PRAGMA query_only=1;")
+                except BaseException:
+                    self._reader_count -= 1
+                    raise
+            else:
+                db = await self._idle_readers.get()
+        self._lent_readers.add(db)
+        try:
+            yield db
+        finally:
+            # A stray write's implicit BEGIN would pin this reader to an old
+            # snapshot for every later caller.
+            if db.in_transaction:
+                await db.rollback()
+            self._lent_readers.discard(db)
+            if gen == self._reader_gen:
+                self._idle_readers.put_nowait(db)
+            else:
+                await self._shut(db)
+                async with self._reader_returned:
+                    self._reader_returned.notify_all()
+
+    async def _group_write(self, statements: list[tuple[str, tuple[Any, ...]]]) -> None:
+        await self.initialize()
+        done: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        entry = (statements, done)
+        self._pending_writes.append(entry)
+        try:
+            async with self._connect() as db:
+                # Empty means an earlier holder already committed this write.
+                batch = self._pending_writes[:]
+                self._pending_writes.clear()
+                if batch:
+                    # The whole batch runs as ONE call on the connection's thread
+                    # rather than an aiosqlite round trip (queue put, thread
+                    # wake-up, future hop back to the loop) for every BEGIN,
+                    # SAVEPOINT, INSERT, RELEASE and COMMIT. aiosqlite has no
+                    # public hook for that; _execute is its internal dispatcher
+                    # (requirements.txt pins the version).
+                    job = asyncio.ensure_future(db._execute(_write_batch, db._conn, [stmts for stmts, _ in batch]))
+                    try:
+                        errors = await asyncio.shield(job)
+                    except asyncio.CancelledError:
+                        # Already running on the connection's thread, where it
+                        # will finish either way: answer its callers before
+                        # giving up, rather than re-queueing committed rows.
+                        try:
+                            self._answer(batch, await job)
+                        except Exception as e:  # noqa: BLE001
+                            self._fail(batch, e)
+                        raise
+                    except Exception as e:  # noqa: BLE001
+                        self._fail(batch, e)
+                    else:
+                        self._answer(batch, errors)
+            await done
+        except BaseException:
+            # Cancelled (or failed to open the connection) while this write
+            # was still queued: take it back out, so a later holder doesn't
+            # commit rows for a caller that has gone away or leave them for
+            # close() to drop. Cancelling `done` keeps a later answer off a
+            # future nobody awaits; once answered, it is a no-op.
+            self._withdraw(entry)
+            raise
+
+    def _withdraw(self, entry: tuple[list[tuple[str, tuple[Any, ...]]], asyncio.Future[None]]) -> None:
+        for i, pending in enumerate(self._pending_writes):
+            if pending is entry:
+                del self._pending_writes[i]
+                break
+        entry[1].cancel()
+
+    @staticmethod
+    def _fail(
+        batch: list[tuple[list[tuple[str, tuple[Any, ...]]], asyncio.Future[None]]],
+        error: Exception,
+    ) -> None:
+        # The batch as a whole failed and was rolled back. Every caller in it
+        # gets the error; nothing is re-queued, since a retried write would
+        # land after its caller had already been told it failed.
+        for _, fut in batch:
+            if not fut.done():
+                fut.set_exception(error)
+
+    @staticmethod
+    def _answer(
+        batch: list[tuple[list[tuple[str, tuple[Any, ...]]], asyncio.Future[None]]],
+        errors: list[Exception | None],
+    ) -> None:
+        for (_, fut), err in zip(batch, errors):
+            if fut.done():
+                continue
+            if err is None:
+                fut.set_result(None)
+            else:
+                fut.set_exception(err)
+
+    async def close(self) -> None:
+        async with self._db_lock:
+            if self._db is not None:
+                # Refresh planner statistics that have drifted since the last
+                # ANALYZE (SQLite's recommended close-time call; it only
+                # re-analyzes tables whose size changed a lot, so it's cheap).
+                try:
+                    await self._db.execute("PRAGMA optimize;")
+                except Exception:  # noqa: BLE001 — never block shutdown on it
+                    pass
+                await self._shut(self._db)
+                self._db = None
+        self._reader_gen += 1
+        self._reader_count = 0
+        lent = set(self._lent_readers)
+        while not self._idle_readers.empty():
+            await self._shut(self._idle_readers.get_nowait())
+        async with self._reader_returned:
+            await self._reader_returned.wait_for(lambda: lent.isdisjoint(self._lent_readers))
 
     async def initialize(self) -> None:
         if self._initialized:
@@ -23,9 +305,8 @@ class SQLiteMemoryBackend:
             if self._initialized:
                 return
             self._db_path.parent.mkdir(parents=True, exist_ok=True)
-            async with aiosqlite.connect(self._db_path) as db:
+            async with self._connect() as db:
                 await db.execute("PRAGMA journal_mode=WAL;")
-                await db.execute("PRAGMA synchronous=NORMAL;")
                 await db.execute(
                     """
                     CREATE TABLE IF NOT EXISTS conversations (
@@ -67,7 +348,9 @@ class SQLiteMemoryBackend:
                     );
                     """
                 )
-                await db.execute("CREATE INDEX IF NOT EXISTS idx_facts_entity_attr ON facts(entity, attribute);")
+                await db.execute("CREATE INDEX IF NOT EXISTS idx_facts_ea_created ON facts(entity, attribute, created_at);")
+                await db.execute("CREATE INDEX IF NOT EXISTS idx_facts_created ON facts(created_at);")
+                await db.execute("CREATE INDEX IF NOT EXISTS idx_facts_ea_lvalue ON facts(entity, attribute, LOWER(value));")
                 await db.execute(
                     """
                     CREATE TABLE IF NOT EXISTS people (
@@ -380,6 +663,9 @@ class SQLiteMemoryBackend:
                 await db.execute("CREATE INDEX IF NOT EXISTS idx_proposals_pending ON proposals(status, created_at);")
                 await db.execute("CREATE INDEX IF NOT EXISTS idx_progress_ack ON progress_events(project_name, acknowledged, created_at);")
 
+                for sql in self._FTS_SCHEMA:
+                    await db.execute(sql)
+
                 await self._apply_migrations(db)
 
                 await db.commit()
@@ -395,6 +681,39 @@ class SQLiteMemoryBackend:
     # plus the matching change in the create block above. Never edit or remove
     # a shipped migration.
 
+    # Substring search over facts/people/events. Trigram FTS5 indexes every
+    # 3-character run, so `MATCH '"q"'` answers the same question as the old
+    # `LIKE '%q%'` from the index instead of scanning the table. The index is
+    # external-content (it reads row text back from the base table by rowid)
+    # and kept in step by triggers; an UPDATE that doesn't touch an indexed
+    # column (reinforce, touch_accessed) never rewrites it. The base tables
+    # have TEXT primary keys, so their rowids are only stable because nothing
+    # here VACUUMs; a VACUUM would have to be followed by a 'rebuild'.
+    _FTS_TABLES: tuple[tuple[str, tuple[str, ...]], ...] = (
+        ("facts", ("entity", "attribute", "value")),
+        ("people", ("name", "attributes_json")),
+        ("events", ("date", "note")),
+    )
+    _FTS_SCHEMA: list[str] = [
+        stmt
+        for table, cols in _FTS_TABLES
+        for stmt in (
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {table}_fts USING fts5("
+            f"{', '.join(cols)}, content='{table}', content_rowid='rowid', tokenize='trigram');",
+            f"CREATE TRIGGER IF NOT EXISTS {table}_fts_ai AFTER INSERT ON {table} BEGIN "
+            f"INSERT INTO {table}_fts(rowid, {', '.join(cols)}) "
+            f"VALUES (new.rowid, {', '.join('new.' + c for c in cols)}); END;",
+            f"CREATE TRIGGER IF NOT EXISTS {table}_fts_ad AFTER DELETE ON {table} BEGIN "
+            f"INSERT INTO {table}_fts({table}_fts, rowid, {', '.join(cols)}) "
+            f"VALUES ('delete', old.rowid, {', '.join('old.' + c for c in cols)}); END;",
+            f"CREATE TRIGGER IF NOT EXISTS {table}_fts_au AFTER UPDATE OF {', '.join(cols)} ON {table} BEGIN "
+            f"INSERT INTO {table}_fts({table}_fts, rowid, {', '.join(cols)}) "
+            f"VALUES ('delete', old.rowid, {', '.join('old.' + c for c in cols)}); "
+            f"INSERT INTO {table}_fts(rowid, {', '.join(cols)}) "
+            f"VALUES (new.rowid, {', '.join('new.' + c for c in cols)}); END;",
+        )
+    ]
+
     _MIGRATIONS: list[tuple[int, str, list[str]]] = [
         (1, "baseline: full schema as of Phase 0 (2026-07-18)", []),
         (
@@ -501,6 +820,40 @@ class SQLiteMemoryBackend:
                    WHERE salience IS NULL OR salience = 0.0;""",
             ],
         ),
+        (
+            7,
+            "Trigram FTS5 indexes for substring search over facts, people and events",
+            # The create block has already made the (empty) tables and
+            # triggers; index the rows that existed before them.
+            _FTS_SCHEMA + [f"INSERT INTO {table}_fts({table}_fts) VALUES('rebuild');" for table, _ in _FTS_TABLES],
+        ),
+        (
+            8,
+            "Order facts by created_at from an index (latest-per-attribute lookups, all_facts)",
+            [
+                # The newest value of an entity+attribute is read on nearly
+                # every turn, and (entity, attribute) alone left SQLite to sort
+                # the matches for ORDER BY created_at. Adding created_at to the
+                # key makes that a single index seek; it also covers everything
+                # the old two-column index did, so that one goes.
+                "CREATE INDEX IF NOT EXISTS idx_facts_ea_created ON facts(entity, attribute, created_at);",
+                "CREATE INDEX IF NOT EXISTS idx_facts_created ON facts(created_at);",
+                "DROP INDEX IF EXISTS idx_facts_entity_attr;",
+                "ANALYZE;",
+            ],
+        ),
+        (
+            9,
+            "Expression index for case-insensitive fact value lookups (find_fact_ids value_in)",
+            [
+                # find_fact_ids matches on LOWER(value); an index on the same
+                # expression lets SQLite probe for each value instead of
+                # reading every row of a busy entity+attribute (activity log,
+                # notes) and lowercasing it. No query change: the planner
+                # matches the expression as written.
+                "CREATE INDEX IF NOT EXISTS idx_facts_ea_lvalue ON facts(entity, attribute, LOWER(value));",
+            ],
+        ),
     ]
 
     async def _apply_migrations(self, db: "aiosqlite.Connection") -> None:
@@ -533,7 +886,7 @@ class SQLiteMemoryBackend:
 
     async def schema_version(self) -> int:
         await self.initialize()
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self._read() as db:
             async with db.execute("SELECT COALESCE(MAX(version), 0) FROM schema_version") as cur:
                 row = await cur.fetchone()
         return int(row[0]) if row else 0
@@ -557,7 +910,7 @@ class SQLiteMemoryBackend:
         await self.initialize()
         now = self._now_iso()
         run_after = run_after_iso or now
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self._connect() as db:
             await db.execute(
                 "INSERT INTO autonomy_tasks(task_id, conversation_id, project_name, title, details, priority, status, attempts, run_after, last_error, result_json, initiated_by_user, created_at, updated_at) VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
                 (
@@ -582,7 +935,13 @@ class SQLiteMemoryBackend:
     async def claim_next_autonomy_task(self) -> dict[str, Any] | None:
         await self.initialize()
         now = self._now_iso()
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self._connect() as db:
+            # IMMEDIATE takes the write lock before the SELECT. A plain
+            # (deferred) transaction left a gap between reading the queued row
+            # and marking it running, and _db_lock only closes that gap for
+            # this backend; a second connection to the file could claim the
+            # same task in it.
+            await db.execute("BEGIN IMMEDIATE")
             cur = await db.execute(
                 "SELECT task_id, conversation_id, project_name, title, details, priority, attempts, initiated_by_user FROM autonomy_tasks WHERE status='queued' AND run_after <= ? ORDER BY priority ASC, updated_at ASC LIMIT 1",
                 (now,),
@@ -615,7 +974,7 @@ class SQLiteMemoryBackend:
     ) -> None:
         await self.initialize()
         now = self._now_iso()
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self._connect() as db:
             await db.execute(
                 "UPDATE autonomy_tasks SET status=?, result_json=?, last_error=?, updated_at=? WHERE task_id=?",
                 (
@@ -631,7 +990,7 @@ class SQLiteMemoryBackend:
     async def bump_autonomy_task_attempt(self, *, task_id: str, attempts: int, run_after_iso: str, error: str) -> None:
         await self.initialize()
         now = self._now_iso()
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self._connect() as db:
             await db.execute(
                 "UPDATE autonomy_tasks SET status='queued', attempts=?, run_after=?, last_error=?, updated_at=? WHERE task_id=?",
                 (int(attempts), run_after_iso, error, now, task_id),
@@ -651,7 +1010,7 @@ class SQLiteMemoryBackend:
         query += " ORDER BY updated_at DESC LIMIT ?"
         params.append(int(limit))
 
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self._read() as db:
             cur = await db.execute(query, params)
             rows = await cur.fetchall()
 
@@ -681,7 +1040,7 @@ class SQLiteMemoryBackend:
         """
         await self.initialize()
         now = self._now_iso()
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self._connect() as db:
             cur1 = await db.execute(
                 "UPDATE autonomy_tasks SET status='cancelled', last_error=?, updated_at=? WHERE status IN ('queued','running')",
                 ("cancelled_on_startup", now),
@@ -762,7 +1121,7 @@ class SQLiteMemoryBackend:
 
     async def ensure_conversation(self, conversation_id: UUID) -> None:
         await self.initialize()
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self._connect() as db:
             await db.execute(
                 "INSERT OR IGNORE INTO conversations(id, created_at) VALUES(?, ?)",
                 (str(conversation_id), self._now_iso()),
@@ -770,14 +1129,29 @@ class SQLiteMemoryBackend:
             await db.commit()
 
     async def add_turn(self, turn_id: UUID, conversation_id: UUID, role: str, content: str, created_at_iso: str | None = None) -> None:
-        await self.initialize()
-        await self.ensure_conversation(conversation_id)
-        async with aiosqlite.connect(self._db_path) as db:
-            await db.execute(
-                "INSERT INTO turns(id, conversation_id, role, content, created_at) VALUES(?, ?, ?, ?, ?)",
-                (str(turn_id), str(conversation_id), role, content, created_at_iso or self._now_iso()),
-            )
-            await db.commit()
+        await self.add_turns([(turn_id, conversation_id, role, content, created_at_iso)])
+
+    async def add_turns(self, turns: list[tuple[UUID, UUID, str, str, str | None]]) -> None:
+        """Insert (turn_id, conversation_id, role, content, created_at_iso)
+        rows, creating their conversations as needed, in ONE transaction.
+
+        A commit is the expensive part of a write (the WAL sync), and a lone
+        add_turn used to pay two: one for ensure_conversation, one for the row.
+        """
+        if not turns:
+            return
+        now = self._now_iso()
+        convs = dict.fromkeys(str(t[1]) for t in turns)
+        await self._group_write(
+            [("INSERT OR IGNORE INTO conversations(id, created_at) VALUES(?, ?)", (c, now)) for c in convs]
+            + [
+                (
+                    "INSERT INTO turns(id, conversation_id, role, content, created_at) VALUES(?, ?, ?, ?, ?)",
+                    (str(tid), str(cid), role, content, at or now),
+                )
+                for tid, cid, role, content, at in turns
+            ]
+        )
 
     async def add_fact(
         self,
@@ -792,28 +1166,26 @@ class SQLiteMemoryBackend:
         verification_status: str | None = None,
         last_confirmed_at: str | None = None,
         salience: float = 0.0,
+        created_at: str | None = None,
     ) -> None:
-        await self.initialize()
-        async with aiosqlite.connect(self._db_path) as db:
-            await db.execute(
-                "INSERT INTO facts(id, entity, attribute, value, confidence, created_at, "
-                "source, evidence, verification_status, last_confirmed_at, salience) "
-                "VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-                (
-                    str(fact_id),
-                    entity,
-                    attribute,
-                    value,
-                    float(confidence),
-                    self._now_iso(),
-                    source,
-                    evidence,
-                    verification_status,
-                    last_confirmed_at,
-                    max(0.0, min(1.0, float(salience))),
-                ),
-            )
-            await db.commit()
+        await self._group_write([(
+            "INSERT INTO facts(id, entity, attribute, value, confidence, created_at, "
+            "source, evidence, verification_status, last_confirmed_at, salience) "
+            "VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                str(fact_id),
+                entity,
+                attribute,
+                value,
+                float(confidence),
+                created_at or self._now_iso(),
+                source,
+                evidence,
+                verification_status,
+                last_confirmed_at,
+                max(0.0, min(1.0, float(salience))),
+            ),
+        )])
 
     async def touch_facts_accessed(self, fact_ids: list[str]) -> None:
         """Record that these facts were RETRIEVED — the testing effect.
@@ -832,7 +1204,7 @@ class SQLiteMemoryBackend:
             return
         await self.initialize()
         now = self._now_iso()
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self._connect() as db:
             await db.executemany(
                 "UPDATE facts SET access_count = COALESCE(access_count, 0) + 1, "
                 "last_accessed_at = ? WHERE id = ?",
@@ -845,7 +1217,7 @@ class SQLiteMemoryBackend:
         last_confirmed_at, set status to 'confirmed', and attach evidence if
         given without clobbering any existing evidence."""
         await self.initialize()
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self._connect() as db:
             await db.execute(
                 "UPDATE facts SET verification_status='confirmed', last_confirmed_at=?, "
                 "evidence=COALESCE(?, evidence) WHERE id=?",
@@ -858,38 +1230,32 @@ class SQLiteMemoryBackend:
         (assumptions are excluded — they are already flagged, not 'stale'). A
         future re-verification worker consumes this; kept read-only for now."""
         await self.initialize()
-        async with aiosqlite.connect(self._db_path) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute(
+        async with self._read() as db:
+            return await _fetch_dicts(
+                db,
                 "SELECT id, entity, attribute, value, verification_status, last_confirmed_at, created_at "
                 "FROM facts WHERE verification_status IN ('stated','observed','external','confirmed') "
                 "AND COALESCE(last_confirmed_at, created_at) < ? ORDER BY COALESCE(last_confirmed_at, created_at) ASC LIMIT ?",
                 (before_iso, int(limit)),
-            ) as cur:
-                rows = await cur.fetchall()
-        return [dict(r) for r in rows]
-
-    async def upsert_person(self, person_id: UUID, name: str, attributes_json: str) -> None:
-        await self.initialize()
-        async with aiosqlite.connect(self._db_path) as db:
-            await db.execute(
-                """
-                INSERT INTO people(id, name, attributes_json, created_at)
-                VALUES(?, ?, ?, ?)
-                ON CONFLICT(name) DO UPDATE SET attributes_json=excluded.attributes_json
-                """,
-                (str(person_id), name, attributes_json, self._now_iso()),
             )
-            await db.commit()
 
-    async def add_event(self, event_id: UUID, date: str, note: str) -> None:
-        await self.initialize()
-        async with aiosqlite.connect(self._db_path) as db:
-            await db.execute(
-                "INSERT INTO events(id, date, note, created_at) VALUES(?, ?, ?, ?)",
-                (str(event_id), date, note, self._now_iso()),
-            )
-            await db.commit()
+    async def upsert_person(
+        self, person_id: UUID, name: str, attributes_json: str, *, created_at: str | None = None
+    ) -> None:
+        await self._group_write([(
+            """
+            INSERT INTO people(id, name, attributes_json, created_at)
+            VALUES(?, ?, ?, ?)
+            ON CONFLICT(name) DO UPDATE SET attributes_json=excluded.attributes_json
+            """,
+            (str(person_id), name, attributes_json, created_at or self._now_iso()),
+        )])
+
+    async def add_event(self, event_id: UUID, date: str, note: str, *, created_at: str | None = None) -> None:
+        await self._group_write([
+            ("INSERT INTO events(id, date, note, created_at) VALUES(?, ?, ?, ?)",
+             (str(event_id), date, note, created_at or self._now_iso())),
+        ])
 
     async def recent_turns(self, conversation_id: UUID | None, limit: int = 50) -> list[dict[str, Any]]:
         await self.initialize()
@@ -902,11 +1268,8 @@ class SQLiteMemoryBackend:
             params = ()
         query += " ORDER BY created_at DESC LIMIT ?"
         params = (*params, int(limit))
-        async with aiosqlite.connect(self._db_path) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute(query, params) as cur:
-                rows = await cur.fetchall()
-        return [dict(r) for r in rows]
+        async with self._read() as db:
+            return await _fetch_dicts(db, query, params)
 
     async def search_turns(
         self,
@@ -939,26 +1302,27 @@ class SQLiteMemoryBackend:
             sql += " WHERE " + " AND ".join(where)
         sql += " ORDER BY created_at DESC LIMIT ?"
         params.append(int(limit))
-        async with aiosqlite.connect(self._db_path) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute(sql, tuple(params)) as cur:
-                rows = await cur.fetchall()
-        return [dict(r) for r in rows]
+        async with self._read() as db:
+            return await _fetch_dicts(db, sql, tuple(params))
+
+    @staticmethod
+    def _fts_phrase(q: str) -> str | None:
+        """`q` as a trigram MATCH phrase, or None when only LIKE can answer it:
+        under 3 characters there is no trigram to look up, and % / _ are LIKE
+        wildcards that a phrase would take literally."""
+        if len(q) < 3 or "%" in q or "_" in q:
+            return None
+        return '"' + q.replace('"', '""') + '"'
 
     async def search_facts(self, q: str, limit: int = 20) -> list[dict[str, Any]]:
-        await self.initialize()
-        like = f"%{q}%"
-        async with aiosqlite.connect(self._db_path) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute(
-                "SELECT id, entity, attribute, value, confidence, created_at, last_reinforced_at, "
-                "source, evidence, verification_status, last_confirmed_at, "
-                "access_count, last_accessed_at, salience FROM facts "
-                "WHERE entity LIKE ? OR attribute LIKE ? OR value LIKE ? ORDER BY created_at DESC LIMIT ?",
-                (like, like, like, int(limit)),
-            ) as cur:
-                rows = await cur.fetchall()
-        return [dict(r) for r in rows]
+        return await self.search_facts_any([q], limit)
+
+    async def search_facts_any(self, terms: list[str], limit: int = 20) -> list[dict[str, Any]]:
+        """search_facts for several terms in one statement: each term's rows
+        in turn, exactly as search_facts(term, limit) returns them (a row that
+        matches two terms appears twice)."""
+        return await self._search_terms(_FACT_SEARCH, "facts_fts", ("entity", "attribute", "value"),
+                                        "created_at DESC", terms, limit)
 
     async def reinforce_fact(self, fact_id: str) -> None:
         """Re-mention of an existing fact: touch last_reinforced_at and nudge
@@ -967,106 +1331,117 @@ class SQLiteMemoryBackend:
         (#19) — the verification_status label is left unchanged (only an
         explicit confirm_fact promotes it)."""
         await self.initialize()
-        async with aiosqlite.connect(self._db_path) as db:
+        now = self._now_iso()
+        async with self._connect() as db:
             await db.execute(
                 "UPDATE facts SET last_reinforced_at=?, last_confirmed_at=?, "
                 "confidence=MIN(0.95, confidence + 0.05) WHERE id=?",
-                (self._now_iso(), self._now_iso(), fact_id),
+                (now, now, fact_id),
             )
             await db.commit()
 
     async def get_person_by_name(self, name: str) -> dict[str, Any] | None:
         await self.initialize()
-        async with aiosqlite.connect(self._db_path) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute(
-                "SELECT id, name, attributes_json, created_at FROM people WHERE name = ?", (name,)
-            ) as cur:
-                row = await cur.fetchone()
-        return dict(row) if row else None
+        async with self._read() as db:
+            rows = await _fetch_dicts(db, "SELECT id, name, attributes_json, created_at FROM people WHERE name = ?", (name,))
+        return rows[0] if rows else None
 
     async def search_people(self, q: str, limit: int = 10) -> list[dict[str, Any]]:
-        await self.initialize()
-        like = f"%{q}%"
-        async with aiosqlite.connect(self._db_path) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute(
-                "SELECT id, name, attributes_json, created_at FROM people WHERE name LIKE ? OR attributes_json LIKE ? ORDER BY name LIMIT ?",
-                (like, like, int(limit)),
-            ) as cur:
-                rows = await cur.fetchall()
-        return [dict(r) for r in rows]
+        return await self.search_people_any([q], limit)
+
+    async def search_people_any(self, terms: list[str], limit: int = 10) -> list[dict[str, Any]]:
+        """search_people per term, in one statement (see search_facts_any)."""
+        return await self._search_terms(_PERSON_SEARCH, "people_fts", ("name", "attributes_json"),
+                                        "name", terms, limit)
 
     async def search_events(self, q: str, limit: int = 10) -> list[dict[str, Any]]:
+        return await self.search_events_any([q], limit)
+
+    async def search_events_any(self, terms: list[str], limit: int = 10) -> list[dict[str, Any]]:
+        """search_events per term, in one statement (see search_facts_any)."""
+        return await self._search_terms(_EVENT_SEARCH, "events_fts", ("date", "note"),
+                                        "date DESC", terms, limit)
+
+    async def _search_terms(
+        self, select: str, fts: str, like_cols: tuple[str, ...], order: str, terms: list[str], limit: int
+    ) -> list[dict[str, Any]]:
+        # One UNION ALL arm per term, so a search() fan-out of 8 terms is one
+        # round-trip per table instead of eight. Each arm keeps its own ORDER
+        # BY/LIMIT, so no term's matches crowd out another's.
         await self.initialize()
-        like = f"%{q}%"
-        async with aiosqlite.connect(self._db_path) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute(
-                "SELECT id, date, note, created_at FROM events WHERE date LIKE ? OR note LIKE ? ORDER BY date DESC LIMIT ?",
-                (like, like, int(limit)),
-            ) as cur:
-                rows = await cur.fetchall()
-        return [dict(r) for r in rows]
+        arms: list[str] = []
+        params: list[Any] = []
+        for q in terms:
+            phrase = self._fts_phrase(q)
+            if phrase is not None:
+                where = f"rowid IN (SELECT rowid FROM {fts} WHERE {fts} MATCH ?)"
+                params.append(phrase)
+            else:
+                where = " OR ".join(f"{c} LIKE ?" for c in like_cols)
+                params.extend([f"%{q}%"] * len(like_cols))
+            arms.append(f"SELECT * FROM ({select} WHERE {where} ORDER BY {order} LIMIT ?)")
+            params.append(int(limit))
+        if not arms:
+            return []
+        async with self._read() as db:
+            return await _fetch_dicts(db, " UNION ALL ".join(arms), tuple(params))
 
 
     async def count_records(self) -> dict[str, int]:
         """Return counts for durable tables used for long-term memory."""
         await self.initialize()
-        async with aiosqlite.connect(self._db_path) as db:
-            facts = await (await db.execute("SELECT COUNT(1) FROM facts")).fetchone()
-            people = await (await db.execute("SELECT COUNT(1) FROM people")).fetchone()
-            events = await (await db.execute("SELECT COUNT(1) FROM events")).fetchone()
-        return {
-            "facts": int((facts or [0])[0] or 0),
-            "people": int((people or [0])[0] or 0),
-            "events": int((events or [0])[0] or 0),
-        }
+        async with self._read() as db:
+            async with db.execute(
+                "SELECT (SELECT COUNT(1) FROM facts), (SELECT COUNT(1) FROM people), (SELECT COUNT(1) FROM events)"
+            ) as cur:
+                row = await cur.fetchone()
+        facts, people, events = row or (0, 0, 0)
+        return {"facts": int(facts or 0), "people": int(people or 0), "events": int(events or 0)}
 
 
-    async def all_facts(self, limit: int | None = None) -> list[dict[str, Any]]:
+    async def query(self, sql: str, params: Any = ()) -> list[dict[str, Any]]:
+        """Run an ad-hoc SELECT on a pooled reader, rows as dicts. For callers
+        that build their own filters (MemoryUnifier.get_facts/purge_facts)
+        instead of opening a connection of their own per call."""
         await self.initialize()
-        sql = (
-            "SELECT id, entity, attribute, value, confidence, created_at, "
-            "source, evidence, verification_status, last_confirmed_at FROM facts ORDER BY created_at ASC"
-        )
-        params: tuple[Any, ...] = ()
-        if limit is not None:
-            sql += " LIMIT ?"
-            params = (int(limit),)
-        async with aiosqlite.connect(self._db_path) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute(sql, params) as cur:
-                rows = await cur.fetchall()
-        return [dict(r) for r in rows]
+        async with self._read() as db:
+            return await _fetch_dicts(db, sql, params)
 
+    # iter_* stream a whole table a batch at a time for callers that handle
+    # one row at a time (rebuilding the semantic index); all_* are the same
+    # rows as a list. An iterator holds a pooled reader until it's exhausted.
 
-    async def all_people(self, limit: int | None = None) -> list[dict[str, Any]]:
+    async def _iter_all(self, sql: str, limit: int | None) -> AsyncIterator[dict[str, Any]]:
         await self.initialize()
-        sql = "SELECT id, name, attributes_json, created_at FROM people ORDER BY name ASC"
         params: tuple[Any, ...] = ()
         if limit is not None:
             sql += " LIMIT ?"
             params = (int(limit),)
-        async with aiosqlite.connect(self._db_path) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute(sql, params) as cur:
-                rows = await cur.fetchall()
-        return [dict(r) for r in rows]
+        async with self._read() as db:
+            async for row in _iter_dicts(db, sql, params):
+                yield row
 
+    def iter_facts(self, limit: int | None = None) -> AsyncIterator[dict[str, Any]]:
+        return self._iter_all(
+            "SELECT id, entity, attribute, value, confidence, created_at, "
+            "source, evidence, verification_status, last_confirmed_at FROM facts ORDER BY created_at ASC",
+            limit,
+        )
+
+    def iter_people(self, limit: int | None = None) -> AsyncIterator[dict[str, Any]]:
+        return self._iter_all("SELECT id, name, attributes_json, created_at FROM people ORDER BY name ASC", limit)
+
+    def iter_events(self, limit: int | None = None) -> AsyncIterator[dict[str, Any]]:
+        return self._iter_all("SELECT id, date, note, created_at FROM events ORDER BY date ASC", limit)
+
+    async def all_facts(self, limit: int | None = None) -> list[dict[str, Any]]:
+        return [row async for row in self.iter_facts(limit)]
+
+    async def all_people(self, limit: int | None = None) -> list[dict[str, Any]]:
+        return [row async for row in self.iter_people(limit)]
 
     async def all_events(self, limit: int | None = None) -> list[dict[str, Any]]:
-        await self.initialize()
-        sql = "SELECT id, date, note, created_at FROM events ORDER BY date ASC"
-        params: tuple[Any, ...] = ()
-        if limit is not None:
-            sql += " LIMIT ?"
-            params = (int(limit),)
-        async with aiosqlite.connect(self._db_path) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute(sql, params) as cur:
-                rows = await cur.fetchall()
-        return [dict(r) for r in rows]
+        return [row async for row in self.iter_events(limit)]
 
     # --- Reminders / scheduling ------------------------------------------------
 
@@ -1082,7 +1457,7 @@ class SQLiteMemoryBackend:
     ) -> None:
         await self.initialize()
         now = self._now_iso()
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self._connect() as db:
             await db.execute(
                 "INSERT INTO reminders(reminder_id, title, details, due_at, recurrence, status, created_at, updated_at) "
                 "VALUES(?, ?, ?, ?, ?, ?, ?, ?)",
@@ -1099,29 +1474,24 @@ class SQLiteMemoryBackend:
             params.append(status)
         sql += " ORDER BY due_at ASC LIMIT ?"
         params.append(int(limit))
-        async with aiosqlite.connect(self._db_path) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute(sql, tuple(params)) as cur:
-                rows = await cur.fetchall()
-        return [dict(r) for r in rows]
+        async with self._read() as db:
+            return await _fetch_dicts(db, sql, tuple(params))
 
     async def due_reminders(self, *, now_iso: str, limit: int = 20) -> list[dict[str, Any]]:
         await self.initialize()
-        async with aiosqlite.connect(self._db_path) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute(
+        async with self._read() as db:
+            return await _fetch_dicts(
+                db,
                 "SELECT reminder_id, title, details, due_at, recurrence, status FROM reminders "
                 "WHERE status='pending' AND due_at <= ? ORDER BY due_at ASC LIMIT ?",
                 (now_iso, int(limit)),
-            ) as cur:
-                rows = await cur.fetchall()
-        return [dict(r) for r in rows]
+            )
 
     async def reschedule_reminder(self, *, reminder_id: str, next_due_at_iso: str) -> None:
         """Fire-and-reschedule for a recurring reminder — stays 'pending'."""
         await self.initialize()
         now = self._now_iso()
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self._connect() as db:
             await db.execute(
                 "UPDATE reminders SET due_at=?, updated_at=? WHERE reminder_id=?",
                 (next_due_at_iso, now, reminder_id),
@@ -1131,7 +1501,7 @@ class SQLiteMemoryBackend:
     async def set_reminder_status(self, *, reminder_id: str, status: str) -> None:
         await self.initialize()
         now = self._now_iso()
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self._connect() as db:
             await db.execute(
                 "UPDATE reminders SET status=?, updated_at=? WHERE reminder_id=?",
                 (status, now, reminder_id),
@@ -1142,7 +1512,7 @@ class SQLiteMemoryBackend:
 
     async def get_document_mtime(self, path: str) -> float | None:
         await self.initialize()
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self._read() as db:
             async with db.execute("SELECT mtime FROM documents WHERE path=?", (path,)) as cur:
                 row = await cur.fetchone()
         return float(row[0]) if row else None
@@ -1150,7 +1520,7 @@ class SQLiteMemoryBackend:
     async def upsert_document(self, *, path: str, excerpt: str, mtime: float) -> None:
         await self.initialize()
         now = self._now_iso()
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self._connect() as db:
             await db.execute(
                 "INSERT INTO documents(path, excerpt, mtime, indexed_at) VALUES(?, ?, ?, ?) "
                 "ON CONFLICT(path) DO UPDATE SET excerpt=excluded.excerpt, mtime=excluded.mtime, indexed_at=excluded.indexed_at",
@@ -1163,38 +1533,34 @@ class SQLiteMemoryBackend:
         semantic index (Chroma) is degraded — mirrors search_facts/etc."""
         await self.initialize()
         like = f"%{q}%"
-        async with aiosqlite.connect(self._db_path) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute(
+        async with self._read() as db:
+            return await _fetch_dicts(
+                db,
                 "SELECT path, excerpt, mtime, indexed_at FROM documents WHERE path LIKE ? OR excerpt LIKE ? "
                 "ORDER BY indexed_at DESC LIMIT ?",
                 (like, like, int(limit)),
-            ) as cur:
-                rows = await cur.fetchall()
-        return [dict(r) for r in rows]
+            )
 
     async def list_documents(self, *, limit: int = 200) -> list[dict[str, Any]]:
         await self.initialize()
-        async with aiosqlite.connect(self._db_path) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute(
+        async with self._read() as db:
+            return await _fetch_dicts(
+                db,
                 "SELECT path, excerpt, mtime, indexed_at FROM documents ORDER BY indexed_at DESC LIMIT ?", (int(limit),)
-            ) as cur:
-                rows = await cur.fetchall()
-        return [dict(r) for r in rows]
+            )
 
     # --- Deeper document synthesis (DS1) ----------------------------------------
 
     async def document_chunk_count(self, path: str) -> int:
         await self.initialize()
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self._read() as db:
             async with db.execute("SELECT COUNT(1) FROM document_chunks WHERE path=?", (path,)) as cur:
                 row = await cur.fetchone()
         return int(row[0]) if row else 0
 
     async def replace_document_chunks(self, path: str, chunks: list[str]) -> None:
         await self.initialize()
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self._connect() as db:
             await db.execute("DELETE FROM document_chunks WHERE path=?", (path,))
             await db.executemany(
                 "INSERT INTO document_chunks(path, chunk_index, text) VALUES(?, ?, ?)",
@@ -1207,19 +1573,17 @@ class SQLiteMemoryBackend:
         search_documents, but at chunk granularity for synthesis queries."""
         await self.initialize()
         like = f"%{q}%"
-        async with aiosqlite.connect(self._db_path) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute(
+        async with self._read() as db:
+            return await _fetch_dicts(
+                db,
                 "SELECT path, chunk_index, text FROM document_chunks WHERE text LIKE ? LIMIT ?", (like, int(limit))
-            ) as cur:
-                rows = await cur.fetchall()
-        return [dict(r) for r in rows]
+            )
 
     # --- Habit & pattern learning (HP1) -----------------------------------------
 
     async def log_tool_usage(self, tool_name: str) -> None:
         await self.initialize()
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self._connect() as db:
             await db.execute(
                 "INSERT INTO tool_usage_log(tool_name, called_at) VALUES(?, ?)", (tool_name, self._now_iso())
             )
@@ -1227,7 +1591,7 @@ class SQLiteMemoryBackend:
 
     async def distinct_logged_tools(self, since_iso: str) -> list[str]:
         await self.initialize()
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self._read() as db:
             async with db.execute(
                 "SELECT DISTINCT tool_name FROM tool_usage_log WHERE called_at >= ?", (since_iso,)
             ) as cur:
@@ -1238,7 +1602,7 @@ class SQLiteMemoryBackend:
         """Raw called_at timestamps for one tool since a given time — the
         caller does the hour/day clustering (keeps the SQL simple)."""
         await self.initialize()
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self._read() as db:
             async with db.execute(
                 "SELECT called_at FROM tool_usage_log WHERE tool_name=? AND called_at >= ? ORDER BY called_at ASC",
                 (tool_name, since_iso),
@@ -1275,19 +1639,22 @@ class SQLiteMemoryBackend:
                 LIMIT ?
             """
             params: list[Any] = [entity, attribute, pat, int(limit)]
+        elif len(vals) > _MAX_INLINE_IN:
+            # A long list goes in as ONE JSON-array parameter instead: no
+            # bound-parameter limit, and one statement for every size. (A temp
+            # table to JOIN against isn't an option on a query_only reader.)
+            sql = (
+                "SELECT id FROM facts WHERE entity = ? AND attribute = ? "
+                "AND LOWER(value) IN (SELECT value FROM json_each(?)) ORDER BY created_at DESC LIMIT ?"
+            )
+            params = [entity, attribute, json.dumps(vals), int(limit)]
         else:
-            placeholders = ",".join(["?"] * len(vals))
-            sql = f"""
-                SELECT id FROM facts
-                WHERE entity = ?
-                  AND attribute = ?
-                  AND LOWER(value) IN ({placeholders})
-                ORDER BY created_at DESC
-                LIMIT ?
-            """
-            params = [entity, attribute, *vals, int(limit)]
+            sql = _fact_ids_in_sql(len(vals))
+            # Pad to the statement's arity with NULLs, which IN never matches.
+            pad = sql.count("?") - 3 - len(vals)
+            params = [entity, attribute, *vals, *([None] * pad), int(limit)]
 
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self._read() as db:
             cur = await db.execute(sql, params)
             rows = await cur.fetchall()
         return [r[0] for r in rows if r and r[0]]
@@ -1298,12 +1665,18 @@ class SQLiteMemoryBackend:
         ids = [str(i) for i in (ids or []) if str(i).strip()]
         if not ids:
             return 0
-        placeholders = ",".join(["?"] * len(ids))
-        sql = f"DELETE FROM facts WHERE id IN ({placeholders})"
-        async with aiosqlite.connect(self._db_path) as db:
-            cur = await db.execute(sql, ids)
+        # One statement per _MAX_BOUND_IDS ids: SQLite caps bound parameters
+        # per statement (SQLITE_MAX_VARIABLE_NUMBER, as low as 999 in older
+        # builds), so a big purge in one IN (...) would fail outright. The
+        # chunks share one transaction, so it's still all-or-nothing.
+        deleted = 0
+        async with self._connect() as db:
+            for i in range(0, len(ids), _MAX_BOUND_IDS):
+                chunk = ids[i:i + _MAX_BOUND_IDS]
+                cur = await db.execute(f"DELETE FROM facts WHERE id IN ({','.join('?' * len(chunk))})", chunk)
+                deleted += int(cur.rowcount or 0)
             await db.commit()
-            return int(cur.rowcount or 0)
+        return deleted
 
 
     # ---------------- Agentic goal/task/proposal APIs ----------------
@@ -1321,7 +1694,7 @@ class SQLiteMemoryBackend:
     ) -> None:
         await self.initialize()
         now = self._now_iso()
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self._connect() as db:
             await db.execute(
                 "INSERT INTO goals(goal_id, project_name, title, objective, success_criteria, status, priority, created_at, updated_at) VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?)",
                 (str(goal_id), project_name, title, objective, success_criteria, status, int(priority), now, now),
@@ -1331,7 +1704,7 @@ class SQLiteMemoryBackend:
     async def update_goal_status(self, *, goal_id: UUID, status: str) -> None:
         await self.initialize()
         now = self._now_iso()
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self._connect() as db:
             await db.execute("UPDATE goals SET status=?, updated_at=? WHERE goal_id=?", (status, now, str(goal_id)))
             await db.commit()
 
@@ -1344,7 +1717,7 @@ class SQLiteMemoryBackend:
             params.append(project_name)
         q += " ORDER BY updated_at DESC LIMIT ?"
         params.append(int(limit))
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self._read() as db:
             cur = await db.execute(q, params)
             rows = await cur.fetchall()
         out = []
@@ -1379,7 +1752,7 @@ class SQLiteMemoryBackend:
         await self.initialize()
         now = self._now_iso()
         run_after = run_after_iso or now
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self._connect() as db:
             await db.execute(
                 "INSERT INTO tasks(task_id, goal_id, project_name, tool_name, args_json, status, attempts, run_after, last_error, result_json, created_at, updated_at) VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
                 (
@@ -1402,8 +1775,10 @@ class SQLiteMemoryBackend:
     async def claim_next_task(self) -> dict[str, Any] | None:
         await self.initialize()
         now = self._now_iso()
-        async with aiosqlite.connect(self._db_path) as db:
-            # Claim a single runnable task atomically-ish (SQLite single writer).
+        async with self._connect() as db:
+            # Claim a single runnable task atomically: the write lock is taken
+            # before the SELECT (see claim_next_autonomy_task).
+            await db.execute("BEGIN IMMEDIATE")
             cur = await db.execute(
                 "SELECT task_id, goal_id, project_name, tool_name, args_json, attempts FROM tasks WHERE status='queued' AND run_after <= ? ORDER BY updated_at ASC LIMIT 1",
                 (now,),
@@ -1419,7 +1794,7 @@ class SQLiteMemoryBackend:
     async def complete_task(self, *, task_id: str, status: str, result: dict[str, Any] | None = None, error: str = "") -> None:
         await self.initialize()
         now = self._now_iso()
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self._connect() as db:
             await db.execute(
                 "UPDATE tasks SET status=?, result_json=?, last_error=?, updated_at=? WHERE task_id=?",
                 (
@@ -1435,7 +1810,7 @@ class SQLiteMemoryBackend:
     async def bump_task_attempt(self, *, task_id: str, attempts: int, run_after_iso: str, error: str) -> None:
         await self.initialize()
         now = self._now_iso()
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self._connect() as db:
             await db.execute(
                 "UPDATE tasks SET status='queued', attempts=?, run_after=?, last_error=?, updated_at=? WHERE task_id=?",
                 (int(attempts), run_after_iso, error, now, task_id),
@@ -1457,7 +1832,7 @@ class SQLiteMemoryBackend:
             q += " WHERE " + " AND ".join(where)
         q += " ORDER BY updated_at DESC LIMIT ?"
         params.append(int(limit))
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self._read() as db:
             cur = await db.execute(q, params)
             rows = await cur.fetchall()
         out=[]
@@ -1480,7 +1855,7 @@ class SQLiteMemoryBackend:
     ) -> None:
         await self.initialize()
         now = self._now_iso()
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self._connect() as db:
             await db.execute(
                 "INSERT INTO proposals(proposal_id, goal_id, project_name, suggestion, rationale, status, created_at, decided_at) VALUES(?, ?, ?, ?, ?, ?, ?, ?)",
                 (str(proposal_id), str(goal_id), project_name, suggestion, rationale, status, now, None),
@@ -1489,7 +1864,7 @@ class SQLiteMemoryBackend:
 
     async def latest_pending_proposal(self, *, project_name: str) -> dict[str, Any] | None:
         await self.initialize()
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self._read() as db:
             cur = await db.execute(
                 "SELECT proposal_id, goal_id, suggestion, rationale, created_at FROM proposals WHERE project_name=? AND status='pending' ORDER BY created_at DESC LIMIT 1",
                 (project_name,),
@@ -1502,14 +1877,14 @@ class SQLiteMemoryBackend:
     async def set_proposal_status(self, *, proposal_id: str, status: str) -> None:
         await self.initialize()
         now = self._now_iso()
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self._connect() as db:
             await db.execute("UPDATE proposals SET status=?, decided_at=? WHERE proposal_id=?", (status, now, proposal_id))
             await db.commit()
 
     async def add_progress_event(self, *, event_id: UUID, goal_id: UUID, project_name: str, kind: str, message: str) -> None:
         await self.initialize()
         now = self._now_iso()
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self._connect() as db:
             await db.execute(
                 "INSERT INTO progress_events(event_id, goal_id, project_name, kind, message, created_at, acknowledged) VALUES(?, ?, ?, ?, ?, ?, 0)",
                 (str(event_id), str(goal_id), project_name, kind, message, now),
@@ -1518,7 +1893,7 @@ class SQLiteMemoryBackend:
 
     async def fetch_unacked_progress(self, *, project_name: str, limit: int = 10) -> list[dict[str, Any]]:
         await self.initialize()
-        async with aiosqlite.connect(self._db_path) as db:
+        async with self._connect() as db:
             cur = await db.execute(
                 "SELECT event_id, goal_id, kind, message, created_at FROM progress_events WHERE project_name=? AND acknowledged=0 ORDER BY created_at ASC LIMIT ?",
                 (project_name, int(limit)),
@@ -95,28 +95,94 @@ def load_error() -> str | None:
     return _load_failed
 
 
-def embed_texts(texts: list[str]) -> list[list[float]]:
-    """Encode texts to normalized 384-dim vectors (CLS pooling, bge-style).
+class _Request:
+    __slots__ = ("texts", "vectors", "error")
 
-    Raises if the model is unavailable — call embedding_available() first.
-    """
-    if not embedding_available():
-        raise RuntimeError(f"embedding model unavailable: {_load_failed}")
+    def __init__(self, texts: list[str]) -> None:
+        self.texts = texts
+        self.vectors: list[list[float]] | None = None
+        self.error: BaseException | None = None
+
+
+# Calls that arrive while a forward pass is running queue here, and the next
+# caller to find the model idle encodes all of them in one pass. Memory search,
+# the semantic cache and the ingest worker all embed from their own threads;
+# one-at-a-time they'd each pay a full forward pass for a handful of texts.
+# No timer window: an idle model starts immediately, so a lone call waits for
+# nothing it didn't wait for before.
+_batch_cv = threading.Condition()
+_pending: list[_Request] = []
+_busy = False
 
+
+def _encode(cleaned: list[str]) -> list[list[float]]:
     import torch  # type: ignore
 
-    cleaned = [(t or "").strip()[:2000] or " " for t in texts]
-    out: list[list[float]] = []
+    out: list[list[float]] = [[] for _ in cleaned]
     batch_size = 32
+    # Batches are cut from the texts sorted by length: each batch pads to its
+    # longest text, so mixing a one-liner with a 2000-char chunk (a rebuild,
+    # a coalesced pass) would run the one-liner at full length. Vectors are
+    # put back in input order.
+    order = sorted(range(len(cleaned)), key=lambda i: len(cleaned[i]))
 
     with torch.inference_mode():
-        for i in range(0, len(cleaned), batch_size):
-            batch = cleaned[i : i + batch_size]
+        for i in range(0, len(order), batch_size):
+            idx = order[i : i + batch_size]
+            batch = [cleaned[j] for j in idx]
             enc = _tokenizer(batch, padding=True, truncation=True, max_length=512, return_tensors="pt").to(_device)
             hidden = _model(**enc).last_hidden_state
             # bge models: CLS token pooling + L2 normalize.
             cls = hidden[:, 0]
             cls = torch.nn.functional.normalize(cls, p=2, dim=1)
-            out.extend(cls.float().cpu().tolist())
+            for j, vec in zip(idx, cls.float().cpu().tolist()):
+                out[j] = vec
 
     return out
+
+
+def embed_texts(texts: list[str]) -> list[list[float]]:
+    """Encode texts to normalized 384-dim vectors (CLS pooling, bge-style).
+
+    Concurrent callers are coalesced into shared forward passes.
+    Raises if the model is unavailable — call embedding_available() first.
+    """
+    global _busy
+    if not embedding_available():
+        raise RuntimeError(f"embedding model unavailable: {_load_failed}")
+
+    req = _Request([(t or "").strip()[:2000] or " " for t in texts])
+    if not req.texts:
+        return []
+
+    with _batch_cv:
+        _pending.append(req)
+        while _busy and req.vectors is None and req.error is None:
+            _batch_cv.wait()
+        if req.vectors is None and req.error is None:
+            # Idle model and still queued: this caller runs the pass for
+            # everything that piled up, its own request included.
+            _busy = True
+            batch = _pending[:]
+            _pending.clear()
+        else:
+            batch = []
+
+    if batch:
+        try:
+            vecs = _encode([t for r in batch for t in r.texts])
+            at = 0
+            for r in batch:
+                r.vectors = vecs[at : at + len(r.texts)]
+                at += len(r.texts)
+        except BaseException as e:  # noqa: BLE001
+            for r in batch:
+                r.error = e
+        finally:
+            with _batch_cv:
+                _busy = False
+                _batch_cv.notify_all()
+
+    if req.error is not None:
+        raise req.error
+    return req.vectors or []
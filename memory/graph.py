@@ -41,8 +41,12 @@ FAMILY_ATTR_PREDICATES = {
 }
 
 
+_WS_RE = re.compile(r"\s+")
+_NON_ALNUM_RUN_RE = re.compile(r"[^a-z0-9]+")
+
+
 def norm_key(value: str) -> str:
-    v = re.sub(r"\s+", " ", (value or "").strip().lower())
+    v = _WS_RE.sub(" ", (value or "").strip().lower())
     return v[:120]
 
 
@@ -311,7 +315,7 @@ def person_relation_edge(name: str, attributes: dict[str, Any]) -> Edge | None:
     relation = norm_key(str(attributes.get("relation") or ""))
     if not relation or relation == "user":
         return None
-    predicate = re.sub(r"[^a-z0-9]+", "_", relation).strip("_")[:40] or "related_to"
+    predicate = _NON_ALNUM_RUN_RE.sub("_", relation).strip("_")[:40] or "related_to"
     return Edge("person", name, predicate + "_of", "person", "user")
 
 
@@ -1,16 +1,21 @@
 from __future__ import annotations
 
 import asyncio
-
-import aiosqlite
+import hashlib
 import json
 import os
 import re
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 from uuid import UUID, uuid4
 
+import orjson
+from pydantic import TypeAdapter
+
 from core.dates import parse_month_day
 from core.digital_twin import DigitalTwinInputs, derive_profile
 from core.executive import ExecutiveContext, recommend
@@ -40,9 +45,109 @@ IGNORE_TURN_KINDS = {"turn", "turn_user", "turn_assistant"}
 # group. See core/runtime.py (capture + injection) and the reflection pass.
 LESSON_ENTITY = "lesson"
 
+# Compiled once: search() runs per chat turn, the slug helpers per write.
+_NON_ALNUM_RUN_RE = re.compile(r"[^a-z0-9]+")
+_NON_ALNUM_SPACE_RE = re.compile(r"[^a-z0-9 ]+")
+_QUERY_TERM_RE = re.compile(r"[a-z0-9']+")
+_AI_WORD_RE = re.compile(r"\bai\b")
+_ID_WORD_RE = re.compile(r"\bid\b")
+# get_facts' four statement shapes, built once: identical text per call is
+# also what lets the reader connections' statement caches hit.
+_GET_FACTS_SQL: dict[tuple[bool, bool], str] = {
+    (by_attr, newest): (
+        "SELECT id, entity, attribute, value, confidence, created_at, "
+        "source, evidence, verification_status, last_confirmed_at "
+        "FROM facts WHERE entity = ?" + (" AND attribute = ?" if by_attr else "")
+        + f" ORDER BY created_at {'DESC' if newest else 'ASC'} LIMIT ?"
+    )
+    for by_attr in (False, True)
+    for newest in (False, True)
+}
+# search() results go to diskcache as JSON bytes: pydantic encodes and parses
+# them in one native pass each, where a pickled list of model_dump() dicts
+# paid for building the dicts and then validating every one back.
+_HITS_JSON = TypeAdapter(list[MemoryHit])
+# MemoryUnifier._write_locks: one per kind of record (see __init__).
+_WRITE_LOCK_KINDS = ("turn", "fact", "person", "event", "reminder", "document", "task", "goal")
+# search() result caching: diskcache TTL, and how many results stay in memory.
+_SEARCH_TTL_S = 120
+_SEARCH_L1_MAX = 256
+# Documents per Chroma upsert, for the rebuild and the write-behind queue.
+_INDEX_BATCH = 200
+# How long a queued index write waits for company before it is flushed.
+_INDEX_DELAY_S = 0.2
+# Lightweight synonym expansion for common relationship queries.
+_QUERY_SYNONYMS: dict[str, tuple[str, ...]] = {
+    "mom": ("mother",),
+    "mother": ("mom",),
+    "dad": ("father",),
+    "father": ("dad",),
+}
+
+# add_fact's write guard: values that are the relationship word itself
+# ("my wife's name is... name") rather than a name, per attribute.
+_DENY_BY_ATTR: dict[str, frozenset[str]] = {
+    "spouse": frozenset({"name", "names", "spouse", "wife", "husband", "partner"}),
+    "child": frozenset({"name", "names", "child", "children", "kid", "kids", "son", "sons", "daughter", "daughters"}),
+    "parent": frozenset({"name", "names", "parent", "parents", "mom", "mother", "dad", "father"}),
+    "mother": frozenset({"name", "names", "mom", "mother"}),
+    "father": frozenset({"name", "names", "dad", "father"}),
+    "sibling": frozenset({"name", "names", "sibling", "siblings", "brother", "brothers", "sister", "sisters"}),
+    "cousin": frozenset({"name", "names", "cousin", "cousins"}),
+    "friend": frozenset({"name", "names", "friend", "friends", "buddy", "buddies"}),
+    "pet": frozenset({"name", "names", "pet", "pets", "dog", "dogs", "cat", "cats"}),
+    "coworker": frozenset({"name", "names", "coworker", "coworkers", "colleague", "colleagues"}),
+}
+
+
+# Timestamps repeat a lot across fact reads (the same recent rows come back
+# for every query), and datetimes are immutable, so parses are shared.
+# fromisoformat takes a trailing "Z" as UTC itself since Python 3.11.
+_parse_iso = lru_cache(maxsize=4096)(datetime.fromisoformat)
+
+
+# Chroma text + metadata for a fact/person/event row. The live writes and
+# rebuild_semantic_index both build their documents here: the rebuild skips a
+# document only if its _doc_hash matches, so the two must never drift.
+def _fact_doc(row: dict[str, Any]) -> tuple[str, dict[str, Any]]:
+    return (
+        f"FACT {row['entity']} {row['attribute']} = {row['value']}",
+        {"kind": "fact", "entity": str(row["entity"]), "attribute": str(row["attribute"]),
+         "created_at": str(row.get("created_at") or "")},
+    )
+
+
+def _person_doc(row: dict[str, Any]) -> tuple[str, dict[str, Any]]:
+    return (
+        f"PERSON {row['name']} {row['attributes_json']}",
+        {"kind": "person", "name": str(row["name"]), "created_at": str(row.get("created_at") or "")},
+    )
+
+
+def _event_doc(row: dict[str, Any]) -> tuple[str, dict[str, Any]]:
+    return (
+        f"EVENT {row['date']}: {row['note']}",
+        {"kind": "event", "date": str(row["date"]), "created_at": str(row.get("created_at") or "")},
+    )
+
+
+def _doc_hash(text: str, metadata: dict[str, Any]) -> str:
+    """Content hash stored with each Chroma document as metadata["h"], so a
+    rebuild can skip documents whose text and metadata haven't changed."""
+    payload = text.encode("utf-8") + b"\x00" + orjson.dumps(metadata, option=orjson.OPT_SORT_KEYS, default=str)
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _first_by(rows: list[dict[str, Any]], key: str) -> list[dict[str, Any]]:
+    """`rows` without repeats of row[key], keeping each first occurrence in place."""
+    seen: dict[str, dict[str, Any]] = {}
+    for r in rows:
+        seen.setdefault(str(r[key]), r)
+    return list(seen.values())
+
 
 def _lesson_topic_slug(topic: str) -> str:
-    s = re.sub(r"[^a-z0-9]+", "-", (topic or "").strip().lower()).strip("-")
+    s = _NON_ALNUM_RUN_RE.sub("-", (topic or "").strip().lower()).strip("-")
     return s[:48] or "general"
 
 
@@ -160,7 +265,11 @@ class MemoryUnifier:
         self._diskcache = DiskCacheBackend(memory_dir / "diskcache")
         self._chroma = ChromaMemoryBackend(memory_dir / "chroma") if enable_chroma else None
         self._json = JsonAuditBackend(memory_dir / "json")
-        self._write_lock = asyncio.Lock()
+        # One lock per kind of record, not one for every write. They guard the
+        # read-then-write steps within a table (add_fact's supersede check,
+        # upsert_person's merge); writes to different tables have nothing to
+        # order, and the backend serializes and batches the commits itself.
+        self._write_locks: dict[str, asyncio.Lock] = {k: asyncio.Lock() for k in _WRITE_LOCK_KINDS}
         self._init_lock = asyncio.Lock()
         self._initialized = False
         # The WARNING is once-only (a broken index would otherwise spam every
@@ -173,9 +282,26 @@ class MemoryUnifier:
         self._chroma_failures = 0
         self._chroma_writes = 0
         self._chroma_last_error = ""
+        # Write-behind semantic index: writes queue (doc_id, text, metadata)
+        # here instead of waiting on Chroma inside the write lock; a background
+        # task batches them in. Reads and deletes flush first, so nothing can
+        # observe the queue. See _index_later / flush_index.
+        self._index_pending: list[tuple[str, str, dict[str, Any]]] = []
+        self._index_lock = asyncio.Lock()
+        self._index_task: asyncio.Task[None] | None = None
         # Bumped on every long-term write/delete; part of the search cache key
         # so fresh facts are recallable immediately instead of after the TTL.
         self._search_gen = 0
+        # In-process front for search()'s diskcache entries: a repeat query
+        # costs a dict lookup instead of a thread hop and an unpickle. Keyed
+        # like the diskcache entry, value (expiry on the monotonic clock, hits).
+        # Results are held as MemoryHit instances and only dumped to dicts
+        # when they spill to diskcache (see _remember_search).
+        self._search_l1: OrderedDict[str, tuple[float, list[MemoryHit]]] = OrderedDict()
+        # The same, minus per-turn indexing and reinforcement: bumped only when
+        # what Nova *knows* changes. The runtime's semantic response cache is
+        # dropped whenever it moves (see knowledge_generation).
+        self._knowledge_gen = 0
         # Knowledge graph (Phase 1.1) — same SQLite file, own table.
         self._graph = GraphStore(memory_dir / "sqlite" / "nova.sqlite3")
         # Semantic world model (Phase 4 / #11) — same SQLite file, own table.
@@ -231,6 +357,13 @@ class MemoryUnifier:
     def thoughts(self) -> ThoughtStore:
         return self._thoughts
 
+    @property
+    def knowledge_generation(self) -> int:
+        """Changes whenever a fact, person, event, edge or document is written
+        or removed — anything cached on the assumption that memory is unchanged
+        is stale once this moves."""
+        return self._knowledge_gen
+
     def _is_singleton_fact(self, entity: str, attribute: str) -> bool:
         ent = (entity or "").strip().lower()
         attr = (attribute or "").strip().lower()
@@ -283,10 +416,7 @@ class MemoryUnifier:
         if value is not None:
             sql += " AND value = ?"
             params.append(value)
-        async with aiosqlite.connect(self._sqlite._db_path) as db:  # type: ignore[attr-defined]
-            db.row_factory = aiosqlite.Row
-            async with db.execute(sql, tuple(params)) as cur:
-                rows = await cur.fetchall()
+        rows = await self._sqlite.query(sql, tuple(params))
         return [str(r["id"]) for r in rows]
 
     async def _chroma_upsert_safe(self, *, doc_id: str, text: str, metadata: dict[str, Any]) -> None:
@@ -301,17 +431,59 @@ class MemoryUnifier:
             await self._chroma.upsert_text(doc_id=doc_id, text=text, metadata=metadata)
             self._chroma_writes += 1
         except Exception as e:  # noqa: BLE001
-            self._chroma_failures += 1
-            self._chroma_last_error = str(e)[:300]
-            if not self._chroma_degraded_logged:
-                self._chroma_degraded_logged = True
-                logger.warning("chroma_unavailable_semantic_index_degraded", error=str(e)[:300])
-                BUS.publish(
-                    "system.warning",
-                    {"component": "memory.semantic_index", "error": clip(e, 200), "impact": "semantic recall degraded; facts still saved"},
-                )
-            else:
-                logger.debug("chroma_upsert_failed", error=str(e)[:200])
+            self._chroma_failed(e, 1)
+
+    def _chroma_failed(self, e: Exception, n: int) -> None:
+        self._chroma_failures += n
+        self._chroma_last_error = str(e)[:300]
+        if not self._chroma_degraded_logged:
+            self._chroma_degraded_logged = True
+            logger.warning("chroma_unavailable_semantic_index_degraded", error=str(e)[:300])
+            BUS.publish(
+                "system.warning",
+                {"component": "memory.semantic_index", "error": clip(e, 200), "impact": "semantic recall degraded; facts still saved"},
+            )
+        else:
+            logger.debug("chroma_upsert_failed", error=str(e)[:200])
+
+    def _index_later(self, *, doc_id: str, text: str, metadata: dict[str, Any]) -> None:
+        """Queue a best-effort semantic index write (see _chroma_upsert_safe).
+        A write returns without waiting on Chroma; the queue is batched in
+        shortly after, or flushed by the next read/delete."""
+        if self._chroma is None:
+            return
+        self._index_pending.append((doc_id, text, {**metadata, "h": _doc_hash(text, metadata)}))
+        if self._index_task is None or self._index_task.done():
+            self._index_task = asyncio.get_running_loop().create_task(self._drain_index(_INDEX_DELAY_S))
+
+    async def _drain_index(self, delay_s: float = 0.0) -> None:
+        if delay_s:
+            await asyncio.sleep(delay_s)
+        # Batches go in one at a time, in queue order, so a later write of
+        # the same id always lands after an earlier one.
+        while self._index_pending:
+            async with self._index_lock:
+                batch = self._index_pending[:_INDEX_BATCH]
+                del self._index_pending[:_INDEX_BATCH]
+                if not batch:
+                    return
+                try:
+                    await self._chroma.upsert_many([b[0] for b in batch], [b[1] for b in batch], [b[2] for b in batch])
+                    self._chroma_writes += len(batch)
+                except Exception as e:  # noqa: BLE001
+                    self._chroma_failed(e, len(batch))
+                except BaseException:
+                    self._index_pending[:0] = batch  # cancelled: keep them for the next drain
+                    raise
+
+    async def flush_index(self) -> None:
+        """Put every queued semantic index write into Chroma now."""
+        if self._index_pending or self._index_lock.locked():
+            await self._drain_index()
+            # A batch the background task had in flight finishes under the
+            # lock; taking it once more waits that out.
+            async with self._index_lock:
+                pass
 
     async def initialize(self) -> None:
         if self._initialized:
@@ -330,6 +502,12 @@ class MemoryUnifier:
 
             self._initialized = True
 
+    async def close(self) -> None:
+        """Release the long-lived SQLite connection. Safe to call more than
+        once; the backend reopens on the next use."""
+        await self.flush_index()
+        await self._sqlite.close()
+
     async def _ensure_semantic_index(self) -> None:
         """Ensure Chroma has at least the stable facts/people/events.
 
@@ -352,80 +530,114 @@ class MemoryUnifier:
         if chroma_count <= 0:
             await self.rebuild_semantic_index()
 
-    async def rebuild_semantic_index(self) -> dict[str, int]:
-        """Rebuild Chroma documents from SQLite facts/people/events."""
+    async def rebuild_semantic_index(self, *, full: bool = False) -> dict[str, int]:
+        """Bring Chroma's facts/people/events in line with SQLite.
+
+        Only documents whose content hash (metadata "h", see _doc_hash)
+        differs from the SQLite row are re-embedded, and documents whose row
+        is gone are deleted; turn and file documents are left alone.
+        `full=True` drops the whole collection first and re-embeds everything.
+        """
         if self._chroma is None:
-            return {"facts": 0, "people": 0, "events": 0}
+            return {"facts": 0, "people": 0, "events": 0, "changed": 0, "removed": 0}
         await self._sqlite.initialize()
         await self._json.initialize()
 
-        await self._chroma.reset()
-
-        facts = await self._sqlite.all_facts(limit=None)
-        people = await self._sqlite.all_people(limit=None)
-        events = await self._sqlite.all_events(limit=None)
-
-        # Upsert in small batches to avoid large thread payloads.
-        fact_n = 0
-        for row in facts:
-            fact_n += 1
-            await self._chroma.upsert_text(
-                doc_id=str(row["id"]),
-                text=f"FACT {row['entity']} {row['attribute']} = {row['value']}",
-                metadata={
-                    "kind": "fact",
-                    "entity": str(row["entity"]),
-                    "attribute": str(row["attribute"]),
-                    "created_at": str(row.get("created_at") or ""),
-                },
-            )
-
-        person_n = 0
-        for row in people:
-            person_n += 1
-            await self._chroma.upsert_text(
-                doc_id=str(row["id"]),
-                text=f"PERSON {row['name']} {row['attributes_json']}",
-                metadata={"kind": "person", "name": str(row["name"]), "created_at": str(row.get("created_at") or "")},
-            )
-
-        event_n = 0
-        for row in events:
-            event_n += 1
-            await self._chroma.upsert_text(
-                doc_id=str(row["id"]),
-                text=f"EVENT {row['date']}: {row['note']}",
-                metadata={"kind": "event", "date": str(row["date"]), "created_at": str(row.get("created_at") or "")},
-            )
+        await self.flush_index()
+        if full:
+            await self._chroma.reset()
+            indexed: dict[str, str] = {}
+        else:
+            indexed = await self._chroma.doc_hashes(["fact", "person", "event"])
+
+        # Rows stream from SQLite and go to Chroma _INDEX_BATCH at a time:
+        # one embedding pass and one write per batch instead of per row, and
+        # never the whole table in memory. Each batch is embedded here and
+        # written in the background, so the next batch's embedding pass runs
+        # while Chroma is still writing the previous one.
+        ids: list[str] = []
+        texts: list[str] = []
+        metas: list[dict[str, Any]] = []
+        changed = 0
+        writing: asyncio.Task[None] | None = None
+
+        async def add(doc_id: str, text: str, meta: dict[str, Any]) -> None:
+            nonlocal changed
+            h = _doc_hash(text, meta)
+            # Popped: whatever is left in `indexed` afterwards has no row.
+            if indexed.pop(doc_id, None) == h:
+                return
+            changed += 1
+            ids.append(doc_id)
+            texts.append(text)
+            metas.append({**meta, "h": h})
+            if len(ids) >= _INDEX_BATCH:
+                await flush()
+
+        async def flush() -> None:
+            nonlocal writing
+            if not ids:
+                return
+            batch = (ids[:], texts[:], metas[:])
+            ids.clear()
+            texts.clear()
+            metas.clear()
+            vectors = await self._chroma.embed(batch[1])
+            if writing is not None:
+                await writing
+            writing = asyncio.create_task(self._chroma.upsert_many(*batch, embeddings=vectors))
 
-        await self._json.append_snapshot(
-            {"kind": "semantic_index_rebuild", "facts": fact_n, "people": person_n, "events": event_n, "ts": _now().isoformat()}
-        )
-        return {"facts": fact_n, "people": person_n, "events": event_n}
+        try:
+            fact_n = 0
+            async for row in self._sqlite.iter_facts():
+                fact_n += 1
+                await add(str(row["id"]), *_fact_doc(row))
+
+            person_n = 0
+            async for row in self._sqlite.iter_people():
+                person_n += 1
+                await add(str(row["id"]), *_person_doc(row))
+
+            event_n = 0
+            async for row in self._sqlite.iter_events():
+                event_n += 1
+                await add(str(row["id"]), *_event_doc(row))
+            await flush()
+        finally:
+            if writing is not None:
+                await writing
+        if indexed:
+            await self._chroma.delete_ids(list(indexed))
+
+        counts = {"facts": fact_n, "people": person_n, "events": event_n, "changed": changed, "removed": len(indexed)}
+        await self._json.append_snapshot({"kind": "semantic_index_rebuild", **counts, "ts": _now().isoformat()})
+        return counts
 
     async def ingest_turn(self, conversation_id: UUID, role: str, content: str) -> UUID:
+        return (await self.ingest_turns(conversation_id, [(role, content)]))[0]
+
+    async def ingest_turns(self, conversation_id: UUID, turns: list[tuple[str, str]]) -> list[UUID]:
+        """Ingest (role, content) turns of one conversation, in order. The
+        SQLite rows go in one transaction, so a user/assistant exchange costs
+        one commit instead of two."""
         await self.initialize()
-        turn_id = uuid4()
-        created_at = _now().isoformat()
+        if not turns:
+            return []
+        base = _now()
+        # Microsecond steps keep the turns in order under ORDER BY created_at.
+        rows = [(uuid4(), role, content, (base + timedelta(microseconds=i)).isoformat())
+                for i, (role, content) in enumerate(turns)]
 
         # Index substantive turns semantically so anything said is recallable
         # later (not just what got distilled into a structured fact). Skip short
         # greetings/acks to keep the index signal-rich. Best-effort; never blocks.
-        index_turn = (
-            os.getenv("NOVA_INDEX_TURNS", "1").strip().lower() not in {"0", "false", "no", "off"}
-            and len((content or "").strip()) >= 25
-        )
+        index_on = os.getenv("NOVA_INDEX_TURNS", "1").strip().lower() not in {"0", "false", "no", "off"}
+        indexed = [r for r in rows if index_on and len((r[2] or "").strip()) >= 25]
 
-        async with self._write_lock:
-            writes = [
-                self._sqlite.add_turn(
-                    turn_id=turn_id,
-                    conversation_id=conversation_id,
-                    role=role,
-                    content=content,
-                    created_at_iso=created_at,
-                ),
-                self._json.append_audit(
+        async def audit() -> None:
+            # One after another: the audit log keeps the turns' order.
+            for turn_id, role, content, created_at in rows:
+                await self._json.append_audit(
                     {
                         "kind": "turn",
                         "id": str(turn_id),
@@ -434,25 +646,29 @@ class MemoryUnifier:
                         "content": content,
                         "created_at": created_at,
                     }
-                ),
+                )
+
+        async with self._write_locks["turn"]:
+            writes = [
+                self._sqlite.add_turns([(tid, conversation_id, role, content, at) for tid, role, content, at in rows]),
+                audit(),
             ]
-            if index_turn and self._chroma is not None:
+            for turn_id, role, content, created_at in indexed:
                 speaker = "Marcus" if role == "user" else "Nova"
-                writes.append(
-                    self._chroma_upsert_safe(
-                        doc_id=f"turn:{turn_id}",
-                        text=f"{speaker} said: {content}",
-                        metadata={"kind": "turn", "role": role, "created_at": created_at,
-                                  "conversation_id": str(conversation_id)},
-                    )
+                self._index_later(
+                    doc_id=f"turn:{turn_id}",
+                    text=f"{speaker} said: {content}",
+                    metadata={"kind": "turn", "role": role, "created_at": created_at,
+                              "conversation_id": str(conversation_id)},
                 )
             await asyncio.gather(*writes)
 
-        if index_turn:
+        if indexed:
             self._search_gen += 1
-        BUS.publish("memory.write", {"kind": "turn", "role": role, "source": "conversation"})
+        for _tid, role, _content, _at in rows:
+            BUS.publish("memory.write", {"kind": "turn", "role": role, "source": "conversation"})
 
-        # Phase 1.1: observe co-mentions in this turn as graph edges (people
+        # Phase 1.1: observe co-mentions in each turn as graph edges (people
         # mentioned together; people tied to the active project). Cheap and
         # deterministic; failures never block ingest.
         try:
@@ -463,12 +679,13 @@ class MemoryUnifier:
                 active_project = lp.value.strip() if lp and lp.value else None
             except Exception:
                 pass
-            for edge in extract_turn_edges(content, known, active_project):
-                await self._graph.upsert_edge(edge)
+            for _tid, _role, content, _at in rows:
+                for edge in extract_turn_edges(content, known, active_project):
+                    await self._graph.upsert_edge(edge)
         except Exception as e:  # noqa: BLE001
             logger.debug("graph_turn_extract_failed", error=str(e)[:160])
 
-        return turn_id
+        return [r[0] for r in rows]
 
     async def known_person_names(self) -> list[str]:
         """Names Nova knows as people: the people table plus family/friend
@@ -536,13 +753,14 @@ class MemoryUnifier:
         (movie, book, hardware, software, idea, location, ...). Returns False if
         the edge was degenerate (empty/self)."""
         await self.initialize()
-        pred = re.sub(r"[^a-z0-9]+", "_", (predicate or "").strip().lower()).strip("_")[:40] or "related_to"
+        pred = _NON_ALNUM_RUN_RE.sub("_", (predicate or "").strip().lower()).strip("_")[:40] or "related_to"
         edge = Edge((src_kind or "topic").strip().lower(), src_key, pred, (dst_kind or "topic").strip().lower(), dst_key)
         if not edge.src_key.strip() or not edge.dst_key.strip():
             return False
         try:
             await self._graph.upsert_edge(edge, confidence=confidence)
             self._search_gen += 1
+            self._knowledge_gen += 1
             return True
         except Exception as e:  # noqa: BLE001
             logger.debug("graph_link_failed", error=str(e)[:160])
@@ -893,7 +1111,7 @@ class MemoryUnifier:
 
     @staticmethod
     def _research_slug(topic: str) -> str:
-        return re.sub(r"[^a-z0-9]+", "-", (topic or "").strip().lower()).strip("-")[:60]
+        return _NON_ALNUM_RUN_RE.sub("-", (topic or "").strip().lower()).strip("-")[:60]
 
     async def track_research_topic(self, topic: str) -> bool:
         """Add an ongoing research topic. Findings accrue into the world model
@@ -988,7 +1206,7 @@ class MemoryUnifier:
         note = (note or "").strip()
         if not note:
             return
-        slug = re.sub(r"[^a-z0-9]+", "-", topic.lower()).strip("-")[:40] or "general"
+        slug = _NON_ALNUM_RUN_RE.sub("-", topic.lower()).strip("-")[:40] or "general"
         await self.add_fact(entity=f"agentmem:{agent_id}", attribute=slug, value=note[:400], confidence=0.7)
 
     async def agent_recall(self, agent_id: str, *, topic: str | None = None, limit: int = 10) -> list[str]:
@@ -1010,7 +1228,7 @@ class MemoryUnifier:
         name = (name or "").strip()
         if not name:
             return None
-        slug = re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")[:32] or "exp"
+        slug = _NON_ALNUM_RUN_RE.sub("-", name.lower()).strip("-")[:32] or "exp"
         exp_id = f"{slug}-{uuid4().hex[:6]}"
         defn = {"id": exp_id, "name": name[:200], "hypothesis": hypothesis[:400],
                 "created_at": _now().isoformat(), "status": "open"}
@@ -1117,7 +1335,7 @@ class MemoryUnifier:
         steps = [str(s).strip() for s in (steps or []) if str(s).strip()]
         if not name or not steps:
             return None
-        slug = re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")[:32] or "skill"
+        slug = _NON_ALNUM_RUN_RE.sub("-", name.lower()).strip("-")[:32] or "skill"
         skill_id = f"{slug}-{uuid4().hex[:6]}"
         skill = {"id": skill_id, "name": name[:120], "steps": steps, "version": 1, "versions": [],
                  "parameters": workflow_parameters(steps), "created_at": _now().isoformat(),
@@ -1192,23 +1410,11 @@ class MemoryUnifier:
         you were for the big moments. None = derive a sensible default."""
 
         # ---- write guard: prevent storing non-name tokens as relationship values ----
-        deny_by_attr = {
-            "spouse": {"name", "names", "spouse", "wife", "husband", "partner"},
-            "child": {"name", "names", "child", "children", "kid", "kids", "son", "sons", "daughter", "daughters"},
-            "parent": {"name", "names", "parent", "parents", "mom", "mother", "dad", "father"},
-            "mother": {"name", "names", "mom", "mother"},
-            "father": {"name", "names", "dad", "father"},
-            "sibling": {"name", "names", "sibling", "siblings", "brother", "brothers", "sister", "sisters"},
-            "cousin": {"name", "names", "cousin", "cousins"},
-            "friend": {"name", "names", "friend", "friends", "buddy", "buddies"},
-            "pet": {"name", "names", "pet", "pets", "dog", "dogs", "cat", "cats"},
-            "coworker": {"name", "names", "coworker", "coworkers", "colleague", "colleagues"},
-        }
         attr_key = (attribute or "").strip().lower()
         v_raw = str(value).strip() if value is not None else ""
         v_norm = v_raw.lower()
-        if attr_key in deny_by_attr:
-            if (not v_raw) or (v_norm in deny_by_attr[attr_key]) or (len(v_raw) < 2):
+        if attr_key in _DENY_BY_ATTR:
+            if (not v_raw) or (v_norm in _DENY_BY_ATTR[attr_key]) or (len(v_raw) < 2):
                 logger.debug("fact_rejected_denylist", entity=entity, attribute=attribute, value=value)
                 return uuid4()  # preserve return type while skipping write
             if not any(ch.isalpha() for ch in v_raw):
@@ -1234,7 +1440,9 @@ class MemoryUnifier:
             prov_evidence = evidence
             prov_confirmed = created_at if observed_at_write(prov_status) else None
 
-        async with self._write_lock:
+        row = {"entity": entity, "attribute": attribute, "value": value, "confidence": confidence, "created_at": created_at}
+
+        async with self._write_locks["fact"]:
             # Supersede stale values for single-valued attributes; skip exact
             # duplicates for list-valued ones (child, friend, note, ...).
             stale_ids: list[str] = []
@@ -1275,6 +1483,7 @@ class MemoryUnifier:
                     last_confirmed_at=prov_confirmed,
                     salience=(_default_salience(entity, attribute, confidence)
                               if salience is None else max(0.0, min(1.0, float(salience)))),
+                    created_at=created_at,
                 ),
                 self._json.append_audit(
                     {
@@ -1289,25 +1498,17 @@ class MemoryUnifier:
                         "verification_status": prov_status,
                     }
                 ),
-                self._diskcache.set(
-                    f"fact:{fact_id}",
-                    {"entity": entity, "attribute": attribute, "value": value, "confidence": confidence, "created_at": created_at},
-                    ttl_s=86400,
-                ),
+                self._diskcache.set(f"fact:{fact_id}", row, ttl_s=86400),
             ]
-            if self._chroma is not None:
-                tasks.append(
-                    self._chroma_upsert_safe(
-                        doc_id=str(fact_id),
-                        text=f"FACT {entity} {attribute} = {value}",
-                        metadata={"kind": "fact", "entity": entity, "attribute": attribute, "created_at": created_at},
-                    )
-                )
+            text, meta = _fact_doc(row)
+            self._index_later(doc_id=str(fact_id), text=text, metadata=meta)
             await asyncio.gather(*tasks)
 
         self._search_gen += 1
+        self._knowledge_gen += 1
         if stale_ids and self._chroma is not None:
             try:
+                await self.flush_index()
                 await self._chroma.delete_ids(stale_ids)
             except Exception:
                 pass
@@ -1337,21 +1538,29 @@ class MemoryUnifier:
         # Merge with whatever's already known about this person — a SQL upsert
         # replaces the whole attributes_json blob, so writing just {"birthday":
         # ...} later would otherwise silently erase an earlier {"relation":
-        # "son"} write for the same name.
-        existing = await self._sqlite.get_person_by_name(name)
-        merged = dict(attributes)
-        if existing:
-            try:
-                prior = json.loads(existing.get("attributes_json") or "{}")
-                if isinstance(prior, dict):
-                    merged = {**prior, **attributes}
-            except Exception:
-                pass
-        attributes_json = json.dumps(merged, ensure_ascii=False, sort_keys=True)
+        # "son"} write for the same name. The read is under the lock so two
+        # concurrent updates can't both merge into the same old blob.
+        async with self._write_locks["person"]:
+            existing = await self._sqlite.get_person_by_name(name)
+            merged = dict(attributes)
+            if existing:
+                try:
+                    prior = json.loads(existing.get("attributes_json") or "{}")
+                    if isinstance(prior, dict):
+                        merged = {**prior, **attributes}
+                except Exception:
+                    pass
+            attributes_json = orjson.dumps(merged, option=orjson.OPT_SORT_KEYS).decode("utf-8")
+            # The upsert keeps an existing row's id and created_at, so the
+            # Chroma document does too: one document per person, not one per
+            # update.
+            if existing:
+                person_id = UUID(str(existing["id"]))
+            row = {"name": name, "attributes_json": attributes_json,
+                   "created_at": (existing or {}).get("created_at") or created_at}
 
-        async with self._write_lock:
             tasks = [
-                self._sqlite.upsert_person(person_id, name=name, attributes_json=attributes_json),
+                self._sqlite.upsert_person(person_id, name=name, attributes_json=attributes_json, created_at=created_at),
                 self._json.append_audit(
                     {
                         "kind": "person",
@@ -1363,17 +1572,12 @@ class MemoryUnifier:
                 ),
                 self._diskcache.set(f"person:{name.lower()}", merged, ttl_s=86400),
             ]
-            if self._chroma is not None:
-                tasks.append(
-                    self._chroma_upsert_safe(
-                        doc_id=str(person_id),
-                        text=f"PERSON {name} {attributes_json}",
-                        metadata={"kind": "person", "name": name, "created_at": created_at},
-                    )
-                )
+            text, meta = _person_doc(row)
+            self._index_later(doc_id=str(person_id), text=text, metadata=meta)
             await asyncio.gather(*tasks)
 
         self._search_gen += 1
+        self._knowledge_gen += 1
         BUS.publish("memory.write", {"kind": "person", "name": clip(name, 80), "source": "long_term"})
 
         # Phase 1.1: a stored relation ("son", "coworker") becomes a graph edge.
@@ -1491,10 +1695,11 @@ class MemoryUnifier:
         await self.initialize()
         event_id = uuid4()
         created_at = _now().isoformat()
+        row = {"date": date, "note": note, "created_at": created_at}
 
-        async with self._write_lock:
+        async with self._write_locks["event"]:
             tasks = [
-                self._sqlite.add_event(event_id, date=date, note=note),
+                self._sqlite.add_event(event_id, date=date, note=note, created_at=created_at),
                 self._json.append_audit(
                     {
                         "kind": "event",
@@ -1504,23 +1709,14 @@ class MemoryUnifier:
                         "created_at": created_at,
                     }
                 ),
-                self._diskcache.set(
-                    f"event:{event_id}",
-                    {"date": date, "note": note, "created_at": created_at},
-                    ttl_s=86400,
-                ),
+                self._diskcache.set(f"event:{event_id}", row, ttl_s=86400),
             ]
-            if self._chroma is not None:
-                tasks.append(
-                    self._chroma_upsert_safe(
-                        doc_id=str(event_id),
-                        text=f"EVENT {date}: {note}",
-                        metadata={"kind": "event", "date": date, "created_at": created_at},
-                    )
-                )
+            text, meta = _event_doc(row)
+            self._index_later(doc_id=str(event_id), text=text, metadata=meta)
             await asyncio.gather(*tasks)
 
         self._search_gen += 1
+        self._knowledge_gen += 1
         BUS.publish("memory.write", {"kind": "event", "date": clip(date, 40), "note": clip(note, 120), "source": "long_term"})
         return event_id
 
@@ -1530,14 +1726,17 @@ class MemoryUnifier:
             return raw
         if isinstance(raw, str) and raw.strip():
             try:
-                return datetime.fromisoformat(raw.replace("Z", "+00:00"))
+                return _parse_iso(raw)
             except Exception:
                 return None
         return None
 
     def _fact_from_row(self, row: dict[str, Any]) -> FactRecord:
         created_dt = self._parse_dt(row.get("created_at")) or _now()
-        return FactRecord(
+        # model_construct skips validation: every field is converted to its
+        # declared type right here from our own schema's columns, and running
+        # the validators again per row was most of the cost of get_facts.
+        return FactRecord.model_construct(
             id=UUID(str(row["id"])),
             entity=str(row["entity"]),
             attribute=str(row["attribute"]),
@@ -1561,27 +1760,9 @@ class MemoryUnifier:
         await self.initialize()
         ent = (entity or "").strip()
         attr = (attribute or "").strip() if attribute else None
-        order = "DESC" if newest_first else "ASC"
-
-        where = "WHERE entity = ?"
-        params: list[Any] = [ent]
-        if attr:
-            where += " AND attribute = ?"
-            params.append(attr)
-
-        sql = (
-            "SELECT id, entity, attribute, value, confidence, created_at, "
-            "source, evidence, verification_status, last_confirmed_at "
-            f"FROM facts {where} ORDER BY created_at {order} LIMIT ?"
-        )
-        params.append(int(limit))
-
-        async with aiosqlite.connect(self._sqlite._db_path) as db:  # type: ignore[attr-defined]
-            db.row_factory = aiosqlite.Row
-            async with db.execute(sql, tuple(params)) as cur:
-                rows = await cur.fetchall()
-
-        return [self._fact_from_row(dict(r)) for r in rows]
+        params = (ent, attr, int(limit)) if attr else (ent, int(limit))
+        rows = await self._sqlite.query(_GET_FACTS_SQL[bool(attr), bool(newest_first)], params)
+        return [self._fact_from_row(r) for r in rows]
 
     async def get_latest_fact(self, entity: str, attribute: str) -> FactRecord | None:
         hits = await self.get_facts(entity=entity, attribute=attribute, limit=1, newest_first=True)
@@ -1610,8 +1791,10 @@ class MemoryUnifier:
             try:
                 removed = await self._sqlite.delete_facts_by_ids(ids)
                 self._search_gen += 1
+                self._knowledge_gen += 1
                 if self._chroma is not None:
                     try:
+                        await self.flush_index()
                         await self._chroma.delete_ids(ids)
                     except Exception:
                         pass
@@ -1636,9 +1819,10 @@ class MemoryUnifier:
         and promote its status to 'confirmed'. Turns an assumption into a checked
         fact only when there's genuine evidence — never silently."""
         await self.initialize()
-        async with self._write_lock:
+        async with self._write_locks["fact"]:
             await self._sqlite.confirm_fact(fact_id, evidence=evidence)
         self._search_gen += 1
+        self._knowledge_gen += 1
 
     async def facts_needing_reverification(self, *, older_than_days: float = 180.0, limit: int = 50) -> list[dict[str, Any]]:
         """Directly-observed facts whose last confirmation is older than
@@ -1701,7 +1885,7 @@ class MemoryUnifier:
         def _norm(s: str) -> str:
             # Lowercase, strip punctuation, and crudely singularize so
             # "projects/ones" vs "project/one" phrasings compare equal.
-            s = re.sub(r"[^a-z0-9 ]+", "", (s or "").lower()).strip()
+            s = _NON_ALNUM_SPACE_RE.sub("", (s or "").lower()).strip()
             return " ".join(w.rstrip("s") if len(w) > 3 else w for w in s.split())
 
         def _lead(n: str) -> str:
@@ -1955,7 +2139,7 @@ class MemoryUnifier:
     ) -> UUID:
         await self.initialize()
         rid = uuid4()
-        async with self._write_lock:
+        async with self._write_locks["reminder"]:
             await self._sqlite.create_reminder(
                 reminder_id=rid, title=title, details=details or title,
                 due_at_iso=due_at_iso, recurrence=recurrence,
@@ -1973,17 +2157,17 @@ class MemoryUnifier:
 
     async def reschedule_reminder(self, *, reminder_id: str, next_due_at_iso: str) -> None:
         await self.initialize()
-        async with self._write_lock:
+        async with self._write_locks["reminder"]:
             await self._sqlite.reschedule_reminder(reminder_id=reminder_id, next_due_at_iso=next_due_at_iso)
 
     async def complete_reminder(self, *, reminder_id: str) -> None:
         await self.initialize()
-        async with self._write_lock:
+        async with self._write_locks["reminder"]:
             await self._sqlite.set_reminder_status(reminder_id=reminder_id, status="fired")
 
     async def cancel_reminder(self, *, reminder_id: str) -> None:
         await self.initialize()
-        async with self._write_lock:
+        async with self._write_locks["reminder"]:
             await self._sqlite.set_reminder_status(reminder_id=reminder_id, status="cancelled")
         BUS.publish("reminder.cancelled", {"reminder_id": reminder_id})
 
@@ -2020,7 +2204,7 @@ class MemoryUnifier:
     async def index_document(self, *, path: str, excerpt: str, mtime: float) -> None:
         await self.initialize()
         chunks = self._chunk_text(excerpt)
-        async with self._write_lock:
+        async with self._write_locks["document"]:
             await self._sqlite.upsert_document(path=path, excerpt=excerpt, mtime=mtime)
 
             # Drop any stale chunk-ids left over from a previous, longer
@@ -2031,6 +2215,7 @@ class MemoryUnifier:
             if self._chroma is not None and prior_count > len(chunks):
                 stale_ids = [f"doc:{path}#{i}" for i in range(len(chunks), prior_count)]
                 try:
+                    await self.flush_index()
                     await self._chroma.delete_ids(stale_ids)
                 except Exception:
                     pass
@@ -2040,12 +2225,13 @@ class MemoryUnifier:
             if self._chroma is not None:
                 name = Path(path).name
                 for i, chunk in enumerate(chunks):
-                    await self._chroma_upsert_safe(
+                    self._index_later(
                         doc_id=f"doc:{path}#{i}",
                         text=f"FILE {name} (part {i + 1}/{len(chunks)}): {chunk}",
                         metadata={"kind": "document", "path": path, "chunk_index": i, "created_at": _now().isoformat()},
                     )
         self._search_gen += 1
+        self._knowledge_gen += 1
         BUS.publish("memory.write", {"kind": "document", "path": clip(path, 200), "source": "file_index"})
 
     async def list_indexed_documents(self, *, limit: int = 200) -> list[dict[str, Any]]:
@@ -2063,6 +2249,7 @@ class MemoryUnifier:
 
         if self._chroma is not None:
             try:
+                await self.flush_index()
                 chroma_hits = await self._chroma.query(topic, limit=limit * 3)
             except Exception:
                 chroma_hits = []
@@ -2087,7 +2274,7 @@ class MemoryUnifier:
             # single LIKE '%whole phrase%' rarely matches natural text, so
             # split into terms and search each individually (same approach
             # as the main search() method's SQLite fallback).
-            terms = [t for t in re.findall(r"[a-z0-9']+", topic.lower()) if len(t) >= 3]
+            terms = [t for t in _QUERY_TERM_RE.findall(topic.lower()) if len(t) >= 3]
             for term in terms[:8] or [topic]:
                 rows = await self._sqlite.search_document_chunks(term, limit=limit)
                 for row in rows:
@@ -2148,24 +2335,20 @@ class MemoryUnifier:
         where_sql = " AND ".join(where)
         select_sql = f"SELECT id FROM facts WHERE {where_sql} LIMIT ?"
 
-        async with aiosqlite.connect(self._sqlite._db_path) as db:  # type: ignore[attr-defined]
-            db.row_factory = aiosqlite.Row
-            async with db.execute(select_sql, tuple(params) + (int(limit),)) as cur:
-                id_rows = await cur.fetchall()
-            ids = [str(r["id"]) for r in id_rows]
-            matched = len(ids)
-            deleted = 0
-            if not dry_run and matched:
-                id_placeholders = ",".join(["?"] * len(ids))
-                await db.execute(f"DELETE FROM facts WHERE id IN ({id_placeholders})", tuple(ids))
-                await db.commit()
-                deleted = matched
+        id_rows = await self._sqlite.query(select_sql, tuple(params) + (int(limit),))
+        ids = [str(r["id"]) for r in id_rows]
+        matched = len(ids)
+        deleted = 0
+        if not dry_run and matched:
+            deleted = await self._sqlite.delete_facts_by_ids(ids)
 
         # Purged facts must vanish from semantic recall too, not just SQLite.
         if deleted:
             self._search_gen += 1
+            self._knowledge_gen += 1
             if self._chroma is not None:
                 try:
+                    await self.flush_index()
                     await self._chroma.delete_ids(ids)
                 except Exception:
                     pass
@@ -2189,7 +2372,7 @@ class MemoryUnifier:
 
         # Normalize query into searchable terms (helps simple LIKE-based backends).
         q_norm = q.lower().replace("’", "'")
-        raw_terms = [t for t in re.findall(r"[a-z0-9']+", q_norm) if len(t) >= 3]
+        raw_terms = [t for t in _QUERY_TERM_RE.findall(q_norm) if len(t) >= 3]
 
         # Strip possessive suffixes (e.g. "mom's" -> "mom")
         terms: list[str] = []
@@ -2205,26 +2388,19 @@ class MemoryUnifier:
         # (any row containing "ai" anywhere) at a fixed high score, drowning
         # out genuinely relevant results. Same failure mode for "id" (avoid,
         # said, provide, decide, ...) — even more common as a substring.
-        if re.search(r"\bai\b", q_norm):
+        if _AI_WORD_RE.search(q_norm):
             terms.append("ai")
-        if re.search(r"\bid\b", q_norm):
+        if _ID_WORD_RE.search(q_norm):
             terms.append("id")
 
         # De-duplicate while preserving order.
         seen: set[str] = set()
         terms = [t for t in terms if not (t in seen or seen.add(t))]
 
-        # Lightweight synonym expansion for common relationship queries.
-        synonyms = {
-            "mom": ["mother"],
-            "mother": ["mom"],
-            "dad": ["father"],
-            "father": ["dad"],
-        }
         expanded: list[str] = []
         for t in terms:
             expanded.append(t)
-            expanded.extend(synonyms.get(t, []))
+            expanded.extend(_QUERY_SYNONYMS.get(t, ()))
 
         seen2: set[str] = set()
         terms = [t for t in expanded if not (t in seen2 or seen2.add(t))]
@@ -2245,9 +2421,15 @@ class MemoryUnifier:
         BUS.publish("memory.search", {"query": clip(q, 120)})
 
         cache_key = f"search:{self._search_gen}:{conversation_id}:{'|'.join(terms) or q_norm}:{limit}"
+        l1 = self._search_l1.get(cache_key)
+        if l1 is not None and l1[0] > time.monotonic():
+            self._search_l1.move_to_end(cache_key)
+            return [h.model_copy() for h in l1[1]]
         cached = await self._diskcache.get(cache_key)
-        if isinstance(cached, list) and cached:
-            return [MemoryHit.model_validate(x) for x in cached]
+        if isinstance(cached, bytes):
+            ranked = _HITS_JSON.validate_json(cached)
+            await self._remember_search(cache_key, ranked)
+            return [h.model_copy() for h in ranked]
 
         # ── Gather signals CONCURRENTLY (U1) ─────────────────────────────────
         # recent turns, the per-term LIKE searches, and the semantic (Chroma)
@@ -2256,40 +2438,48 @@ class MemoryUnifier:
         # is a single round-trip. Result ordering is preserved exactly (gather
         # returns in argument order), so ranking/dedup downstream is unchanged.
 
-        async def _term_batch(t: str) -> tuple[list, list, list, list]:
-            return await asyncio.gather(
-                self._sqlite.search_facts(t, limit=12),
-                self._sqlite.search_people(t, limit=8),
-                self._sqlite.search_events(t, limit=8),
-                self._sqlite.search_documents(t, limit=8),
+        async def _term_batch(ts: list[str]) -> tuple[list, list, list, list]:
+            # Facts, people and events answer every term in one statement each
+            # (search_*_any); documents still go per term.
+            facts_a, people_a, events_a, *doc_lists = await asyncio.gather(
+                self._sqlite.search_facts_any(ts, limit=12),
+                self._sqlite.search_people_any(ts, limit=8),
+                self._sqlite.search_events_any(ts, limit=8),
+                *(self._sqlite.search_documents(t, limit=8) for t in ts),
             )
+            return facts_a, people_a, events_a, [r for rows in doc_lists for r in rows]
 
         async def _keyword_rows() -> tuple[list, list, list, list]:
-            if terms:
-                facts_a: list[dict[str, Any]] = []
-                people_a: list[dict[str, Any]] = []
-                events_a: list[dict[str, Any]] = []
-                docs_a: list[dict[str, Any]] = []
-                for f_rows, p_rows, e_rows, d_rows in await asyncio.gather(*(_term_batch(t) for t in terms[:8])):
-                    facts_a.extend(f_rows)
-                    people_a.extend(p_rows)
-                    events_a.extend(e_rows)
-                    docs_a.extend(d_rows)
-                return facts_a, people_a, events_a, docs_a
-            return await _term_batch(q)
+            if not terms:
+                return await _term_batch([q])
+            # A row matching several terms comes back once per term; keep the
+            # first, which is the one the merge by hit id kept anyway.
+            f_rows, p_rows, e_rows, d_rows = await _term_batch(terms[:8])
+            return (_first_by(f_rows, "id"), _first_by(p_rows, "id"),
+                    _first_by(e_rows, "id"), _first_by(d_rows, "path"))
+
+        # Recent turns are only used for longer, contextual queries (see the
+        # filter below), so short ones ("hi", "ok") don't read them at all.
+        use_recent = len(q_norm) >= 8 and bool(terms)
+
+        async def _recent_rows() -> list[dict[str, Any]]:
+            if not use_recent:
+                return []
+            return await self._sqlite.recent_turns(conversation_id=conversation_id, limit=60)
 
         async def _semantic_hits() -> list[dict[str, Any]]:
             # Semantic recall is optional; do not fail the request.
             if self._chroma is None:
                 return []
             try:
+                await self.flush_index()
                 return await self._chroma.query(q, limit=limit)
             except Exception as e:
                 logger.debug("chroma_query_failed", error=str(e))
                 return []
 
         recent, keyword_rows, chroma_hits = await asyncio.gather(
-            self._sqlite.recent_turns(conversation_id=conversation_id, limit=60),
+            _recent_rows(),
             _keyword_rows(),
             _semantic_hits(),
         )
@@ -2300,16 +2490,13 @@ class MemoryUnifier:
         # --- Recent turns (STRICT FILTERING) ---
         # Only include recent turns for longer, contextual queries; this prevents
         # irrelevant recent chatter (e.g., e2e "hello" spam) from polluting the prompt.
-        if len(q_norm) >= 8 and terms:
+        if use_recent:
             now = _now()
             recent_terms = set(terms)
             for row in recent:
-                content_l = (row.get("content") or "").lower()
-
-                # Require strong lexical overlap.
-                if not any(t in content_l for t in recent_terms):
-                    continue
-
+                # Age gate first: it drops most of the 60 rows in a long-running
+                # conversation, and costs one timestamp parse instead of
+                # lowering the whole turn and scanning it for every term.
                 try:
                     created_at = datetime.fromisoformat(str(row["created_at"]).replace("Z", "+00:00"))
                 except Exception:
@@ -2324,6 +2511,11 @@ class MemoryUnifier:
                 if age_s > 7200:
                     continue
 
+                # Require strong lexical overlap.
+                content_l = (row.get("content") or "").lower()
+                if not any(t in content_l for t in recent_terms):
+                    continue
+
                 recency_score = 1.0 / (1.0 + age_s / 1800.0)
                 hits.append(
                     MemoryHit(
@@ -2341,7 +2533,7 @@ class MemoryUnifier:
         # here always claimed, though the code only ever decayed "note".
         # Salience and recall count slow the decay; see _staleness_factor.
         for row in fact_rows:
-            text = f"FACT {row['entity']} {row['attribute']} = {row['value']}"
+            text = _fact_doc(row)[0]
             base = 0.95
             if not _is_undecayed(row.get("entity")):
                 base *= _staleness_factor(
@@ -2372,7 +2564,7 @@ class MemoryUnifier:
 
         # People (very high priority)
         for row in people_rows:
-            text = f"PERSON {row['name']} {row['attributes_json']}"
+            text = _person_doc(row)[0]
             hits.append(
                 MemoryHit(
                     id=row["id"],
@@ -2386,7 +2578,7 @@ class MemoryUnifier:
         # Events (decay with age like notes — an event from months ago is
         # still recallable, just outranked by fresher context)
         for row in event_rows:
-            text = f"EVENT {row['date']}: {row['note']}"
+            text = _event_doc(row)[0]
             hits.append(
                 MemoryHit(
                     id=row["id"],
@@ -2455,13 +2647,30 @@ class MemoryUnifier:
 
         await self._reinforce_recalled(ranked)
 
-        await self._diskcache.set(cache_key, [r.model_dump() for r in ranked], ttl_s=120)
+        if ranked:
+            await self._remember_search(cache_key, [h.model_copy() for h in ranked])
         # NOTE: previously every search() appended its full result set to
         # snapshots.jsonl — the fastest-growing file in the system, with no code
         # ever reading it back. Dropped: search runs on every chat turn.
 
         return ranked
 
+    async def _remember_search(self, key: str, hits: list[MemoryHit]) -> None:
+        # The generation is part of the key, so after a write every older
+        # entry is unreachable: drop them rather than let them age out.
+        prefix = f"search:{self._search_gen}:"
+        if self._search_l1 and not next(iter(self._search_l1)).startswith(prefix):
+            self._search_l1 = OrderedDict((k, v) for k, v in self._search_l1.items() if k.startswith(prefix))
+        now = time.monotonic()
+        self._search_l1[key] = (now + _SEARCH_TTL_S, hits)
+        self._search_l1.move_to_end(key)
+        # diskcache is the second level: a result is only dumped to it when
+        # the LRU pushes it out while it is still fresh.
+        while len(self._search_l1) > _SEARCH_L1_MAX:
+            old_key, (expires, old_hits) = self._search_l1.popitem(last=False)
+            if expires > now:
+                await self._diskcache.set(old_key, _HITS_JSON.dump_json(old_hits), ttl_s=max(1, int(expires - now)))
+
     #: A recalled fact is only reinforced if it actually surfaced strongly.
     #: search() returns up to `limit` hits whether or not they were any good;
     #: reinforcing all of them would strengthen everything equally and destroy
@@ -2528,7 +2737,7 @@ class MemoryUnifier:
         """
         await self.initialize()
         tid = uuid4()
-        async with self._write_lock:
+        async with self._write_locks["task"]:
             await self._sqlite.enqueue_autonomy_task(
                 task_id=tid,
                 conversation_id=str(conversation_id) if conversation_id else None,
@@ -2602,24 +2811,24 @@ class MemoryUnifier:
 
     async def mark_task_done(self, *, task_id: str, result: dict[str, Any] | None = None) -> None:
         await self.initialize()
-        async with self._write_lock:
+        async with self._write_locks["task"]:
             await self._sqlite.complete_autonomy_task(task_id=task_id, status="done", result=result or {}, error="")
         BUS.publish("task.completed", {"task_id": str(task_id), "status": "done"})
 
     async def mark_task_failed(self, *, task_id: str, error: str, result: dict[str, Any] | None = None) -> None:
         await self.initialize()
-        async with self._write_lock:
+        async with self._write_locks["task"]:
             await self._sqlite.complete_autonomy_task(task_id=task_id, status="failed", result=result or {}, error=error)
         BUS.publish("task.updated", {"task_id": str(task_id), "status": "failed", "error": clip(error, 160)})
 
     async def bump_task_attempt(self, *, task_id: str, attempts: int, run_after_iso: str, error: str) -> None:
         await self.initialize()
-        async with self._write_lock:
+        async with self._write_locks["task"]:
             await self._sqlite.bump_autonomy_task_attempt(task_id=task_id, attempts=int(attempts), run_after_iso=run_after_iso, error=error)
 
     async def cancel_pending_background_work(self) -> dict[str, int]:
         await self.initialize()
-        async with self._write_lock:
+        async with self._write_locks["task"]:
             return await self._sqlite.cancel_pending_background_work()
 
 
@@ -2637,7 +2846,7 @@ class MemoryUnifier:
     ) -> UUID:
         await self.initialize()
         gid = uuid4()
-        async with self._write_lock:
+        async with self._write_locks["goal"]:
             await self._sqlite.create_goal(
                 goal_id=gid,
                 project_name=project_name,
@@ -2651,7 +2860,7 @@ class MemoryUnifier:
 
     async def update_goal_status(self, *, goal_id: UUID, status: str) -> None:
         await self.initialize()
-        async with self._write_lock:
+        async with self._write_locks["goal"]:
             await self._sqlite.update_goal_status(goal_id=goal_id, status=status)
 
     async def list_goals(self, *, project_name: str | None = None, limit: int = 50) -> list[dict[str, Any]]:
@@ -2669,7 +2878,7 @@ class MemoryUnifier:
     ) -> UUID:
         await self.initialize()
         tid = uuid4()
-        async with self._write_lock:
+        async with self._write_locks["goal"]:
             await self._sqlite.enqueue_task(
                 task_id=tid,
                 goal_id=goal_id,
@@ -2686,12 +2895,12 @@ class MemoryUnifier:
 
     async def complete_goal_task(self, *, task_id: str, status: str, result: dict[str, Any] | None = None, error: str = "") -> None:
         await self.initialize()
-        async with self._write_lock:
+        async with self._write_locks["goal"]:
             await self._sqlite.complete_task(task_id=task_id, status=status, result=result, error=error)
 
     async def bump_goal_task_attempt(self, *, task_id: str, attempts: int, run_after_iso: str, error: str) -> None:
         await self.initialize()
-        async with self._write_lock:
+        async with self._write_locks["goal"]:
             await self._sqlite.bump_task_attempt(task_id=task_id, attempts=attempts, run_after_iso=run_after_iso, error=error)
 
     async def list_goal_tasks(self, *, goal_id: str | None = None, project_name: str | None = None, limit: int = 50) -> list[dict[str, Any]]:
@@ -2709,7 +2918,7 @@ class MemoryUnifier:
     ) -> UUID:
         await self.initialize()
         pid = uuid4()
-        async with self._write_lock:
+        async with self._write_locks["goal"]:
             await self._sqlite.create_proposal(
                 proposal_id=pid,
                 goal_id=goal_id,
@@ -2726,12 +2935,12 @@ class MemoryUnifier:
 
     async def set_proposal_status(self, *, proposal_id: str, status: str) -> None:
         await self.initialize()
-        async with self._write_lock:
+        async with self._write_locks["goal"]:
             await self._sqlite.set_proposal_status(proposal_id=proposal_id, status=status)
 
     async def add_progress_event(self, *, goal_id: UUID, project_name: str, kind: str, message: str) -> None:
         await self.initialize()
-        async with self._write_lock:
+        async with self._write_locks["goal"]:
             await self._sqlite.add_progress_event(event_id=uuid4(), goal_id=goal_id, project_name=project_name, kind=kind, message=message)
 
     async def fetch_unacked_progress(self, *, project_name: str, limit: int = 10) -> list[dict[str, Any]]:
@@ -33,8 +33,11 @@ from core.logging_setup import get_logger
 logger = get_logger(__name__)
 
 
+_WS_RE = re.compile(r"\s+")
+
+
 def _norm(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "").strip().lower())[:200]
+    return _WS_RE.sub(" ", (s or "").strip().lower())[:200]
 
 
 class WorldModel:
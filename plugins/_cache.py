@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+"""Short-lived in-process cache for plugin API responses.
+
+maps.geocode and weather.current are asked the same things over and over
+(home, work, "the weather here"). A hit skips the network round-trip and
+the API quota. Entries are deep-copied both ways so a caller that edits its
+result can't change what the next caller gets.
+"""
+
+import copy
+from time import monotonic
+from typing import Any
+
+_MAX_ENTRIES = 256
+
+_entries: dict[str, tuple[float, Any]] = {}
+
+
+def get(key: str) -> Any | None:
+    hit = _entries.get(key)
+    if hit is None:
+        return None
+    if hit[0] <= monotonic():
+        _entries.pop(key, None)
+        return None
+    return copy.deepcopy(hit[1])
+
+
+def put(key: str, value: Any, ttl_s: float) -> None:
+    if len(_entries) >= _MAX_ENTRIES and key not in _entries:
+        now = monotonic()
+        for k in [k for k, (exp, _v) in _entries.items() if exp <= now]:
+            del _entries[k]
+        if len(_entries) >= _MAX_ENTRIES:
+            del _entries[next(iter(_entries))]  # oldest insert
+    _entries[key] = (monotonic() + ttl_s, copy.deepcopy(value))
+
+
+def clear() -> None:
+    _entries.clear()
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+"""Shared keep-alive httpx client for the API plugins (discord, google_maps,
+weather).
+
+A client per call paid a fresh TCP + TLS handshake to the same few hosts on
+every tool use. One client per event loop keeps those connections warm. It is
+rebuilt when the loop changes, since its pooled connections belong to the
+loop that opened them. Per-call headers and timeouts go on the request.
+"""
+
+import asyncio
+
+import httpx
+
+_client: httpx.AsyncClient | None = None
+_loop: asyncio.AbstractEventLoop | None = None
+
+
+def client() -> httpx.AsyncClient:
+    global _client, _loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _loop is not loop:
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(10.0),
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
+        _loop = loop
+    return _client
+
+
+async def aclose() -> None:
+    """Close the shared client (backend shutdown). The next call opens a new one."""
+    global _client, _loop
+    c, _client, _loop = _client, None, None
+    if c is not None and not c.is_closed:
+        await c.aclose()
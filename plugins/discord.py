@@ -2,8 +2,7 @@ from __future__ import annotations
 
 import os
 
-import httpx
-
+from plugins import _http
 from plugins.registry import PluginConfigError, tool
 
 
@@ -27,15 +26,14 @@ async def send_message(args: dict) -> dict:
         raise ValueError("discord.send requires 'content'")
 
     headers = {"Authorization": f"Bot {token}", "Content-Type": "application/json"}
-    timeout = httpx.Timeout(10.0)
 
-    async with httpx.AsyncClient(timeout=timeout, headers=headers) as client:
-        r = await client.post(
-            f"https://discord.com/api/v10/channels/{channel_id}/messages",
-            json={"content": content},
-        )
-        r.raise_for_status()
-        data = r.json()
+    r = await _http.client().post(
+        f"https://discord.com/api/v10/channels/{channel_id}/messages",
+        json={"content": content},
+        headers=headers,
+    )
+    r.raise_for_status()
+    data = r.json()
 
     return {"id": data.get("id"), "channel_id": channel_id, "content": data.get("content")}
 
@@ -52,15 +50,14 @@ async def read_messages(args: dict) -> dict:
     limit = max(1, min(int(args.get("limit") or 10), 50))
 
     headers = {"Authorization": f"Bot {token}"}
-    timeout = httpx.Timeout(10.0)
-
-    async with httpx.AsyncClient(timeout=timeout, headers=headers) as client:
-        r = await client.get(
-            f"https://discord.com/api/v10/channels/{channel_id}/messages",
-            params={"limit": limit},
-        )
-        r.raise_for_status()
-        data = r.json()
+
+    r = await _http.client().get(
+        f"https://discord.com/api/v10/channels/{channel_id}/messages",
+        params={"limit": limit},
+        headers=headers,
+    )
+    r.raise_for_status()
+    data = r.json()
 
     messages = [
         {
@@ -6,8 +6,7 @@ import re
 import urllib.parse
 from typing import Any
 
-import httpx
-
+from plugins import _cache, _http
 from plugins.registry import PluginConfigError, tool
 
 
@@ -56,14 +55,18 @@ async def geocode(args: dict) -> dict:
     if not address:
         raise ValueError("maps.geocode requires 'address'")
 
-    timeout = httpx.Timeout(10.0)
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        response = await client.get(
-            "https://maps.googleapis.com/maps/api/geocode/json",
-            params={"address": address, "key": api_key},
-        )
-        response.raise_for_status()
-        data = response.json()
+    # Addresses don't move; a day's TTL absorbs the repeats.
+    cache_key = "geocode:" + " ".join(address.lower().split())
+    cached = _cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    response = await _http.client().get(
+        "https://maps.googleapis.com/maps/api/geocode/json",
+        params={"address": address, "key": api_key},
+    )
+    response.raise_for_status()
+    data = response.json()
 
     status = data.get("status")
     if status != "OK":
@@ -74,7 +77,7 @@ async def geocode(args: dict) -> dict:
     formatted_address = top.get("formatted_address")
     place_id = top.get("place_id")
     maps_url = _place_maps_url(place_id=place_id, query=formatted_address or address)
-    return {
+    result = {
         "kind": "places",
         "status": status,
         "query": address,
@@ -96,6 +99,8 @@ async def geocode(args: dict) -> dict:
             }
         ],
     }
+    _cache.put(cache_key, result, ttl_s=86400)
+    return result
 
 
 @tool(
@@ -113,14 +118,12 @@ async def place_search(args: dict[str, Any]) -> dict[str, Any]:
 
     limit = max(1, min(int(args.get("limit") or 6), 10))
 
-    timeout = httpx.Timeout(10.0)
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        response = await client.get(
-            "https://maps.googleapis.com/maps/api/place/textsearch/json",
-            params={"query": query, "key": api_key},
-        )
-        response.raise_for_status()
-        data = response.json()
+    response = await _http.client().get(
+        "https://maps.googleapis.com/maps/api/place/textsearch/json",
+        params={"query": query, "key": api_key},
+    )
+    response.raise_for_status()
+    data = response.json()
 
     status = data.get("status")
     if status not in {"OK", "ZERO_RESULTS"}:
@@ -172,14 +175,12 @@ async def directions(args: dict) -> dict:
     if not destination:
         raise ValueError("maps.directions requires 'destination'")
 
-    timeout = httpx.Timeout(10.0)
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        response = await client.get(
-            "https://maps.googleapis.com/maps/api/directions/json",
-            params={"origin": origin, "destination": destination, "mode": mode, "key": api_key},
-        )
-        response.raise_for_status()
-        data = response.json()
+    response = await _http.client().get(
+        "https://maps.googleapis.com/maps/api/directions/json",
+        params={"origin": origin, "destination": destination, "mode": mode, "key": api_key},
+    )
+    response.raise_for_status()
+    data = response.json()
 
     status = data.get("status")
     if status != "OK":
@@ -259,19 +260,17 @@ async def places_nearby(args: dict[str, Any]) -> dict[str, Any]:
 
     limit = max(1, min(int(args.get("limit") or 6), 10))
 
-    timeout = httpx.Timeout(10.0)
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        response = await client.get(
-            "https://maps.googleapis.com/maps/api/place/nearbysearch/json",
-            params={
-                "location": f"{lat},{lng}",
-                "rankby": "distance",
-                "keyword": query,
-                "key": api_key,
-            },
-        )
-        response.raise_for_status()
-        data = response.json()
+    response = await _http.client().get(
+        "https://maps.googleapis.com/maps/api/place/nearbysearch/json",
+        params={
+            "location": f"{lat},{lng}",
+            "rankby": "distance",
+            "keyword": query,
+            "key": api_key,
+        },
+    )
+    response.raise_for_status()
+    data = response.json()
 
     status = data.get("status")
     if status not in {"OK", "ZERO_RESULTS"}:
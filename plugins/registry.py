@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import asyncio
 from dataclasses import dataclass
-from typing import Any, Awaitable, Callable
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Mapping
 
 
 class PluginConfigError(RuntimeError):
@@ -22,21 +22,20 @@ class ToolSpec:
 class ToolRegistry:
     def __init__(self) -> None:
         self._tools: dict[str, ToolSpec] = {}
-        self._lock = asyncio.Lock()
+        # Read-only live view handed to callers instead of a copy per lookup.
+        self._view: Mapping[str, ToolSpec] = MappingProxyType(self._tools)
 
     async def register(self, spec: ToolSpec) -> None:
-        async with self._lock:
-            if spec.name in self._tools:
-                raise RuntimeError(f"Tool already registered: {spec.name}")
-            self._tools[spec.name] = spec
+        # No await between the check and the insert, so no lock is needed.
+        self.register_sync(spec)
 
     def register_sync(self, spec: ToolSpec) -> None:
         if spec.name in self._tools:
             raise RuntimeError(f"Tool already registered: {spec.name}")
         self._tools[spec.name] = spec
 
-    def get_tools(self) -> dict[str, ToolSpec]:
-        return dict(self._tools)
+    def get_tools(self) -> Mapping[str, ToolSpec]:
+        return self._view
 
 
 REGISTRY = ToolRegistry()
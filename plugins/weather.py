@@ -2,8 +2,7 @@ from __future__ import annotations
 
 import os
 
-import httpx
-
+from plugins import _cache, _http
 from plugins.registry import PluginConfigError, tool
 
 
@@ -39,15 +38,20 @@ async def current_weather(args: dict) -> dict:
     else:
         raise ValueError("weather.current requires 'city' or numeric 'lat'+'lon'")
 
-    timeout = httpx.Timeout(10.0)
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        r = await client.get("https://api.openweathermap.org/data/2.5/weather", params=params)
-        r.raise_for_status()
-        data = r.json()
+    # Current conditions barely move in ten minutes; reuse them.
+    where = f"{params['lat']:.4f},{params['lon']:.4f}" if "lat" in params else " ".join(city.lower().split())
+    cache_key = f"weather:{units.lower()}:{where}"
+    cached = _cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    r = await _http.client().get("https://api.openweathermap.org/data/2.5/weather", params=params)
+    r.raise_for_status()
+    data = r.json()
 
     main = data.get("main", {})
     weather = (data.get("weather") or [{}])[0]
-    return {
+    result = {
         "city": city or data.get("name"),
         "units": units,
         "temp": main.get("temp"),
@@ -55,3 +59,5 @@ async def current_weather(args: dict) -> dict:
         "humidity": main.get("humidity"),
         "description": weather.get("description"),
     }
+    _cache.put(cache_key, result, ttl_s=600)
+    return result
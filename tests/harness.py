@@ -180,6 +180,12 @@ class ScriptedLLM:
     async def initialize(self) -> None:
         return None
 
+    async def warmup(self) -> None:
+        return None
+
+    def pin_prefix(self, text: str) -> None:
+        return None
+
     @property
     def model_loaded(self) -> bool:
         return True
@@ -347,6 +353,11 @@ def _base_env(root: Path) -> dict[str, str]:
         "NOVA_RESEARCH": "0",
         "NOVA_SELF_BENCHMARK": "0",
         "NOVA_AGENT_SOCIETY": "0",
+        # Where an embedding model loads, a repeated question would be served
+        # from the answer cache and never reach ScriptedLLM. Suites that ask
+        # the same thing twice are testing the pipeline, not the cache
+        # (test_it_answer_cache turns it on).
+        "NOVA_SEMANTIC_CACHE": "0",
         "NOVA_CLOUD_ENABLED": "0",
         "NOVA_CLOUD_BASE_URL": "",
         "NOVA_CLOUD_MODEL": "",
@@ -5,13 +5,15 @@ a live question), so they're tested as pure logic without needing an embedding
 model. Correction is tested end-to-end against real memory.
 """
 import asyncio
+import os
 import sys
 import tempfile
 from pathlib import Path
+from uuid import uuid4
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from core.semantic_cache import SemanticCache, _cosine
+from core.semantic_cache import SemanticCache, _cosine, cache_enabled, context_key
 from memory.unifier import MemoryUnifier
 
 _fail = False
@@ -31,6 +33,7 @@ class StubCache(SemanticCache):
     VOCAB = ["spouse", "wife", "name", "who", "what", "married", "weather", "time", "project", "build"]
 
     def _embed(self, text: str):
+        self.embeds = getattr(self, "embeds", 0) + 1
         low = (text or "").lower()
         return [1.0 if w in low else 0.0 for w in self.VOCAB] or [0.0]
 
@@ -41,6 +44,14 @@ async def main():
     check(_cosine([1, 0], [0, 1]) == 0.0, "orthogonal vectors score 0")
     check(_cosine([], [1]) == 0.0, "degenerate vectors score 0 (no crash)")
 
+    # ── opt-in ──
+    os.environ.pop("NOVA_SEMANTIC_CACHE", None)
+    check(not cache_enabled(), "the answer cache is off unless NOVA_SEMANTIC_CACHE is set")
+    off = StubCache(threshold=0.5)
+    check(not off.store("who is my spouse and what is her name", "Your wife is Jordan; you married in 2015."),
+          "a disabled cache stores nothing")
+    os.environ["NOVA_SEMANTIC_CACHE"] = "1"
+
     # ── ADMISSION RULES — the safety story ──
     long_q = "who is my spouse and what is her name"
     long_a = "Your spouse is Leslie, and you have two children together."
@@ -55,6 +66,8 @@ async def main():
     check(not SemanticCache.cacheable(long_q, "yes"), "a too-short answer is not cached")
     check(not SemanticCache.cacheable("what did we do today", long_a),
           "a question about 'today' is not cached")
+    check(not SemanticCache.cacheable("explain that in more detail please", long_a),
+          "a follow-up that refers back to an earlier turn is not cached")
 
     # ── hit on a semantically equivalent rephrasing ──
     # NOTE: the stub's bag-of-words vectors are far coarser than real embeddings
@@ -69,9 +82,22 @@ async def main():
         check(hit[0] == long_a, "hit returns the stored answer")
         check(hit[1] >= 0.5, f"hit score meets the threshold (got {hit[1]:.2f})")
 
-    check(c.lookup("what should I build for this project") is None,
+    check(c.lookup("what should I build for my project") is None,
           "an unrelated question MISSES (no false hit)")
 
+    # ── context isolation: same words, different conversation ──
+    ctx_a = context_key("conv-a")
+    ctx_b = context_key("conv-b")
+    scoped = StubCache(threshold=0.5)
+    scoped.store(long_q, long_a, context=ctx_a)
+    check(scoped.lookup(long_q, context=ctx_a) is not None, "a lookup in the same context hits")
+    check(scoped.lookup(long_q, context=ctx_b) is None, "the same question in another conversation misses")
+    check(scoped.lookup(long_q) is None, "an entry with a context never answers a context-less lookup")
+    check(context_key("conv-a") == ctx_a, "the key is stable across turns of one conversation")
+    scoped.embeds = 0
+    check(scoped.lookup("could you say that again about my spouse", context=ctx_a) is None
+          and scoped.embeds == 0, "a follow-up never embeds and never matches a stored answer")
+
     # ── threshold is respected ──
     strict = StubCache(threshold=0.999)
     strict.store(long_q, long_a)
@@ -92,6 +118,17 @@ async def main():
     st = c.stats()
     check(st["hits"] >= 1 and st["misses"] >= 1, "stats track hits and misses")
 
+    # ── the runtime's async path: embedding only when a hit is possible ──
+    a = StubCache(threshold=0.5)
+    check(await a.lookup_async(long_q) is None and not getattr(a, "embeds", 0),
+          "a lookup against an empty cache does not embed")
+    check(await a.store_async(long_q, long_a), "store_async admits a cacheable exchange")
+    a.embeds = 0
+    check(await a.lookup_async("what is my wife's name right now") is None and a.embeds == 0,
+          "a time-bound question never embeds and never matches a stored answer")
+    hit = await a.lookup_async("what is my wife's name")
+    check(hit is not None and hit[0] == long_a and a.embeds == 1, "lookup_async hits like lookup")
+
     # ── CONVERSATIONAL MEMORY CORRECTION ──
     with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as td:
         mem = MemoryUnifier(Path(td), enable_chroma=False)
@@ -122,6 +159,13 @@ async def main():
         bad = await mem.correct_fact("user", "", "x")
         check(bad["ok"] is False, "correction rejects missing fields")
 
+        # ── what invalidates the runtime's answer cache ──
+        gen = mem.knowledge_generation
+        await mem.ingest_turn(uuid4(), "user", "a long enough message to be indexed semantically")
+        check(mem.knowledge_generation == gen, "indexing a conversation turn does not count as new knowledge")
+        await mem.add_fact(entity="user", attribute="favorite_color", value="green", confidence=0.8)
+        check(mem.knowledge_generation > gen, "a fact write moves the knowledge generation")
+
     print("\nRESULT:", "FAILURES" if _fail else "ALL PASS")
     sys.exit(1 if _fail else 0)
 
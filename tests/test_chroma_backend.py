@@ -13,6 +13,7 @@ pinning: it is what runs on any machine where the embed model won't load.
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import sys
 import tempfile
 from pathlib import Path
@@ -22,6 +23,8 @@ sys.path.insert(0, str(Path(__file__).resolve().parent))
 
 from harness import Checks
 
+import numpy as np
+
 from memory import embeddings as emb_mod
 from memory.backends.chroma_backend import (
     ChromaMemoryBackend, _HashEmbeddingFunction, _SemanticEmbeddingFunction,
@@ -40,23 +43,35 @@ async def test_hash_embedder() -> None:
     v = f.embed_query("hello world")
     check(len(v) == 384, "embed_query returns the configured dimension")
     check(abs(sum(x * x for x in v) - 1.0) < 1e-4, "vectors are L2-normalized")
-    check(f.embed_query("hello world") == v, "the same text always embeds identically")
-    check(f.embed_query("HELLO WORLD") == v, "embedding is case-insensitive")
-    check(f.embed_query("totally different") != v, "different text embeds differently")
+    check(np.array_equal(f.embed_query("hello world"), v), "the same text always embeds identically")
+    check(np.array_equal(f.embed_query("HELLO WORLD"), v), "embedding is case-insensitive")
+    check(not np.array_equal(f.embed_query("totally different"), v), "different text embeds differently")
 
-    check(f.embed_query("") == [0.0] * 384, "empty text yields a zero vector, not a crash")
-    check(f.embed_query(None) == [0.0] * 384, "None yields a zero vector, not a crash")
+    check(f.embed_query("").tolist() == [0.0] * 384, "empty text yields a zero vector, not a crash")
+    check(f.embed_query(None).tolist() == [0.0] * 384, "None yields a zero vector, not a crash")
     check(len(f.embed_query(["a", "b"])) == 384, "a list input is joined rather than rejected")
 
     docs = f.embed_documents(["one", "two", "three"])
     check(len(docs) == 3 and all(len(d) == 384 for d in docs), "embed_documents maps over the batch")
     check(f.embed_documents([]) == [], "an empty batch returns an empty list")
-    check(f(["x"]) == f.embed_documents(["x"]), "__call__ matches embed_documents")
+    check(np.array_equal(f(["x"]), f.embed_documents(["x"])), "__call__ matches embed_documents")
 
     long_text = " ".join(str(i) for i in range(5000))
     check(len(f.embed_query(long_text)) == 384, "a 5000-token input is truncated, not fatal")
 
     check(f.name() == "hash-embed-v1", "name() identifies the embedder")
+
+    # Stored vectors were written with the original per-token blake2b scheme;
+    # a query has to land in the same space or recall silently breaks.
+    def reference(text: str) -> np.ndarray:
+        vec = np.zeros(384, dtype=np.float32)
+        for p in text.strip().lower().split()[:256]:
+            h = hashlib.blake2b(p.encode("utf-8"), digest_size=8).digest()
+            vec[int.from_bytes(h[:4], "little") % 384] += -1.0 if (h[4] & 1) else 1.0
+        norm = float(np.linalg.norm(vec))
+        return vec / norm if norm else vec
+    sample = "Marcus said the Tomatoes came in early, tomatoes again"
+    check(np.allclose(f.embed_query(sample), reference(sample)), "vectors match the original blake2b embedding exactly")
     check(f.get_config() == {"dim": 384}, "get_config reports the dimension")
 
 
@@ -64,7 +79,7 @@ async def test_semantic_falls_back() -> None:
     check.section("_SemanticEmbeddingFunction with the model unavailable")
     s = _SemanticEmbeddingFunction(dim=384)
     h = _HashEmbeddingFunction(dim=384)
-    check(s.embed_query("anything") == h.embed_query("anything"),
+    check(np.array_equal(s.embed_query("anything"), h.embed_query("anything")),
           "it degrades to the hash embedder instead of raising")
     check(len(s.embed_documents(["a", "b"])) == 2, "batch path also degrades cleanly")
     check(s.name() == "nova-semantic-v1", "it still reports its own name")
@@ -124,6 +139,24 @@ async def test_backend(tmp: Path) -> None:
     await be.upsert_text("after", "still works", {"kind": "x"})
     check(await be.count() == 1, "the backend is usable again after reset")
 
+    await be.upsert_many(["b1", " ", "b2", "b3"], ["first batched", "ignored", "second batched", "third"],
+                         [{"kind": "x"}, {"kind": "x"}, None, {"kind": "y"}])
+    check(await be.count() == 4, "upsert_many stores a batch, skipping the blank id")
+    got = {h["id"]: h["metadata"] for h in await be.query("batched", limit=10)}
+    check(got.get("b1") == {"kind": "x"} and got.get("b2") == {}, "a batch may mix docs with and without metadata")
+    await be.upsert_many(["b1"], ["first batched, replaced"])
+    check(await be.count() == 4, "upsert_many replaces an existing id like upsert_text")
+    vecs = await be.embed(["precomputed doc", "another one"])
+    check(len(vecs) == 2 and len(vecs[0]) == 384, "embed returns one 384-dim vector per text")
+    await be.upsert_many(["e1", "e2"], ["precomputed doc", "another one"], [{"kind": "pre"}, None], embeddings=vecs)
+    got = {h["id"]: h["text"] for h in await be.query("precomputed doc", limit=10)}
+    check(got.get("e1") == "precomputed doc" and "e2" in got, "upsert_many stores precomputed vectors with their docs")
+    await be.delete_ids(["e1", "e2"])
+    await be.upsert_many(["b2", "b3"], ["second batched", "third"], [{"kind": "hashed", "h": "abc"}, {"kind": "hashed"}])
+    hashes = await be.doc_hashes(["hashed"])
+    check(hashes == {"b2": "abc", "b3": ""}, f"doc_hashes reads the stored hash per id, for the given kinds only ({hashes})")
+    await be.delete_ids(["b1", "b2", "b3"])
+
     # Concurrency: the backend serializes on a lock. Chroma is not
     # thread-safe, so a missing lock would corrupt or deadlock here.
     await asyncio.gather(*(be.upsert_text(f"c{i}", f"entry number {i}", {"i": str(i)}) for i in range(25)))
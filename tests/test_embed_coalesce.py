@@ -0,0 +1,80 @@
+"""memory/embeddings.py: concurrent embed_texts calls share forward passes.
+
+torch isn't needed here: `_encode` (the forward pass) is swapped for a slow
+fake that records each batch it was given, so the test sees exactly how the
+callers were coalesced.
+"""
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from harness import Checks
+
+from memory import embeddings as emb_mod
+
+check = Checks()
+
+passes: list[list[str]] = []
+
+
+def _fake_encode(cleaned: list[str]) -> list[list[float]]:
+    passes.append(list(cleaned))
+    time.sleep(0.05)
+    if "boom" in cleaned:
+        raise RuntimeError("forward pass failed")
+    return [[float(len(t)), float(i)] for i, t in enumerate(cleaned)]
+
+
+emb_mod.embedding_available = lambda: True
+emb_mod._encode = _fake_encode
+
+
+def _run_concurrently(jobs: list[list[str]]) -> list[object]:
+    results: list[object] = [None] * len(jobs)
+
+    def worker(i: int) -> None:
+        try:
+            results[i] = emb_mod.embed_texts(jobs[i])
+        except Exception as e:  # noqa: BLE001
+            results[i] = e
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(len(jobs))]
+    for t in threads:
+        t.start()
+        time.sleep(0.002)
+    for t in threads:
+        t.join()
+    return results
+
+
+check.section("a lone call is encoded as-is")
+out = emb_mod.embed_texts(["hello", "", "world!"])
+check(passes == [["hello", " ", "world!"]], "one pass, blank text padded to a space")
+check([v[0] for v in out] == [5.0, 1.0, 6.0], "vectors come back in input order")
+check(emb_mod.embed_texts([]) == [], "an empty call returns without a pass")
+
+check.section("concurrent calls are coalesced")
+passes.clear()
+jobs = [[f"text-{i}", "x" * (i + 1)] for i in range(8)]
+results = _run_concurrently(jobs)
+check(len(passes) < len(jobs), f"{len(jobs)} callers shared {len(passes)} forward passes")
+check(sum(len(p) for p in passes) == 2 * len(jobs), "every text is encoded exactly once")
+check(all(isinstance(r, list) and len(r) == 2 for r in results), "each caller gets one vector per text")
+check(all(r[1][0] == float(i + 1) for i, r in enumerate(results)), "each caller gets its OWN vectors back")
+check(not emb_mod._busy and not emb_mod._pending, "nothing is left queued or marked busy")
+
+check.section("a failed pass fails only the callers in it")
+passes.clear()
+results = _run_concurrently([["slow"], ["boom"], ["fine"]])
+failed = [r for r in results if isinstance(r, Exception)]
+check(bool(failed) and isinstance(results[1], RuntimeError), "the caller whose pass failed sees the error")
+check(not emb_mod._busy, "a failure releases the model for the next caller")
+check(isinstance(emb_mod.embed_texts(["after"]), list), "later calls still work")
+
+check.finish()
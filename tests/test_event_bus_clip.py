@@ -0,0 +1,81 @@
+"""core/event_bus.py: bounded rendering of tool results (str_head / clip).
+
+Tool-loop prompts and bus summaries keep a few hundred chars of results that
+can hold 20 KB of shell output. str_head renders only that prefix, so the one
+contract that matters is that it is byte-for-byte `str(value)[:limit]` —
+otherwise the model sees different observations than it used to.
+"""
+from __future__ import annotations
+
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from harness import Checks
+
+from core.event_bus import clip, str_head
+
+check = Checks()
+
+
+def _rand_str(rng: random.Random) -> str:
+    return "".join(rng.choice("ab'\"\\\n\té😀 ") for _ in range(rng.randint(0, 30)))
+
+
+def _rand_value(rng: random.Random, depth: int = 0):
+    c = rng.randint(0, 9 if depth < 3 else 4)
+    if c <= 1:
+        return _rand_str(rng)
+    if c == 2:
+        return rng.randint(-1000, 10**30)
+    if c == 3:
+        return rng.choice([None, True, False, 1.5])
+    if c == 4:
+        return b"by'tes"
+    if c <= 6:
+        return {_rand_str(rng): _rand_value(rng, depth + 1) for _ in range(rng.randint(0, 4))}
+    if c == 7:
+        return [_rand_value(rng, depth + 1) for _ in range(rng.randint(0, 4))]
+    return tuple(_rand_value(rng, depth + 1) for _ in range(rng.randint(0, 3)))
+
+
+def test_matches_str_prefix() -> None:
+    check.section("str_head == str(value)[:limit]")
+    big = {"ok": True, "cmd": "make", "stdout": "x" * 20000, "stderr": "it's \"quoted\"" * 500}
+    for n in (0, 1, 50, 700, 30000, 60000):
+        check(str_head(big, n) == str(big)[:n], f"large tool result, limit {n}")
+    check(str_head(("one",), 20) == str(("one",)), "1-tuple keeps its trailing comma")
+    check(str_head("plain text", 5) == "plain", "a top-level str is not repr()'d")
+    check(str_head(ValueError("boom"), 200) == "boom", "a top-level exception renders as its message")
+    check(str_head(Path("/tmp/x.txt"), 200) == str(Path("/tmp/x.txt")), "a top-level Path renders as str(), not repr()")
+    check(str_head({"p": Path("/tmp/x")}, 200) == str({"p": Path("/tmp/x")}), "nested objects still render as repr()")
+
+    rng = random.Random(11)
+    mismatches = 0
+    for _ in range(5000):
+        v, n = _rand_value(rng), rng.randint(0, 200)
+        if str_head(v, n) != str(v)[:n]:
+            mismatches += 1
+    check(mismatches == 0, f"randomized nested values match exactly ({mismatches} mismatches)")
+
+
+def test_clip() -> None:
+    check.section("clip")
+    check(clip({"a": "b" * 500}, 20) == str({"a": "b" * 500})[:19] + "…", "long values end in an ellipsis")
+    check(clip({"a": 1}, 20) == "{'a': 1}", "short values are unchanged")
+    check(clip(None, 20) == "", "falsy values render empty")
+    check(clip(ValueError("boom"), 200) == "boom", "an exception clips to its message, as tool.error shows it")
+    check(clip(Path("/tmp/x.txt"), 200) == str(Path("/tmp/x.txt")), "a Path clips to the path itself")
+
+
+def main() -> None:
+    test_matches_str_prefix()
+    test_clip()
+    check.finish()
+
+
+if __name__ == "__main__":
+    main()
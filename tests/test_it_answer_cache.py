@@ -0,0 +1,78 @@
+"""INTEGRATION (U5): the semantic answer cache, on a real backend.
+
+test_capabilities_u5 covers the cache's admission rules as pure logic. This
+suite checks that the runtime actually gets hits from it. The context key the
+runtime builds must stay the same from one turn to the next, even though every
+turn adds to the conversation state. A key that changes each turn makes the
+cache dead weight: it embeds every question and never answers one.
+
+The one substitution beyond tests/harness.py: the runtime's cache embeds with
+a bag-of-words stub instead of a transformer, the same stub
+test_capabilities_u5 uses, so the suite runs without loading an embedding
+model.
+"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from uuid import uuid4
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from harness import Checks, boot, run
+
+from core.semantic_cache import SemanticCache
+
+check = Checks()
+
+REPLY = "Your spouse is Leslie, and you have two children together."
+
+
+class _BagOfWordsCache(SemanticCache):
+    VOCAB = ["spouse", "wife", "name", "who", "what", "married", "weather", "time", "project", "build"]
+
+    def _embed(self, text: str):
+        low = (text or "").lower()
+        return [1.0 if w in low else 0.0 for w in self.VOCAB]
+
+
+async def _turn(nova, text: str, conv) -> str:
+    res = await nova.say(text, conversation_id=conv)
+    # Persistence runs as a task after "done"; let it land so the next turn
+    # sees this one in its conversation state, as a live follow-up would.
+    await nova.runtime._drain_persist_tasks()
+    return res.assistant_text.strip()
+
+
+async def main() -> None:
+    async with boot(env={"NOVA_SEMANTIC_CACHE": "1"}, default_reply=REPLY) as nova:
+        nova.runtime._answer_cache = _BagOfWordsCache(threshold=0.5)
+        conv = uuid4()
+
+        check.section("A rephrased repeat is answered from the cache")
+        first = await _turn(nova, "who is my spouse and what is her name", conv)
+        check(first == REPLY, f"the first ask is generated ({first[:40]!r})")
+        check(nova.runtime._answer_cache.stats()["entries"] == 1, "the reply was stored")
+
+        nova.llm.reset_calls()
+        nova.llm.default_reply = "a freshly generated reply that the cache should have made unnecessary"
+        second = await _turn(nova, "what is my wife's name", conv)
+        check(second == REPLY, f"the rephrased ask gets the cached reply ({second[:40]!r})")
+        check(nova.llm.prompts == [], f"no model call was made for it ({len(nova.llm.prompts)} prompts)")
+        check(nova.runtime._answer_cache.hits == 1, "the runtime counted one cache hit")
+
+        check.section("The cache stays inside its conversation")
+        other = await _turn(nova, "what is my wife's name", uuid4())
+        check(other != REPLY, "the same question in a new conversation is generated, not reused")
+
+        check.section("A follow-up always reaches the model")
+        nova.llm.reset_calls()
+        follow = await _turn(nova, "tell me more about that name", conv)
+        check(follow != REPLY and nova.llm.prompts, "a question that refers back is never served from the cache")
+
+    check.finish()
+
+
+if __name__ == "__main__":
+    run(main)
@@ -15,6 +15,7 @@ What this suite is here to catch (none of which a unit test can see):
 from __future__ import annotations
 
 import asyncio
+import json
 import sys
 import time
 from pathlib import Path
@@ -81,16 +82,30 @@ async def main() -> None:
         check.section("Streaming shares the same pipeline")
         chunks: list[str] = []
         done_seen = False
+        event = ""
         async with nova.http.stream("POST", "/chat/stream", json={"msg": "tell me something good"}) as resp:
             check(resp.status_code == 200, f"POST /chat/stream -> {resp.status_code}")
             async for line in resp.aiter_lines():
-                if line.startswith("event: done"):
-                    done_seen = True
-                elif line.startswith("data:"):
-                    chunks.append(line[5:].strip())
-        streamed = " ".join(chunks)
+                if line.startswith("event:"):
+                    event = line[6:].strip()
+                    done_seen = done_seen or event == "done"
+                elif line.startswith("data:") and event == "message":
+                    chunks.append(json.loads(line[5:]).get("content") or "")
+        # Message frames are deltas; a client concatenates them, so do the same.
+        streamed = "".join(chunks)
         check(done_seen, "the stream terminates with a done event")
-        check(REPLY[:20] in streamed, "the streamed text carries the reply")
+        check(streamed.strip() == REPLY, "the streamed deltas reassemble into exactly the reply")
+
+        # "done" goes out before the turn is persisted (that runs as a task);
+        # the next turn still has to see it in its recent-chat context.
+        conv2 = uuid4()
+        async for ev in nova.runtime.chat_turn_stream(user_text="the garden finally has tomatoes",
+                                                      conversation_id=conv2):
+            if ev.get("type") == "done":
+                break
+        await nova.runtime._drain_persist_tasks()
+        recent = await nova.runtime.state_store.recent_chat_text(conv2)
+        check("finally has tomatoes" in recent, "a streamed turn is recorded even when the reader stops at done")
 
         check.section("An empty message is a client error, not a crash")
         r = await nova.http.post("/chat", json={"message": "   "})
@@ -0,0 +1,121 @@
+"""core/llm_runtime.py: the pinned reply-prompt prefix (NOVA_LLM_PREFIX_CACHE).
+
+llama.cpp can't be loaded here, so a fake Llama stands in that models the
+two things the feature relies on: a completion re-evaluates only the tokens
+past the longest prefix it shares with what's resident, and save/load_state
+round-trip that resident state. One "token" per character keeps the boundary
+search easy to follow.
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from harness import Checks
+
+from core.llm_runtime import LLMRuntime
+
+check = Checks()
+
+PERSONA = "You are Nova, a warm and sharp companion. " * 4
+
+
+class FakeLlama:
+    def __init__(self) -> None:
+        self.input_ids: list[int] = []
+        self.n_tokens = 0
+        self.evaluated = 0  # tokens actually run through the model, ever
+        self.loads = 0
+
+    @staticmethod
+    def _format(messages) -> list[int]:
+        text = "".join(f"<|{m['role']}|>{m['content']}<|end|>" for m in messages) + "<|assistant|>"
+        return [ord(c) for c in text]
+
+    def detokenize(self, ids, special: bool = False) -> bytes:  # noqa: ARG002
+        return "".join(chr(i) for i in ids).encode("utf-8")
+
+    def reset(self) -> None:
+        self.input_ids, self.n_tokens = [], 0
+
+    def eval(self, ids) -> None:
+        self.input_ids = self.input_ids[: self.n_tokens] + list(ids)
+        self.n_tokens = len(self.input_ids)
+        self.evaluated += len(ids)
+
+    def save_state(self):
+        return (list(self.input_ids), self.n_tokens)
+
+    def load_state(self, state) -> None:
+        self.input_ids, self.n_tokens = list(state[0]), state[1]
+        self.loads += 1
+
+    def create_chat_completion(self, messages, **_kw):
+        tokens = self._format(messages)
+        keep = 0
+        for a, b in zip(self.input_ids[: self.n_tokens], tokens):
+            if a != b:
+                break
+            keep += 1
+        self.n_tokens = keep
+        self.eval(tokens[keep:])
+        return {"choices": [{"message": {"content": "ok, here you go"}}], "usage": {}}
+
+
+def _reply_prompt(dynamic: str, user: str):
+    return [{"role": "system", "content": PERSONA + dynamic}, {"role": "user", "content": user}]
+
+
+async def _run(rt: LLMRuntime, messages) -> int:
+    fake = rt._llama
+    before = fake.evaluated
+    await rt.chat(messages, thinking=True)
+    return fake.evaluated - before
+
+
+async def main() -> None:
+    check.section("pinned prefix is restored instead of re-prefilled")
+    os.environ["NOVA_LLM_PREFIX_CACHE"] = "1"
+    rt = LLMRuntime(model_path=None)
+    rt._llama = fake = FakeLlama()
+    rt.pin_prefix(PERSONA)
+
+    await _run(rt, _reply_prompt("It is 9:14 on Monday.", "hi"))
+    pinned = len(rt._prefix_tokens)
+    check(pinned > 32, f"first matching call snapshots the prefix ({pinned} tokens)")
+    header = len(FakeLlama._format([{"role": "system", "content": ""}])) - len("<|end|><|assistant|>")
+    check(pinned <= header + len(PERSONA), "the snapshot never reaches past the pinned text")
+
+    # A tool-loop prompt evicts the persona from the resident state...
+    await _run(rt, [{"role": "system", "content": "Decide on a tool."}, {"role": "user", "content": "hi"}])
+    second = _reply_prompt("It is 9:15 on Monday.", "what's new")
+    full = len(FakeLlama._format(second))
+    spent = await _run(rt, second)
+    check(fake.loads == 1, "the snapshot is loaded once the prefix is no longer resident")
+    check(spent == full - pinned, f"only the tokens past the prefix are evaluated ({spent} of {full})")
+
+    await _run(rt, _reply_prompt("It is 9:16 on Monday.", "and now?"))
+    check(fake.loads == 1, "no load while the prefix is still resident")
+
+    check.section("prompts that don't start with the pin are untouched")
+    loads = fake.loads
+    await _run(rt, [{"role": "system", "content": "Summarize this."}, {"role": "user", "content": "x"}])
+    check(fake.loads == loads, "a different system prompt never loads the snapshot")
+
+    check.section("off by default")
+    os.environ["NOVA_LLM_PREFIX_CACHE"] = "0"
+    off = LLMRuntime(model_path=None)
+    off._llama = FakeLlama()
+    off.pin_prefix(PERSONA)
+    await _run(off, _reply_prompt("It is 9:14 on Monday.", "hi"))
+    check(off._prefix_state is None, "no snapshot is taken unless NOVA_LLM_PREFIX_CACHE is set")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
+    check.finish()
@@ -12,8 +12,11 @@ is why they get explicit tests rather than incidental ones.
 from __future__ import annotations
 
 import asyncio
+import sqlite3
 import sys
 import tempfile
+import threading
+import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from uuid import uuid4
@@ -59,14 +62,15 @@ async def test_diskcache(tmp: Path) -> None:
     await asyncio.sleep(1.4)
     check(await cache.get("ttl") is None, "value is gone after the TTL")
 
-    # Concurrency: the backend serializes on an asyncio lock; prove no
-    # interleaving corruption and no deadlock under parallel access.
+    # Concurrency: calls run unlocked on the backend's own threads (diskcache
+    # is thread-safe); prove no interleaving corruption and no deadlock.
     await asyncio.gather(*(cache.set(f"c{i}", i) for i in range(40)))
     got = await asyncio.gather(*(cache.get(f"c{i}") for i in range(40)))
     check(got == list(range(40)), "40 concurrent set/get pairs are all correct")
 
     await cache.close()
     check(cache._cache is None, "close() releases the handle")
+    check(cache._executor is None, "close() shuts down the backend's threads")
     await cache.set("after_close", 1)
     check(await cache.get("after_close") == 1, "the cache transparently reopens after close")
     await cache.close()
@@ -110,6 +114,59 @@ async def test_json_audit(tmp: Path) -> None:
     check(sorted(p["n"] for p in parsed if p and "n" in p) == list(range(60)),
           "all 60 concurrent records landed, none lost")
 
+    # Concurrent appends are group-committed: lines that queue up while a
+    # write is in flight go out together in the next one.
+    real_write, opens = JsonAuditBackend._write_lines, []
+    audit._write_lines = lambda path, lines: opens.append(path) or real_write(path, lines)
+    try:
+        await asyncio.gather(*(audit.append_audit({"g": i}) for i in range(40)))
+    finally:
+        del audit._write_lines
+    grouped = [orjson.loads(ln) for ln in (tmp / "json" / "audit.jsonl").read_bytes().splitlines()]
+    check(sorted(p["g"] for p in grouped if "g" in p) == list(range(40)), "grouped appends all land")
+    check(0 < len(opens) < 40, f"40 concurrent appends shared {len(opens)} file writes")
+
+    # A caller cancelled while its batch is being written doesn't re-queue
+    # the batch: the thread finishes the write, and nothing lands twice.
+    started = threading.Event()
+
+    def slow_write(path, lines):
+        started.set()
+        time.sleep(0.1)
+        real_write(path, lines)
+
+    audit._write_lines = slow_write
+    try:
+        task = asyncio.create_task(audit.append_audit({"c": 1}))
+        while not started.is_set():
+            await asyncio.sleep(0.005)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    finally:
+        del audit._write_lines
+    await audit.append_audit({"c": 2})
+    await asyncio.sleep(0.15)  # let any still-running write thread finish
+    seen = [orjson.loads(ln).get("c") for ln in (tmp / "json" / "audit.jsonl").read_bytes().splitlines()]
+    check(seen.count(1) == 1 and seen.count(2) == 1, f"a cancelled append's line is written exactly once ({seen.count(1)})")
+
+    # A failed write: the failing caller's own line is not retried behind its back.
+    def failing_write(path, lines):
+        raise OSError("disk full")
+
+    audit._write_lines = failing_write
+    try:
+        await audit.append_audit({"e": 1})
+    except OSError:
+        pass
+    finally:
+        del audit._write_lines
+    await audit.append_audit({"e": 2})
+    seen = [orjson.loads(ln).get("e") for ln in (tmp / "json" / "audit.jsonl").read_bytes().splitlines()]
+    check(1 not in seen and 2 in seen, "a caller told its append failed never has the line land later")
+
     # datetime is natively serializable to orjson; a set is not. The second
     # case must fail LOUDLY rather than silently dropping an audit record.
     await audit.append_audit({"when": datetime.now(timezone.utc)})
@@ -275,6 +332,428 @@ async def test_semantic_index_health(tmp: Path) -> None:
     check("incompatible chroma store" in (h["last_error"] or ""), "the real error text is retained")
 
 
+async def test_semantic_rebuild(tmp: Path) -> None:
+    check.section("Unifier: semantic-index rebuild upserts in batches")
+    from memory import unifier as unifier_mod
+    from memory.unifier import MemoryUnifier
+
+    mem = MemoryUnifier(tmp / "rebuild", enable_chroma=False)
+    await mem.initialize()
+    await asyncio.gather(*(
+        mem._sqlite.add_fact(uuid4(), "user", f"attr{i}", f"value {i}", 0.9) for i in range(450)
+    ))
+    await mem._sqlite.upsert_person(uuid4(), "Leslie", "{}")
+    await mem._sqlite.add_event(uuid4(), "2026-01-01", "new year")
+
+    class Recording:
+        def __init__(self) -> None:
+            self.batches: list[list[str]] = []
+            self.hashes: dict[str, str] = {}
+            self.deleted: list[str] = []
+            self.log: list[str] = []
+
+        async def reset(self) -> None:
+            self.hashes.clear()
+
+        async def doc_hashes(self, kinds) -> dict[str, str]:
+            return dict(self.hashes)
+
+        async def delete_ids(self, ids) -> None:
+            self.deleted.extend(ids)
+            for i in ids:
+                self.hashes.pop(i, None)
+
+        async def embed(self, texts) -> list[list[float]]:
+            self.log.append("embed")
+            return [[float(len(t))] for t in texts]
+
+        async def upsert_many(self, ids, texts, metadatas, *, embeddings=None) -> None:
+            check(len(ids) == len(texts) == len(metadatas), "ids, texts and metadatas line up")
+            if embeddings is not None:
+                check(embeddings == [[float(len(t))] for t in texts], "each doc comes with its own precomputed vector")
+            self.log.append("write")
+            await asyncio.sleep(0.01)
+            self.log.append("written")
+            self.batches.append(list(ids))
+            self.hashes.update((i, m["h"]) for i, m in zip(ids, metadatas))
+
+    mem._chroma = rec = Recording()
+    counts = await mem.rebuild_semantic_index()
+    sizes = [len(b) for b in rec.batches]
+    check(counts["facts"] == 450 and counts["people"] == 1 and counts["events"] == 1, f"every row is counted ({counts})")
+    check(sum(sizes) == 452 and len({i for b in rec.batches for i in b}) == 452, "every row is upserted once")
+    check(max(sizes) <= unifier_mod._INDEX_BATCH and len(sizes) == 3, f"rows go in batches, not one by one ({sizes})")
+    check(rec.log[:4] == ["embed", "write", "embed", "written"],
+          f"the next batch is embedded while the previous one is written ({rec.log[:4]})")
+
+    check.section("Unifier: rebuild re-embeds only changed rows")
+    rec.batches.clear()
+    counts = await mem.rebuild_semantic_index()
+    check(rec.batches == [] and counts["changed"] == 0, f"an unchanged index upserts nothing ({counts})")
+    rec.hashes["ghost-id"] = "stale"
+    some_fact = next(i for i in rec.hashes if i != "ghost-id")
+    rec.hashes[some_fact] = "old"
+    counts = await mem.rebuild_semantic_index()
+    check(rec.batches == [[some_fact]], f"only the edited row is re-upserted ({rec.batches})")
+    check(rec.deleted == ["ghost-id"] and counts["removed"] == 1, "a doc with no SQLite row is deleted")
+    rec.batches.clear()
+    await mem.rebuild_semantic_index(full=True)
+    check(sum(len(b) for b in rec.batches) == 452, "full=True re-embeds everything")
+
+    check.section("Unifier: live writes and the rebuild build identical documents")
+    await mem.add_fact("user", "favorite_food", "ramen", 0.9)
+    await mem.upsert_person("Leslie", {"relation": "sister"})
+    await mem.upsert_person("Leslie", {"birthday": "June 3"})
+    await mem.add_event("2026-03-01", "started pottery class")
+    await mem.flush_index()
+    check(len(rec.hashes) == 454, f"an updated person keeps its one document ({len(rec.hashes)})")
+    rec.batches.clear()
+    counts = await mem.rebuild_semantic_index()
+    check(rec.batches == [] and counts["changed"] == 0 and counts["removed"] == 0,
+          f"nothing written live needs re-embedding ({counts})")
+
+
+async def test_index_write_behind(tmp: Path) -> None:
+    check.section("Unifier: semantic-index writes are queued, not awaited")
+    from memory.unifier import MemoryUnifier
+
+    mem = MemoryUnifier(tmp / "behind", enable_chroma=False)
+    await mem.initialize()
+    gate = asyncio.Event()
+
+    class Slow:
+        def __init__(self) -> None:
+            self.docs: dict[str, str] = {}
+            self.calls = 0
+
+        async def upsert_many(self, ids, texts, metadatas) -> None:
+            await gate.wait()
+            self.calls += 1
+            self.docs.update(zip(ids, texts))
+
+        async def query(self, q, limit=10):
+            return [{"id": i, "text": t, "metadata": {"kind": "fact"}, "distance": 0.1} for i, t in self.docs.items()]
+
+    mem._chroma = slow = Slow()
+    fid = await asyncio.wait_for(mem.add_fact("user", "favorite_tree", "oak", 0.9), timeout=2)
+    await mem.add_event("2026-10-15", "planted the oak")
+    check(slow.docs == {}, "add_fact returns without waiting on the index")
+    gate.set()
+    await mem.search("what tree do I like", limit=5)
+    check(str(fid) in slow.docs, "a search flushes queued writes before it queries")
+    check(slow.calls == 1, f"queued writes go in as one batch ({slow.calls} call(s))")
+    await mem.add_fact("user", "favorite_color", "green", 0.9)
+    await mem.close()
+    check(len(slow.docs) == 3 and not mem._index_pending, "close() flushes the queue")
+    check(mem.semantic_index_health()["writes_ok"] == 3, "queued writes are counted like direct ones")
+
+
+async def test_search_l1(tmp: Path) -> None:
+    check.section("Unifier: repeat searches are served from memory")
+    from memory import unifier as unifier_mod
+    from memory.unifier import MemoryUnifier
+
+    mem = MemoryUnifier(tmp / "l1", enable_chroma=False)
+    await mem.initialize()
+    await mem.add_fact("user", "favorite_tree", "oak", 0.9)
+    first = await mem.search("favorite tree", limit=5)
+    disk_reads = []
+    real_get = mem._diskcache.get
+    mem._diskcache.get = lambda key: disk_reads.append(key) or real_get(key)
+    again = await mem.search("favorite tree", limit=5)
+    check(not disk_reads, "a repeat search never reaches diskcache")
+    check([h.id for h in again] == [h.id for h in first] and again[0] is not first[0],
+          "it returns the same hits, as fresh objects")
+    await mem.add_fact("user", "favorite_color", "green", 0.9)
+    await mem.search("favorite tree", limit=5)
+    check(len(disk_reads) == 1, "a write makes the next search miss")
+    check(all(k.startswith(f"search:{mem._search_gen}:") for k in mem._search_l1),
+          "entries from before the write are dropped")
+
+    spilled = []
+    real_set = mem._diskcache.set
+    mem._diskcache.set = lambda key, value, ttl_s=300: spilled.append(key) or real_set(key, value, ttl_s)
+    for i in range(unifier_mod._SEARCH_L1_MAX + 2):
+        await mem.search(f"favorite tree number{i}", limit=5)
+    mem._diskcache.set = real_set
+    check(len(mem._search_l1) == unifier_mod._SEARCH_L1_MAX, "the in-memory cache is bounded")
+    check(spilled and all(k not in mem._search_l1 for k in spilled),
+          f"only results pushed out of memory are written to diskcache ({len(spilled)})")
+    stored = await mem._diskcache.get(spilled[-1])
+    mem._search_l1.clear()
+    disk_reads.clear()
+    back = await mem.search("favorite tree number1", limit=5)
+    check(disk_reads == [spilled[-1]] and spilled[-1] in mem._search_l1, "a spilled result is found in diskcache")
+    check(isinstance(stored, bytes) and [h.model_dump() for h in back] == orjson.loads(stored),
+          "it is stored as JSON and served back as the same hits")
+
+    turn_reads = []
+    real_recent = mem._sqlite.recent_turns
+    mem._sqlite.recent_turns = lambda **kw: turn_reads.append(kw) or real_recent(**kw)
+    await mem.search("oak", limit=5)
+    check(not turn_reads, "a short query doesn't read recent turns")
+    await mem.search("which tree did I plant", limit=5)
+    check(len(turn_reads) == 1, "a longer query still does")
+    mem._sqlite.recent_turns = real_recent
+
+
+async def test_ingest_turns(tmp: Path) -> None:
+    check.section("Unifier: an exchange is ingested in one commit")
+    from memory.backends import sqlite_backend as sqlite_mod
+    from memory.unifier import MemoryUnifier
+
+    mem = MemoryUnifier(tmp / "ingest", enable_chroma=False)
+    await mem.initialize()
+    conv = uuid4()
+    commits = 0
+    real_write_batch = sqlite_mod._write_batch
+
+    def counting_write_batch(conn, batch):
+        nonlocal commits
+        commits += 1
+        return real_write_batch(conn, batch)
+
+    sqlite_mod._write_batch = counting_write_batch
+    try:
+        ids = await mem.ingest_turns(conv, [("user", "how was the garden today?"), ("assistant", "the tomatoes came in")])
+    finally:
+        sqlite_mod._write_batch = real_write_batch
+    check(commits == 1, f"both turns and their conversation share one commit ({commits})")
+    rows = await mem._sqlite.recent_turns(conv)
+    check([r["id"] for r in reversed(rows)] == [str(i) for i in ids], "the turns keep their order")
+    check(await mem.ingest_turns(conv, []) == [], "an empty exchange writes nothing")
+
+
+async def test_write_locks(tmp: Path) -> None:
+    check.section("Unifier: writes lock per kind of record")
+    from memory.unifier import MemoryUnifier
+
+    mem = MemoryUnifier(tmp / "locks", enable_chroma=False)
+    await mem.initialize()
+    async with mem._write_locks["turn"]:
+        fid = await asyncio.wait_for(mem.add_fact("user", "favorite_color", "teal", 0.9), timeout=2)
+    check(fid is not None, "a fact write doesn't wait on a held turn lock")
+    await asyncio.gather(
+        mem.upsert_person("Robin", {"relation": "friend"}),
+        mem.upsert_person("Robin", {"birthday": "May 2"}),
+    )
+    person = await mem._sqlite.get_person_by_name("Robin")
+    attrs = orjson.loads(person["attributes_json"])
+    check(attrs == {"relation": "friend", "birthday": "May 2"}, f"concurrent updates to one person both survive ({attrs})")
+
+
+async def test_fact_rows(tmp: Path) -> None:
+    check.section("Unifier: fact rows become FactRecords without re-validation")
+    from memory.schemas import FactRecord
+    from memory.unifier import MemoryUnifier
+
+    mem = MemoryUnifier(tmp / "factrows", enable_chroma=False)
+    await mem.initialize()
+    fid = await mem.add_fact("user", "home_city", "Porto", 0.8)
+    got = (await mem.get_facts("user", "home_city"))[0]
+    check(got == FactRecord.model_validate(got.model_dump()), "the record matches what validation would build")
+    check(got.id == fid and isinstance(got.confidence, float), "id and confidence keep their types")
+    check(got.created_at.tzinfo is not None, "created_at is an aware datetime")
+    row = {"id": str(fid), "entity": "user", "attribute": "a", "value": "v", "created_at": "2026-01-01T00:00:00Z"}
+    check(mem._fact_from_row(row).created_at == datetime(2026, 1, 1, tzinfo=timezone.utc), "a trailing Z parses as UTC")
+
+
+async def test_sqlite_connection(tmp: Path) -> None:
+    check.section("SQLiteMemoryBackend: one long-lived connection")
+    sqlite = SQLiteMemoryBackend(tmp / "conn" / "nova.sqlite3")
+    conv = uuid4()
+    await sqlite.add_turn(uuid4(), conv, "user", "hello there")
+    first = sqlite._db
+    rows = await sqlite.recent_turns(conv)
+    check(sqlite._db is first and first is not None, "later calls reuse the same connection")
+    check(rows and rows[0]["content"] == "hello there", "reads see earlier writes")
+    check(type(rows[0]) is dict and list(rows[0]) == ["id", "conversation_id", "role", "content", "created_at"],
+          "rows come back as plain dicts keyed by the selected columns, in order")
+    counts = await sqlite.count_records()
+    check(isinstance(counts, dict), "a tuple-indexing method works on the same pool")
+
+    # A per-call connection discarded uncommitted work when it closed; the
+    # shared one must too, or the next method's commit would persist it.
+    try:
+        async with sqlite._connect() as db:
+            await db.execute("INSERT INTO conversations(id, created_at) VALUES('half-done', 'x')")
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+    await sqlite.ensure_conversation(uuid4())  # commits
+    async with aiosqlite.connect(sqlite._db_path) as other:
+        async with other.execute("SELECT COUNT(*) FROM conversations WHERE id='half-done'") as cur:
+            leaked = (await cur.fetchone())[0]
+    check(leaked == 0, "an abandoned write is rolled back, not committed by the next caller")
+
+    check.section("SQLiteMemoryBackend: read-only connection pool")
+    check(0 < sqlite._reader_count <= sqlite._max_readers, f"reads opened {sqlite._reader_count} reader(s)")
+    async with sqlite._read() as db:
+        check(db is not sqlite._db, "a SELECT-only method reads on its own connection, not the writer's")
+        try:
+            await db.execute("INSERT INTO conversations(id, created_at) VALUES('via-reader', 'x')")
+            wrote = True
+        except aiosqlite.OperationalError:
+            wrote = False
+        check(not wrote, "readers are query_only")
+        async with db.execute("PRAGMA temp_store;") as cur:
+            check((await cur.fetchone())[0] == 2, "readers get the tuning pragmas (temp_store=MEMORY)")
+    async with sqlite._connect() as db:
+        async with db.execute("PRAGMA cache_size;") as cur:
+            check((await cur.fetchone())[0] == -64 * 1024, "the writer gets them too (64 MB page cache)")
+    await asyncio.gather(*(sqlite.recent_turns(conv) for _ in range(12)))
+    check(sqlite._reader_count <= sqlite._max_readers, "concurrent reads never open more than the pool size")
+    await sqlite.add_turn(uuid4(), conv, "assistant", "general kenobi")
+    check(len(await sqlite.recent_turns(conv)) == 2, "a pooled reader sees the writer's latest commit")
+
+    check.section("SQLiteMemoryBackend: batched turn writes")
+    from memory.backends import sqlite_backend as sqlite_mod
+
+    # Each _write_batch call is one transaction and one commit.
+    commits = 0
+    real_write_batch = sqlite_mod._write_batch
+
+    def counting_write_batch(conn, batch):
+        nonlocal commits
+        commits += 1
+        return real_write_batch(conn, batch)
+
+    sqlite_mod._write_batch = counting_write_batch
+    conv2 = uuid4()
+    try:
+        await sqlite.add_turns([(uuid4(), conv2, "user" if i % 2 == 0 else "assistant", f"line {i}", None)
+                                for i in range(5)])
+    finally:
+        sqlite_mod._write_batch = real_write_batch
+    check(commits == 1, f"five turns and their conversation land in one commit ({commits})")
+    check(len(await sqlite.recent_turns(conv2)) == 5, "every batched turn is readable")
+    await sqlite.add_turns([])
+    check(len(await sqlite.recent_turns(conv)) == 2, "an empty batch writes nothing")
+
+    check.section("SQLiteMemoryBackend: concurrent writes share a commit")
+    dup = uuid4()
+    await sqlite.add_fact(dup, "user", "pet", "Biscuit", 0.9)
+    commits = 0
+    sqlite_mod._write_batch = counting_write_batch
+    try:
+        results = await asyncio.gather(
+            *(sqlite.add_fact(uuid4(), "user", f"likes_{i}", f"thing {i}", 0.8) for i in range(6)),
+            sqlite.add_fact(dup, "user", "pet", "Biscuit again", 0.9),  # primary-key clash
+            sqlite.add_event(uuid4(), "2026-10-15", "first frost"),
+            return_exceptions=True,
+        )
+    finally:
+        sqlite_mod._write_batch = real_write_batch
+    check(commits < len(results), f"{len(results)} concurrent writes took {commits} commit(s)")
+    check(isinstance(results[6], aiosqlite.IntegrityError), "the clashing write gets its own error")
+    check(all(r is None for i, r in enumerate(results) if i != 6), "the other writes in its batch still succeed")
+    fact_ids = await sqlite.find_fact_ids(entity="user", attribute="likes_3", value_in=["thing 3"])
+    check(len(fact_ids) == 1, "a batched fact is committed")
+    hits = await sqlite.find_fact_ids(entity="user", attribute="pet", value_in=["BISCUIT", "Rex", "Mittens"])
+    check(len(hits) == 1, "value_in matches case-insensitively, and its NULL padding matches nothing")
+    many = [f"other pet {i}" for i in range(2000)] + ["biscuit"]
+    hits = await sqlite.find_fact_ids(entity="user", attribute="pet", value_in=many)
+    check(len(hits) == 1, f"a {len(many)}-value lookup works past the bound-parameter limit")
+    check(not sqlite._pending_writes, "nothing is left queued")
+
+    # A batch that fails as a whole fails every caller in it, and none of
+    # those writes are retried behind their callers' backs.
+    def failing_once(conn, batch):
+        sqlite_mod._write_batch = real_write_batch
+        check(len(batch) == 2, f"the two queued writes share the failing batch ({len(batch)})")
+        raise sqlite3.OperationalError("database is locked")
+
+    def slow_then_fail(conn, batch):
+        # Holds the writer while the next two writes queue up as one batch.
+        time.sleep(0.05)
+        sqlite_mod._write_batch = failing_once
+        return real_write_batch(conn, batch)
+
+    sqlite_mod._write_batch = slow_then_fail
+    try:
+        failed = await asyncio.gather(
+            sqlite.add_event(uuid4(), "2026-10-16", "blocker"),
+            sqlite.add_event(uuid4(), "2026-10-16", "lost write"),
+            sqlite.add_event(uuid4(), "2026-10-16", "lost write too"),
+            return_exceptions=True,
+        )
+    finally:
+        sqlite_mod._write_batch = real_write_batch
+    check(failed[0] is None and all(isinstance(r, sqlite3.OperationalError) for r in failed[1:]),
+          f"every caller in the failed batch sees the error ({failed})")
+    await sqlite.add_event(uuid4(), "2026-10-16", "next write")
+    notes = {r["note"] for r in await sqlite.all_events(limit=None)}
+    check("next write" in notes and not notes & {"lost write", "lost write too"},
+          "a write its caller was told failed never lands later")
+
+    # A caller cancelled while queued behind the writer takes its write with it.
+    async with sqlite._db_lock:
+        abandoned = asyncio.create_task(sqlite.add_event(uuid4(), "2026-10-16", "abandoned write"))
+        await asyncio.sleep(0)
+        check(len(sqlite._pending_writes) == 1, "the waiting write is queued")
+        abandoned.cancel()
+        await asyncio.gather(abandoned, return_exceptions=True)
+        check(not sqlite._pending_writes, "cancelling its caller takes it back out of the queue")
+    await sqlite.add_event(uuid4(), "2026-10-16", "after the abandoned write")
+    notes = {r["note"] for r in await sqlite.all_events(limit=None)}
+    check("after the abandoned write" in notes and "abandoned write" not in notes,
+          "the next writer does not commit a cancelled caller's rows")
+
+    check.section("SQLiteMemoryBackend: a task is claimed once across connections")
+    # Each backend has its own writer, so only SQLite's lock keeps two of them
+    # from claiming the same queued task.
+    others = [SQLiteMemoryBackend(sqlite._db_path) for _ in range(5)]
+    for _ in range(30):
+        await sqlite.enqueue_autonomy_task(task_id=uuid4(), project_name="p", title="t", details="d",
+                                           priority=1, initiated_by_user=False)
+
+    async def drain(be: SQLiteMemoryBackend) -> list[str]:
+        got = []
+        while (task := await be.claim_next_autonomy_task()) is not None:
+            got.append(task["task_id"])
+        return got
+
+    claimed = [t for got in await asyncio.gather(*(drain(be) for be in [sqlite, *others])) for t in got]
+    check(len(claimed) == len(set(claimed)) == 30, f"30 tasks, 6 claimers: {len(claimed)} claims of {len(set(claimed))} tasks")
+    for be in others:
+        await be.close()
+
+    check.section("SQLiteMemoryBackend: large deletes are chunked")
+    keep = await sqlite.find_fact_ids(entity="user", attribute="pet", value_in=["Biscuit"])
+    doomed = [str(uuid4()) for _ in range(3 * sqlite_mod._MAX_BOUND_IDS)] + keep
+    deleted = await sqlite.delete_facts_by_ids(doomed)
+    check(deleted == len(keep) == 1, f"a {len(doomed)}-id purge deletes exactly the facts that exist ({deleted})")
+
+    check.section("SQLiteMemoryBackend: whole-table reads stream in batches")
+    before = len(await sqlite.all_events(limit=None))
+    await asyncio.gather(*(sqlite.add_event(uuid4(), f"2026-01-{i % 28 + 1:02d}", f"note {i}")
+                           for i in range(sqlite_mod._FETCH_BATCH + 10)))
+    streamed = [row async for row in sqlite.iter_events()]
+    listed = await sqlite.all_events()
+    check(len(streamed) == before + sqlite_mod._FETCH_BATCH + 10, f"the iterator crosses batch boundaries ({len(streamed)} rows)")
+    check(streamed == listed, "iter_events and all_events return the same rows in the same order")
+    check(len(await sqlite.all_events(limit=5)) == 5, "limit still applies")
+
+    check.section("SQLiteMemoryBackend: several search terms in one statement")
+    await sqlite.upsert_person(uuid4(), "Pepper Biscuit", "{}")
+    for i in range(4):
+        await sqlite.add_fact(uuid4(), "pet", f"toy{i}", f"Biscuit's ball {i}", 0.8)
+    terms = ["Biscuit", "pe", "note 1"]  # "pe" is too short for FTS: a LIKE arm
+    for name in ("facts", "people", "events"):
+        single = getattr(sqlite, f"search_{name}")
+        per_term = [r for t in terms for r in await single(t, limit=3)]
+        combined = await getattr(sqlite, f"search_{name}_any")(terms, limit=3)
+        check(combined == per_term, f"search_{name}_any matches search_{name} term by term ({len(combined)} rows)")
+    check(await sqlite.search_facts_any([]) == [], "no terms, no rows")
+
+    await sqlite.close()
+    check(sqlite._db is None, "close() releases the connection")
+    check(sqlite._reader_count == 0 and sqlite._idle_readers.empty(), "close() releases the readers too")
+    await sqlite.close()
+    check(len(await sqlite.recent_turns(conv)) == 2, "the backend reopens transparently after close")
+    await sqlite.close()
+
+
 async def main() -> None:
     with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as td:
         tmp = Path(td)
@@ -283,6 +762,13 @@ async def main() -> None:
         await test_world_model(tmp)
         await test_schemas()
         await test_semantic_index_health(tmp)
+        await test_semantic_rebuild(tmp)
+        await test_ingest_turns(tmp)
+        await test_fact_rows(tmp)
+        await test_write_locks(tmp)
+        await test_search_l1(tmp)
+        await test_index_write_behind(tmp)
+        await test_sqlite_connection(tmp)
     check.finish()
 
 
@@ -62,6 +62,33 @@ async def main():
                 count = (await cur.fetchone())[0]
         check(count == 2, f"already-applied migration not replayed (stamps={count})")
 
+        # v7: a v6 database already holding rows gets its search index built.
+        from uuid import uuid4
+
+        old_path = Path(td) / "v6.sqlite3"
+        be5 = SQLiteMemoryBackend(old_path)
+        await be5.add_fact(uuid4(), "user", "favorite_food", "spicy ramen", 0.9)
+        await be5.close()
+        async with aiosqlite.connect(old_path) as db:
+            for table in ("facts", "people", "events"):
+                for suffix in ("ai", "ad", "au"):
+                    await db.execute(f"DROP TRIGGER {table}_fts_{suffix}")
+                await db.execute(f"DROP TABLE {table}_fts")
+            await db.execute("CREATE INDEX idx_facts_entity_attr ON facts(entity, attribute)")  # the v6 index
+            await db.execute("UPDATE schema_version SET version=6")
+            await db.commit()
+        be6 = SQLiteMemoryBackend(old_path)
+        check(await be6.schema_version() == latest, f"a v6 database is migrated to v{latest}")
+        hits = await be6.search_facts("ramen")
+        check([h["value"] for h in hits] == ["spicy ramen"], "rows written before v7 are found through the new index")
+        async with aiosqlite.connect(old_path) as db:
+            async with db.execute("SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='facts'") as cur:
+                indexes = {r[0] for r in await cur.fetchall()}
+        check({"idx_facts_ea_created", "idx_facts_created"} <= indexes and "idx_facts_entity_attr" not in indexes,
+              f"v8 swaps in the created_at fact indexes ({sorted(indexes)})")
+        check("idx_facts_ea_lvalue" in indexes, "v9 adds the LOWER(value) expression index")
+        await be6.close()
+
     print("\nRESULT:", "FAILURES" if _fail else "ALL PASS")
     sys.exit(1 if _fail else 0)
 
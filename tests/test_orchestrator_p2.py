@@ -158,6 +158,9 @@ async def _async_checks():
     p2 = llm2.prompts[0]
     check("- weather.current: live weather" in p2 and "- web.fetch: fetch a url" not in p2,
           "allowlist filters the tool catalog")
+    for i in range(5):
+        ex2.tool_catalog(Agent(name="chat-deep", extra_instructions=f"plan {i}"))
+    check(len(ex2._catalogs) == 2, "per-turn agents share one cached catalog per tool filter")
 
     # ── deep mode (2.3) ──
     from core.orchestrator.deep_mode import DeepPipeline, is_deep_request
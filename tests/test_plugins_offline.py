@@ -24,6 +24,9 @@ import httpx
 
 import plugins.web_search as ws
 import plugins.discord as dc
+import plugins.google_maps as gm
+import plugins.weather as wx
+from plugins import _cache, _http
 from plugins.system_tools import system_time
 from plugins.registry import PluginConfigError
 
@@ -217,8 +220,10 @@ async def test_discord_read_mocked() -> None:
         calls["auth"] = request.headers.get("authorization", "")
         return httpx.Response(200, json=payload)
 
+    real_shared = _http.client
+    mock = _REAL_ASYNC_CLIENT(transport=httpx.MockTransport(handler))
     try:
-        dc.httpx.AsyncClient = fake_client(handler)
+        _http.client = lambda: mock
         out = await dc.read_messages({"limit": 2})
         check(isinstance(out, dict), "discord.read returns a dict")
         check("12345" in calls["url"], "it reads the configured channel")
@@ -226,6 +231,62 @@ async def test_discord_read_mocked() -> None:
         body = str(out)
         check("second" in body and "first" in body, f"message contents are returned ({body[:90]!r})")
     finally:
+        _http.client = real_shared
+        await mock.aclose()
+        for k, v in saved.items():
+            if v is None:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = v
+
+
+async def test_shared_client() -> None:
+    check.section("plugins/_http.py: one keep-alive client per loop")
+    httpx.AsyncClient = _REAL_ASYNC_CLIENT  # the web tests leave it patched
+    c = _http.client()
+    check(_http.client() is c, "repeat calls reuse the same client")
+    await _http.aclose()
+    check(c.is_closed, "aclose() closes it")
+    check(_http.client() is not c, "the next call after aclose() opens a fresh client")
+    await _http.aclose()
+
+
+async def test_api_response_cache() -> None:
+    check.section("geocode/weather responses are cached by normalized input")
+    saved = {k: os.environ.get(k) for k in ("GOOGLE_MAPS_API_KEY", "OPENWEATHER_API_KEY")}
+    os.environ["GOOGLE_MAPS_API_KEY"] = "fake-key"
+    os.environ["OPENWEATHER_API_KEY"] = "fake-key"
+    hits: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        hits.append(request.url.path)
+        if "geocode" in request.url.path:
+            return httpx.Response(200, json={"status": "OK", "results": [{
+                "formatted_address": "1 Main St", "place_id": "p1",
+                "geometry": {"location": {"lat": 1.0, "lng": 2.0}}}]})
+        return httpx.Response(200, json={"name": "Austin", "main": {"temp": 71},
+                                         "weather": [{"description": "clear"}]})
+
+    real_shared = _http.client
+    mock = _REAL_ASYNC_CLIENT(transport=httpx.MockTransport(handler))
+    _cache.clear()
+    try:
+        _http.client = lambda: mock
+        first = await gm.geocode({"address": "1 Main St"})
+        first["location"]["lat"] = 99.0  # a caller editing its result
+        again = await gm.geocode({"address": "  1 main   st "})
+        check(len(hits) == 1, f"a repeat geocode is served from the cache ({len(hits)} request(s))")
+        check(again["location"]["lat"] == 1.0, "a caller's edits don't leak into the cached copy")
+
+        await wx.current_weather({"city": "Austin"})
+        await wx.current_weather({"city": "austin"})
+        check(len(hits) == 2, "a repeat weather lookup is served from the cache")
+        await wx.current_weather({"city": "Austin", "units": "metric"})
+        check(len(hits) == 3, "different units are a different entry")
+    finally:
+        _http.client = real_shared
+        await mock.aclose()
+        _cache.clear()
         for k, v in saved.items():
             if v is None:
                 os.environ.pop(k, None)
@@ -239,6 +300,8 @@ async def main() -> None:
     await test_system_time()
     await test_discord_config_guard()
     await test_discord_read_mocked()
+    await test_shared_client()
+    await test_api_response_cache()
     check.finish()
 
 
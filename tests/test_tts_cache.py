@@ -0,0 +1,91 @@
+"""backend/tts_cache.py: the content-addressed TTS clip cache.
+
+Two failure modes matter here and both are silent from the caller's side: a
+cache that never hits (every sentence re-synthesized for seconds of CPU), and
+a cache that never forgets (the old per-synthesis dict grew for the life of
+the process). The key is also a public URL segment, so it must never be able
+to name a path outside the cache dir.
+"""
+from __future__ import annotations
+
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from harness import Checks
+
+from backend.tts_cache import TTSCache, clip_key, is_clip_key
+
+check = Checks()
+
+
+def _key(text: str, voice: str = "v", speed: float = 1.0, *, model: str = "xtts_v2", sample_rate: int = 24000) -> str:
+    return clip_key(text, voice, speed, model=model, sample_rate=sample_rate)
+
+
+def test_keys() -> None:
+    check.section("clip_key")
+    a = _key("Sure, on it.", "nova.wav::1700000000000000000::48000")
+    check(a == _key("Sure, on it.", "nova.wav::1700000000000000000::48000"), "same voice+pace+text -> same key")
+    check(a != _key("Sure, on it.", "other.wav::1700000000000000000::48000"), "voice is part of the key")
+    check(a != _key("Sure, on it.", "nova.wav::1700000000000000001::48000"),
+          "a re-recorded voice sample under the same name gets a new key")
+    check(a != _key("Sure, on it.", "nova.wav::1700000000000000000::48000", 0.92), "mood pacing is part of the key")
+    check(a != _key("Sure, on it.", "nova.wav::1700000000000000000::48000", model="other_tts"),
+          "the TTS model is part of the key")
+    check(a != _key("Sure, on it.", "nova.wav::1700000000000000000::48000", sample_rate=22050),
+          "the output sample rate is part of the key")
+    check(is_clip_key(a), "generated keys validate")
+    for bad in ("", "../../etc/passwd", "A" * 32, a + "0", "nova.wav"):
+        check(not is_clip_key(bad), f"rejects non-key audio id {bad[:20]!r}")
+
+
+def test_ram_lru() -> None:
+    check.section("RAM tier — bounded by bytes, LRU order")
+    cache = TTSCache(max_bytes=30)
+    cache.store("a" * 32, b"x" * 10)
+    cache.store("b" * 32, b"x" * 10)
+    cache.store("c" * 32, b"x" * 10)
+    check(cache.lookup("a" * 32) is not None, "entries within budget are kept")
+    cache.store("d" * 32, b"x" * 10)
+    check(cache.lookup("b" * 32) is None, "least-recently-used entry evicted on overflow")
+    check(cache.lookup("a" * 32) is not None, "a looked-up entry was refreshed and survives")
+    check(cache.stats()["bytes"] <= 30, "resident bytes never exceed the budget")
+    cache.store("e" * 32, b"x" * 31)
+    check(cache.lookup("e" * 32) is None, "a clip larger than the whole budget is not held in RAM")
+
+
+def test_disk_tier(tmp: Path) -> None:
+    check.section("Disk tier — survives RAM eviction and restarts")
+    cache = TTSCache(max_bytes=10, disk_dir=tmp / "c", disk_max_bytes=1000)
+    k1, k2 = _key("one"), _key("two")
+    cache.store(k1, b"1" * 10)
+    cache.store(k2, b"2" * 10)
+    check(cache.lookup(k1) is None, "k1 evicted from RAM")
+    check(cache.load(k1) == b"1" * 10, "evicted clip is reloaded from disk")
+    check(cache.lookup(k1) == b"1" * 10, "disk hit is promoted back into RAM")
+    fresh = TTSCache(max_bytes=10, disk_dir=tmp / "c", disk_max_bytes=1000)
+    check(fresh.load(k2) == b"2" * 10, "a new process instance reads the existing store")
+    check(fresh.load("../" + k2) is None, "a traversal-shaped id never reaches the filesystem")
+
+    check.section("Disk tier — bounded")
+    small = TTSCache(max_bytes=0, disk_dir=tmp / "s", disk_max_bytes=25)
+    for i in range(5):
+        small.store(_key(str(i)), b"z" * 10)
+    total = sum(p.stat().st_size for p in (tmp / "s").glob("*.wav"))
+    check(total <= 25, f"disk store pruned to its budget (got {total} bytes)")
+
+
+def main() -> None:
+    test_keys()
+    test_ram_lru()
+    with tempfile.TemporaryDirectory() as td:
+        test_disk_tier(Path(td))
+    check.finish()
+
+
+if __name__ == "__main__":
+    main()
@@ -149,13 +149,15 @@ async def test_memory_ingest(tmp: Path) -> None:
                             assistant_reply="sounds fun", follow_up_question=None, mode="chat")
     worker.start()
     await sq.put(SummarizeHintEvent(conversation_id=conv, timestamp=_now(), reason="test"))
+    # The digest is written after the summary, so wait for it: polling on the
+    # summary alone raced the second write.
+    day = _now().strftime("%Y-%m-%d")
     for _ in range(40):
-        if await mem.get_latest_fact(entity=f"conversation:{conv}", attribute="summary"):
+        if await mem.get_latest_fact(entity=f"conversation:{conv}:digest", attribute=day):
             break
         await asyncio.sleep(0.25)
     summary = await mem.get_latest_fact(entity=f"conversation:{conv}", attribute="summary")
     check(summary is not None and "fort" in summary.value, f"a rolling summary is written ({summary})")
-    day = _now().strftime("%Y-%m-%d")
     digest = await mem.get_latest_fact(entity=f"conversation:{conv}:digest", attribute=day)
     check(digest is not None and day in digest.value,
           "a DATED digest is also written so history is not overwritten")